@@ -1,14 +1,33 @@
-from fastapi import FastAPI
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from email.utils import format_datetime
+import numpy as np
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 
 # Import core funkcionalnosti (prilagodi putanju ako treba)
-from astronomical_watch.core.timeframe import astronomical_time
+from astronomical_watch.core.timeframe import DAY, MILIDIES, astronomical_time_many, current_year_frame
+from astronomical_watch.core.equinox import cached_vernal_equinox, warm_equinox_cache
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Zagrej memo ekvinocija (prethodna, tekuća i sledeća godina) da /api/time ne pokreće solver
+    year = datetime.now(timezone.utc).year
+    warm_equinox_cache(range(year - 1, year + 3))
+    yield
+    await tick_hub.close()
 
 app = FastAPI(
     title="Astronomical Watch Backend",
     description="API for providing astronomical time for the web widget/banner.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # --- CORS omogućava frontend (widget) da pristupa API-ju sa bilo kog domena ---
@@ -20,30 +39,274 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- /api/time: telo odgovora se serijalizuje jednom po milidiesu ---
+# Za tekući milidies čuvamo (start, end, origin, etag, prefix); po zahtevu se dopisuje samo "progress".
+# ETag je slab (W/) jer se progress menja unutar milidiesa, a Cache-Control/Expires ističu na
+# granici milidiesa, pa keševi (CDN, browser) mogu da preuzmu skoro sve upite widgeta.
+_time_snapshot = None
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def _unix_ms(dt: datetime) -> int:
+    return (dt - _EPOCH) // timedelta(milliseconds=1)
+
+def _time_snapshot_for(now: datetime):
+    global _time_snapshot
+    snapshot = _time_snapshot
+    if snapshot is None or not (snapshot[0] <= now < snapshot[1]):
+        frame = current_year_frame(now)
+        dies, milidies = frame.reading(now)
+        start, end = frame.milidies_span(now)
+        origin = now - (now - frame.day0) % MILIDIES  # početak milidiesa i kad je span presečen ekvinocijem
+        etag = f'W/"{frame.equinox.year}-{dies}-{milidies}"'
+        prefix = f'{{"dies":{dies},"milidies":{milidies},"milidies_end":{_unix_ms(end)},"progress":'.encode()
+        snapshot = (start, end, origin, etag, prefix)
+        _time_snapshot = snapshot
+    return snapshot
+
+def _time_body(now: datetime, snapshot=None) -> bytes:
+    """JSON telo za trenutak now; progress (0-99) su stotinke proteklog milidiesa."""
+    start, end, origin, etag, prefix = snapshot or _time_snapshot_for(now)
+    return prefix + b"%d}" % ((now - origin) * 100 // MILIDIES)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Slabo poređenje (RFC 9110): W/ prefiks se ignoriše
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in candidates)
+
 @app.get("/api/time")
-def get_time():
+def get_time(request: Request):
     """
     Vraća trenutno astronomsko vreme: dies, milidies i progres unutar milidiesa.
+
+    milidies_end (Unix ms) je kraj tekućeg milidiesa; klijent iz njega može sam da računa
+    progres dok koristi keširan odgovor.
     """
     now = datetime.now(timezone.utc)
-    dies, milidies = astronomical_time(now)
+    start, end, origin, etag, prefix = _time_snapshot_for(now)
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={int((end - now).total_seconds())}",
+        "Expires": format_datetime(end, usegmt=True),
+    }
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=_time_body(now), media_type="application/json", headers=headers)
+
+# --- Push stream (SSE /api/time/stream, WebSocket /api/time/ws) umesto pollinga na 5 s ---
+# Jedan scheduler računa tick (promenu milidies ili progress, tj. svakih 0.864 s) jednom i
+# deli ga svim pretplatnicima. Svaki pretplatnik ima mali red: spor klijent gubi najstarije
+# tickove (bitan je samo najnoviji), a klijent koji ništa ne preuzme STREAM_IDLE_TIMEOUT
+# sekundi se odbacuje.
+TICK_QUEUE_SIZE = 4
+STREAM_IDLE_TIMEOUT = float(os.environ.get("ASTRON_STREAM_IDLE_TIMEOUT", "30"))
+STREAM_RETRY_MS = 5000
+
+class _Subscriber:
+    __slots__ = ("queue", "last_taken", "dropped")
+
+    def __init__(self):
+        self.queue = asyncio.Queue(maxsize=TICK_QUEUE_SIZE)
+        self.last_taken = time.monotonic()
+        self.dropped = 0
+
+    async def next_tick(self):
+        """Sledeći tick kao (JSON tekst, SSE okvir), ili None kad je pretplata prekinuta."""
+        tick = await self.queue.get()
+        self.last_taken = time.monotonic()
+        return tick
+
+class TickHub:
+    """Raspoređuje tickove pretplatnicima; scheduler radi samo dok postoji bar jedan."""
+
+    def __init__(self):
+        self.subscribers: set[_Subscriber] = set()
+        self.ticks_computed = 0
+        self._task = None
+
+    def subscribe(self) -> _Subscriber:
+        subscriber = _Subscriber()
+        self.subscribers.add(subscriber)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return subscriber
+
+    def unsubscribe(self, subscriber: _Subscriber) -> None:
+        self.subscribers.discard(subscriber)
+
+    @staticmethod
+    def _offer(subscriber: _Subscriber, tick) -> None:
+        if subscriber.queue.full():
+            subscriber.queue.get_nowait()  # backpressure: najstariji tick ustupa mesto
+            subscriber.dropped += 1
+        subscriber.queue.put_nowait(tick)
+
+    def _cull(self, subscriber: _Subscriber) -> None:
+        self.unsubscribe(subscriber)
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
+
+    def publish(self, now: datetime, snapshot=None) -> None:
+        body = _time_body(now, snapshot)
+        tick = (body.decode(), b"data: " + body + b"\n\n")
+        self.ticks_computed += 1
+        idle_before = time.monotonic() - STREAM_IDLE_TIMEOUT
+        for subscriber in list(self.subscribers):
+            if subscriber.last_taken < idle_before:
+                self._cull(subscriber)
+            else:
+                self._offer(subscriber, tick)
 
-    # Koliko je prošlo kroz trenutni milidies (progres 0-100)
-    seconds_in_day = 24 * 60 * 60
-    seconds_now = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
-    milidies_in_day = 1000
-    milidies_float = seconds_now / seconds_in_day * milidies_in_day
-    progress = int((milidies_float - int(milidies_float)) * 100)  # 0-99, stotinki milidiesa
+    async def _run(self) -> None:
+        while self.subscribers:
+            now = datetime.now(timezone.utc)
+            snapshot = _time_snapshot
+            if snapshot is None or not (snapshot[0] <= now < snapshot[1]):
+                # Novi snapshot na granici ekvinocija može da pokrene solver (ili udaljeni upit),
+                # pa se gradi u thread pool-u da ne blokira event loop i ostale klijente
+                snapshot = await run_in_threadpool(_time_snapshot_for, now)
+            self.publish(now, snapshot)
+            # Spavaj do sledeće promene progress-a (stotinka milidiesa) ili kraja milidiesa
+            start, end, origin, etag, prefix = snapshot
+            step = MILIDIES / 100
+            next_tick = min(origin + ((now - origin) // step + 1) * step, end)
+            await asyncio.sleep((next_tick - now).total_seconds() + 0.001)
 
+    async def close(self) -> None:
+        for subscriber in list(self.subscribers):
+            self._cull(subscriber)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+tick_hub = TickHub()
+
+@app.get("/api/time/stream")
+async def stream_time():
+    """
+    Server-Sent Events: jedan događaj (isti JSON kao /api/time) pri svakoj promeni milidies/progress.
+    """
+    subscriber = tick_hub.subscribe()
+
+    async def events():
+        try:
+            yield b"retry: %d\n\n" % STREAM_RETRY_MS
+            while (tick := await subscriber.next_tick()) is not None:
+                yield tick[1]
+        finally:
+            tick_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.websocket("/api/time/ws")
+async def time_websocket(websocket: WebSocket):
+    """WebSocket varijanta streama: svaka poruka je JSON kao iz /api/time."""
+    await websocket.accept()
+    subscriber = tick_hub.subscribe()
+    try:
+        while (tick := await subscriber.next_tick()) is not None:
+            await websocket.send_text(tick[0])
+        await websocket.close()  # odbačen kao neaktivan
+    except WebSocketDisconnect:
+        pass
+    finally:
+        tick_hub.unsubscribe(subscriber)
+
+# --- /api/time/batch: konverzija mnogo trenutaka u jednom zahtevu ---
+# Telo: {"timestamps": [...]} gde je svaki element ISO 8601 string sa zonom ili Unix sekunde
+# (broj). Ograničenja (413 kad se prekorače) se podešavaju preko okruženja.
+BATCH_MAX_ITEMS = int(os.environ.get("ASTRON_BATCH_MAX_ITEMS", "10000"))
+BATCH_MAX_BYTES = int(os.environ.get("ASTRON_BATCH_MAX_BYTES", str(1024 * 1024)))
+_EPOCH_SECONDS_MIN = (datetime.min.replace(tzinfo=timezone.utc) - _EPOCH).total_seconds()
+_EPOCH_SECONDS_MAX = (datetime.max.replace(tzinfo=timezone.utc) - _EPOCH).total_seconds()
+_EPOCH_US_MAX = (datetime.max.replace(tzinfo=timezone.utc) - _EPOCH) // timedelta(microseconds=1)
+
+def _timestamp_us(value, index: int) -> int:
+    """Jedan element zahteva kao mikrosekunde od Unix epohe."""
+    if isinstance(value, str):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            raise HTTPException(422, f"timestamps[{index}]: invalid ISO 8601 string")
+        if dt.tzinfo is None:
+            raise HTTPException(422, f"timestamps[{index}]: timezone offset required")
+        return (dt - _EPOCH) // timedelta(microseconds=1)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if not (_EPOCH_SECONDS_MIN <= value <= _EPOCH_SECONDS_MAX):  # odbacuje i NaN
+            raise HTTPException(422, f"timestamps[{index}]: outside years 1-9999")
+        return round(value * 1_000_000)
+    raise HTTPException(422, f"timestamps[{index}]: expected ISO string or epoch seconds")
+
+def _convert_batch(timestamps: list) -> dict:
+    stamps = np.array([_timestamp_us(v, i) for i, v in enumerate(timestamps)], dtype=np.int64)
+    # Pre ekvinocija godine 1 dies bi se brojao od ekvinocija godine 0, koji datetime ne može da prikaže
+    first_equinox_us = (cached_vernal_equinox(1) - _EPOCH) // timedelta(microseconds=1)
+    outside = np.flatnonzero((stamps < first_equinox_us) | (stamps > _EPOCH_US_MAX))
+    if outside.size:
+        raise HTTPException(422, f"timestamps[{outside[0]}]: outside the year-1 vernal equinox to 9999-12-31 UTC")
+    # Ekvinocij se rešava jednom po tropskoj godini, ostalo je vektorizovano
+    dies, milidies, fraction = astronomical_time_many(stamps.astype("datetime64[us]"), with_fraction=True)
+    return {"results": [
+        {"dies": d, "milidies": m, "fraction": f}
+        for d, m, f in zip(dies.tolist(), milidies.tolist(), fraction.tolist())
+    ]}
+
+@app.post("/api/time/batch")
+async def time_batch(request: Request):
+    """
+    Vraća dies, milidies i proteklu frakciju milidiesa (0-1) za svaki trenutak, istim redom.
+    """
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > BATCH_MAX_BYTES:
+        raise HTTPException(413, f"Request body exceeds {BATCH_MAX_BYTES} bytes")
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > BATCH_MAX_BYTES:
+            raise HTTPException(413, f"Request body exceeds {BATCH_MAX_BYTES} bytes")
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(422, "Request body must be JSON")
+    timestamps = payload.get("timestamps") if isinstance(payload, dict) else None
+    if not isinstance(timestamps, list):
+        raise HTTPException(422, 'Expected {"timestamps": [...]}')
+    if len(timestamps) > BATCH_MAX_ITEMS:
+        raise HTTPException(413, f"At most {BATCH_MAX_ITEMS} timestamps per request")
+
+    return await run_in_threadpool(_convert_batch, timestamps)
+
+# --- /api/frame: granice tropske godine, da klijent sam računa dies/milidies/progress ---
+# Sve vrednosti su Unix ms. Klijent: t < day0 → dies 0, inače dies = (t - day0) // DAY + 1;
+# milidies = ((t - day0) mod DAY) // MILIDIES; progress = stotinke tog milidiesa. Okvir važi
+# do valid_until (sledeći ekvinocij), posle čega klijent ponovo preuzima okvir.
+@app.get("/api/frame")
+def get_frame(response: Response):
+    """
+    Vraća okvir tekuće tropske godine i serversko vreme (za procenu pomaka sata klijenta).
+    """
+    now = datetime.now(timezone.utc)
+    frame = current_year_frame(now)
+    response.headers["Cache-Control"] = "no-store"  # server_time mora biti svež
     return {
-        "dies": dies,
-        "milidies": milidies,
-        "progress": progress
+        "equinox": _unix_ms(frame.equinox),
+        "day0": _unix_ms(frame.day0),
+        "next_equinox": _unix_ms(frame.next_equinox),
+        "day_ms": DAY // timedelta(milliseconds=1),
+        "milidies_ms": MILIDIES // timedelta(milliseconds=1),
+        "server_time": _unix_ms(now),
+        "valid_until": _unix_ms(frame.next_equinox),
     }
 
 # --- (Po želji) API za explanation tekstove po jeziku ---
-import json
-import os
 
 EXPLANATION_PATH = os.path.join(os.path.dirname(__file__), "explanation_texts.json")
 
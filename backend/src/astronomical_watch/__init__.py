@@ -1 +1,4 @@
+"""Astronomical Watch package."""
+from .core.equinox import compute_vernal_equinox
 
+__all__ = ["compute_vernal_equinox"]
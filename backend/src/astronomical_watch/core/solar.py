@@ -16,8 +16,10 @@ from datetime import datetime
 from typing import Optional
 
 from .timebase import timescales_from_datetime, J2000
-from .vsop87_earth import earth_heliocentric_position, earth_heliocentric_longitude
-from .nutation import nutation_simple
+from .vsop87_earth import (
+    earth_heliocentric_position, earth_heliocentric_longitude, earth_heliocentric_longitude_and_rate
+)
+from .nutation import nutation_longitude_rate, nutation_simple
 
 TAU = 2 * math.pi
 
@@ -41,6 +43,22 @@ def apparent_solar_longitude(jd_tt: float, max_error_arcsec: Optional[float] = N
     nut = nutation_simple(jd_tt)
     return (L_geo + nut.dpsi * math.cos(nut.eps)) % TAU
 
+def apparent_solar_longitude_and_rate(jd_tt: float, max_error_arcsec: Optional[float] = None):
+    """
+    Prividna sunčeva longituda (kao apparent_solar_longitude) i njen vremenski izvod.
+
+    Izvod je analitički: VSOP87 serije L član po član plus izvod nutacije u dužini
+    (promena kosoće je zanemarljiva).
+
+    Returns:
+        (lambda, dlambda/dt) u radijanima i radijanima po danu.
+    """
+    L_e, dL_e = earth_heliocentric_longitude_and_rate(jd_tt, max_error_arcsec=max_error_arcsec)
+    L_geo = (L_e + math.pi) % TAU
+    nut = nutation_simple(jd_tt)
+    cos_eps = math.cos(nut.eps)
+    return (L_geo + nut.dpsi * cos_eps) % TAU, dL_e + nutation_longitude_rate(jd_tt) * cos_eps
+
 def solar_longitude_and_distance_from_datetime(dt: datetime, max_error_arcsec: Optional[float] = None):
     """Compute solar longitude and distance from datetime"""
     ts = timescales_from_datetime(dt)
@@ -57,6 +75,7 @@ def solar_longitude_from_datetime(dt: datetime, max_error_arcsec: Optional[float
 
 __all__ = [
     "apparent_solar_longitude",
+    "apparent_solar_longitude_and_rate",
     "solar_longitude_from_datetime",
     "solar_longitude_and_distance_from_datetime",
 ]
@@ -5,10 +5,11 @@ Skeleton – ΔT i preciznost će se kasnije poboljšati.
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import math
 
 J2000 = 2451545.0  # JD of 2000-01-01 12:00:00 TT
+JD_UNIX_EPOCH = 2440587.5  # JD of 1970-01-01 00:00:00 UTC
 DAY_SECONDS = 86400.0
 
 def ensure_utc(dt: datetime) -> datetime:
@@ -29,6 +30,10 @@ def datetime_to_jd(dt: datetime) -> float:
     jd = math.floor(365.25 * (y + 4716)) + math.floor(30.6001 * (m + 1)) + d + B - 1524.5
     return jd
 
+def jd_to_datetime(jd: float) -> datetime:
+    # Inverzno od datetime_to_jd (proleptički gregorijanski kalendar), rezolucija 1 µs
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(days=jd - JD_UNIX_EPOCH)
+
 def estimate_delta_t(year: float) -> float:
     # Gruba aproksimacija; zameniti boljim modelom
     t = year - 2000.0
@@ -4,11 +4,23 @@ Convert UTC datetime into (dies, miliDies) relative to vernal equinox frame.
 License: Astronomical Watch Core License v1.0 (NO MODIFICATION). See LICENSE.CORE
 """
 from __future__ import annotations
-from datetime import datetime, timezone, timedelta
-from .equinox import compute_vernal_equinox
+from dataclasses import dataclass
+from datetime import MAXYEAR, MINYEAR, datetime, timezone, timedelta
+from typing import Optional
+import numpy as np
+from .equinox import cached_vernal_equinox
 
 DAY_SECONDS = 86400
 LAMBDA_REF_DEG = -168.975
+DAY = timedelta(seconds=DAY_SECONDS)
+MILIDIES = DAY / 1000  # 86.4 s, exactly representable in microseconds
+DAY_US = DAY_SECONDS * 1_000_000
+MILIDIES_US = DAY_US // 1000
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Epoch seconds of the datetime range, [min, max); checked before scaling to microseconds
+_MIN_EPOCH_S = (datetime(MINYEAR, 1, 1, tzinfo=timezone.utc) - _EPOCH) // timedelta(seconds=1)
+_MAX_EPOCH_S = (datetime(MAXYEAR, 12, 31, 23, 59, 59, tzinfo=timezone.utc) - _EPOCH) // timedelta(seconds=1) + 1
+_RANGE_ERROR = f"Instants must fall within years {MINYEAR}-{MAXYEAR}."
 
 def reference_noon_utc_for_day(dt: datetime) -> datetime:
     if dt.tzinfo is None:
@@ -24,47 +36,137 @@ def first_day_start_after_equinox(equinox: datetime) -> datetime:
         candidate += timedelta(days=1)
     return candidate
 
+@dataclass(frozen=True)
+class YearFrame:
+    """
+    Precomputed frame of one tropical year, from its vernal equinox up to the next one.
+
+    Like AstroYear in backend/core/astro_time_core.py, every boundary is computed once, so a
+    reading is a single subtraction plus divmods. Day boundaries are reference noons, which
+    repeat every 86400 s, so dies=0 (equinox .. day0) needs no special case: its miliDies are
+    counted from the reference noon preceding day0, exactly as before.
+    """
+    equinox: datetime
+    day0: datetime              # first_day_start_after_equinox(equinox), start of dies=1
+    next_equinox: datetime
+
+    @classmethod
+    def for_instant(cls, dt: datetime) -> "YearFrame":
+        """Build the frame of the tropical year containing dt."""
+        if dt.tzinfo is None:
+            raise ValueError("Datetime must be UTC (tz-aware).")
+        eq = cached_vernal_equinox(dt.year)
+        if dt < eq:
+            eq = cached_vernal_equinox(dt.year - 1)
+        next_eq = cached_vernal_equinox(eq.year + 1)
+        if dt >= next_eq:
+            eq = next_eq
+            next_eq = cached_vernal_equinox(eq.year + 1)
+        return cls(equinox=eq, day0=first_day_start_after_equinox(eq), next_equinox=next_eq)
+
+    def contains(self, dt: datetime) -> bool:
+        return self.equinox <= dt < self.next_equinox
+
+    def reading(self, dt: datetime) -> tuple[int, int]:
+        """(dies, miliDies) for an instant inside this frame."""
+        days, intra = divmod(dt - self.day0, DAY)
+        return days + 1, intra // MILIDIES
+
+    def milidies_span(self, dt: datetime) -> tuple[datetime, datetime]:
+        """
+        [start, end) of the miliDies containing dt, i.e. the interval with the same reading.
+
+        The span is cut at the frame edges, where dies changes but the miliDies count runs on.
+        """
+        start = dt - (dt - self.day0) % MILIDIES
+        return max(start, self.equinox), min(start + MILIDIES, self.next_equinox)
+
+
+# Frame of the tropical year served most recently; replaced only when an instant falls outside it.
+_current_frame: Optional[YearFrame] = None
+
+def current_year_frame(dt: datetime) -> YearFrame:
+    """Return the cached YearFrame containing dt, rebuilding it once dt crosses an equinox."""
+    global _current_frame
+    frame = _current_frame
+    if frame is None or not frame.contains(dt):
+        frame = YearFrame.for_instant(dt)
+        _current_frame = frame
+    return frame
+
 def astronomical_time(dt: datetime) -> tuple[int, int]:
     if dt.tzinfo is None:
         raise ValueError("Datetime must be UTC (tz-aware).")
-    year_guess = dt.year
-    eq = compute_vernal_equinox(year_guess)
-    if dt < eq:
-        eq = compute_vernal_equinox(year_guess - 1)
-    next_eq = compute_vernal_equinox(eq.year + 1)
-    if dt >= next_eq:
-        eq = next_eq
-        next_eq = compute_vernal_equinox(eq.year + 1)
-    day0 = first_day_start_after_equinox(eq)
-
-    # Izračunaj podne na referentnom meridijanu za dati dan
-    def ref_noon(dt_):
-        return reference_noon_utc_for_day(dt_)
-
-    # Ako je trenutak pre prvog podneva nakon ekvinocija
-    if dt < day0:
-        dies = 0
-        # miliDies se računa od poslednjeg podneva (pre dt)
-        # Pronađi poslednji podne na referentnom meridijanu
-        prev_noon = ref_noon(dt)
-        if dt < prev_noon:
-            prev_noon -= timedelta(days=1)
-        intra = (dt - prev_noon).total_seconds()
-        if intra < 0:
-            intra = 0
-        miliDies = int((intra / DAY_SECONDS) * 1000)
-        if miliDies > 999:
-            miliDies = 999
-        return dies, miliDies
-
-    # Nakon prvog podneva: dies = 1, 2, ...
-    seconds_since_day0 = (dt - day0).total_seconds()
-    dies = int(seconds_since_day0 // DAY_SECONDS) + 1
-    current_day_start = day0 + timedelta(days=dies - 1)
-    intra = (dt - current_day_start).total_seconds()
-    if intra < 0:
-        intra = 0
-    miliDies = int((intra / DAY_SECONDS) * 1000)
-    if miliDies > 999:
-        miliDies = 999
-    return dies, miliDies
+    return current_year_frame(dt).reading(dt)
+
+def _epoch_us(dt: datetime) -> int:
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+def astronomical_time_many(instants, with_fraction: bool = False) -> tuple[np.ndarray, ...]:
+    """
+    Vectorized astronomical_time over an array of UTC instants.
+
+    Args:
+        instants: numpy datetime64 array (any unit, interpreted as UTC) or numeric
+                  epoch seconds (int or float)
+        with_fraction: Also return the elapsed fraction [0, 1) of each miliDies
+
+    Returns:
+        (dies, miliDies) int64 arrays with the same shape as instants, plus a float64
+        fraction array if with_fraction.
+
+    Equinoxes are resolved once per distinct tropical year through the equinox memo;
+    everything else is integer array arithmetic in microseconds.
+    """
+    arr = np.asarray(instants)
+    # Range-check before scaling to microseconds, where out-of-range values wrap silently
+    if np.issubdtype(arr.dtype, np.datetime64):
+        if np.isnat(arr).any():
+            raise ValueError("Instants must not contain NaT.")
+        if arr.size:
+            years = arr.astype("datetime64[Y]").astype(np.int64) + 1970
+            if years.min() < MINYEAR or years.max() > MAXYEAR:
+                raise ValueError(_RANGE_ERROR)
+        t_us = arr.astype("datetime64[us]").astype(np.int64)
+    elif np.issubdtype(arr.dtype, np.integer):
+        if arr.size and (arr.min() < _MIN_EPOCH_S or arr.max() >= _MAX_EPOCH_S):
+            raise ValueError(_RANGE_ERROR)
+        t_us = arr.astype(np.int64) * 1_000_000
+    elif np.issubdtype(arr.dtype, np.floating):
+        if not np.isfinite(arr).all():
+            raise ValueError("Epoch seconds must be finite.")
+        if arr.size and (arr.min() < _MIN_EPOCH_S or arr.max() >= _MAX_EPOCH_S):
+            raise ValueError(_RANGE_ERROR)
+        t_us = np.round(arr.astype(np.float64) * 1e6).astype(np.int64)
+    else:
+        raise TypeError(f"Unsupported instant dtype: {arr.dtype}")
+
+    if t_us.size == 0:
+        empty = np.zeros(arr.shape, dtype=np.int64)
+        if with_fraction:
+            return empty, empty.copy(), np.zeros(arr.shape, dtype=np.float64)
+        return empty, empty.copy()
+
+    t_years = t_us.astype("datetime64[us]").astype("datetime64[Y]").astype(np.int64) + 1970
+    years = np.unique(t_years)
+    if years[0] < MINYEAR or years[-1] > MAXYEAR:
+        raise ValueError(_RANGE_ERROR)
+    # Governing equinox of an instant in calendar year y is eq(y), or eq(y-1) before it;
+    # only the neighbours actually needed are solved.
+    own_eq_us = np.array([_epoch_us(cached_vernal_equinox(int(y))) for y in years], dtype=np.int64)
+    early = t_us < own_eq_us[np.searchsorted(years, t_years)]
+    eq_years = sorted(set(years.tolist()) | set((np.unique(t_years[early]) - 1).tolist()))
+    if eq_years[0] < MINYEAR:
+        raise ValueError(f"Instants before the vernal equinox of year {MINYEAR} are not supported.")
+    equinoxes = [cached_vernal_equinox(y) for y in eq_years]
+    eq_us = np.array([_epoch_us(eq) for eq in equinoxes], dtype=np.int64)
+    day0_us = np.array([_epoch_us(first_day_start_after_equinox(eq)) for eq in equinoxes], dtype=np.int64)
+
+    idx = np.searchsorted(eq_us, t_us, side="right") - 1
+    since_day0 = t_us - day0_us[idx]
+    days = since_day0 // DAY_US
+    intra = since_day0 - days * DAY_US
+    milidies, within = np.divmod(intra, MILIDIES_US)
+    if with_fraction:
+        return days + 1, milidies, within / MILIDIES_US
+    return days + 1, milidies
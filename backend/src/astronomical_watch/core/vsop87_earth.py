@@ -5,11 +5,22 @@ coefficients based on accuracy requirements.
 
 For full accuracy, use the scripts/generate_vsop87.py to create coefficient files.
 All values in radians (L, B) and AU (R).
+
+Coefficients are packed once per set into one contiguous float64 (N, 3) block of (A, B, C)
+rows; each series is a contiguous (n, 3) view into that block. Every series is evaluated with
+a single vectorized cos call, and earth_heliocentric_position evaluates all 18 series (and
+optionally their time derivatives) in one fused pass. All evaluators accept a scalar t or a
+numpy array of epochs.
 """
+import json
 import math
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Any
 
+import numpy as np
+
 # Default truncated series (for demonstration and baseline operation)
 L0 = [
     (175347046.0, 0, 0),
@@ -39,76 +50,224 @@ R1 = [
 ]
 R2, R3, R4, R5 = [], [], [], []
 
-# Cache for dynamically loaded coefficient sets
-_coefficient_cache: Dict[str, Any] = {}
-_default_coefficients: Optional[Dict[str, List[Tuple[float, float, float]]]] = None
+SERIES_NAMES = tuple(f"{coord}{power}" for coord in "LBR" for power in range(6))
+_SERIES_INDEX = {name: i for i, name in enumerate(SERIES_NAMES)}
+
+@dataclass(frozen=True, eq=False)
+class PackedCoefficients:
+    """One VSOP87 coefficient set with all 18 series stored back to back."""
+    terms: np.ndarray    # (N, 3) float64 rows (A, B, C), series in SERIES_NAMES order
+    offsets: np.ndarray  # (19,) int64: series i occupies terms[offsets[i]:offsets[i + 1]]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        i = _SERIES_INDEX[name]
+        return self.terms[self.offsets[i]:self.offsets[i + 1]]
+
+# Cache for dynamically loaded coefficient sets (already packed)
+_coefficient_cache: Dict[str, PackedCoefficients] = {}
+_default_coefficients: Optional[PackedCoefficients] = None
+
+# Registry of generated coefficient files: (directory mtime_ns, {path: (mtime_ns, size)},
+# sorted error bounds, paths)
+COEFFICIENT_MANIFEST = "index.json"
+COEFFICIENT_PATTERNS = ("vsop87d_earth_*.bin", "vsop87d_earth_*.py")
+_coefficient_index: Optional[Tuple[int, Dict[Path, Tuple[int, int]], List[float], List[Path]]] = None
+_coefficient_index_lock = threading.Lock()
+
+# Binary coefficient format (written by scripts/generate_vsop87.py, keep both in sync):
+# little-endian header followed by N packed float64 (A, B, C) triplets, series in SERIES_NAMES order.
+# The header is 184 bytes, so the float64 payload stays 8-byte aligned.
+BINARY_MAGIC = b"VSOP87DB"
+BINARY_VERSION = 1
+BINARY_HEADER = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("n_series", "<u4"),
+    ("error_arcsec", "<f8"),
+    ("threshold", "<f8"),          # NaN when no truncation was applied
+    ("offsets", "<u8", (len(SERIES_NAMES) + 1,)),
+])
+
+def _read_binary_header(raw) -> np.void:
+    """Parse and validate the header of a binary coefficient file."""
+    if len(raw) < BINARY_HEADER.itemsize:
+        raise ValueError("Binary coefficient file is truncated")
+    header = np.frombuffer(raw, dtype=BINARY_HEADER, count=1)[0]
+    if header["magic"] != BINARY_MAGIC or header["version"] != BINARY_VERSION:
+        raise ValueError("Not a VSOP87D binary coefficient file (bad magic or version)")
+    if header["n_series"] != len(SERIES_NAMES):
+        raise ValueError(f"Unexpected series count: {header['n_series']}")
+    return header
+
+def _pack_coefficients(coeffs: Dict[str, List[Tuple[float, float, float]]]) -> PackedCoefficients:
+    """Pack every series into one contiguous float64 (N, 3) block of (A, B, C) rows."""
+    blocks = [np.asarray(coeffs.get(name, []), dtype=np.float64).reshape(-1, 3) for name in SERIES_NAMES]
+    offsets = np.zeros(len(SERIES_NAMES) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(block) for block in blocks])
+    return PackedCoefficients(terms=np.ascontiguousarray(np.concatenate(blocks)), offsets=offsets)
 
 def _get_script_dir() -> Path:
     """Get the scripts directory path."""
     current_dir = Path(__file__).parent
     return current_dir.parent / "scripts"
 
+def _read_error_bound(file_path: Path) -> Optional[float]:
+    """
+    Parse the "Conservative error bound" line from a generated file's header.
+    
+    Only the module docstring (or the binary header) is read; parsing stops before the
+    coefficient tables.
+    """
+    if file_path.suffix == '.bin':
+        with open(file_path, 'rb') as f:
+            return float(_read_binary_header(f.read(BINARY_HEADER.itemsize))["error_arcsec"])
+    with open(file_path, 'r') as f:
+        for line in f:
+            if 'Conservative error bound' in line and 'arcseconds' in line:
+                parts = line.split()
+                for i, part in enumerate(parts):
+                    if 'arcseconds' in part and i > 0:
+                        try:
+                            return float(parts[i-1])
+                        except ValueError:
+                            continue
+                return None
+            if line.startswith('L0 = ['):
+                return None
+    return None
+
+def _file_stamp(file_path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _refresh_coefficient_index(coeff_dir: Path) -> Tuple[int, Dict[Path, Tuple[int, int]], List[float], List[Path]]:
+    """
+    Rebuild the in-process registry from the manifest, re-parsing only new or changed files.
+    
+    The manifest (COEFFICIENT_MANIFEST in the coefficient directory) maps file names to their
+    mtime, size and error bound, so a fresh process does not have to read any coefficient file.
+    It is written by scripts/generate_vsop87.py and only read here; files it does not describe
+    are parsed for this process alone, so a stale or missing manifest just costs a header read.
+    """
+    # Directory mtime before the scan, so a file added meanwhile forces the next rebuild
+    dir_mtime_ns = coeff_dir.stat().st_mtime_ns
+    manifest_path = coeff_dir / COEFFICIENT_MANIFEST
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f).get("files", {})
+        if not isinstance(manifest, dict):
+            manifest = {}
+    except (OSError, ValueError, AttributeError):
+        manifest = {}
+    
+    files: Dict[str, Dict[str, Any]] = {}
+    stamps: Dict[Path, Tuple[int, int]] = {}
+    for file_path in (p for pattern in COEFFICIENT_PATTERNS for p in coeff_dir.glob(pattern)):
+        try:
+            stamp = _file_stamp(file_path)
+            if stamp is None:
+                continue
+            mtime_ns, size = stamp
+            stamps[file_path] = stamp
+            known = manifest.get(file_path.name)
+            if isinstance(known, dict) and known.get("mtime_ns") == mtime_ns and known.get("size") == size:
+                files[file_path.name] = known
+                continue
+            # New or modified file (possibly rewritten in place): drop any stale loaded copy
+            _coefficient_cache.pop(str(file_path), None)
+            files[file_path.name] = {"mtime_ns": mtime_ns, "size": size, "error_arcsec": _read_error_bound(file_path)}
+        except Exception:
+            continue
+    
+    # Equal error bounds: prefer the memory-mappable binary file over generated Python source
+    ranked = sorted(
+        (entry["error_arcsec"], not name.endswith(".bin"), name) for name, entry in files.items()
+        if isinstance(entry.get("error_arcsec"), (int, float))
+    )
+    return dir_mtime_ns, stamps, [error for error, _, _ in ranked], [coeff_dir / name for _, _, name in ranked]
+
+def _index_is_current(index, dir_mtime_ns: int) -> bool:
+    """True if no coefficient file was added, removed or rewritten since index was built."""
+    return index[0] == dir_mtime_ns and all(_file_stamp(path) == stamp for path, stamp in index[1].items())
+
 def _find_coefficient_file(max_error_arcsec: float) -> Optional[Path]:
     """
     Find the most suitable coefficient file for the given error tolerance.
     
+    Files are indexed once into a registry sorted by error bound; the registry is rebuilt
+    only when the coefficient directory's mtime or an indexed file's (mtime, size) changes,
+    so a lookup costs one stat call per indexed file.
+    
     Args:
         max_error_arcsec: Maximum acceptable error in arcseconds
         
     Returns:
-        Path to coefficient file or None if none suitable found
+        Path to the most accurate coefficient file within the tolerance, or None
     """
-    script_dir = _get_script_dir()
-    coeff_dir = script_dir / "vsop87_coefficients"
+    global _coefficient_index
+    coeff_dir = _get_script_dir() / "vsop87_coefficients"
     
-    if not coeff_dir.exists():
+    try:
+        dir_mtime_ns = coeff_dir.stat().st_mtime_ns
+    except OSError:
         return None
     
-    # Look for generated coefficient files
-    best_file = None
-    best_error = float('inf')
+    index = _coefficient_index
+    if index is None or not _index_is_current(index, dir_mtime_ns):
+        with _coefficient_index_lock:
+            index = _coefficient_index
+            if index is None or not _index_is_current(index, dir_mtime_ns):
+                try:
+                    index = _refresh_coefficient_index(coeff_dir)
+                except OSError:
+                    return None
+                _coefficient_index = index
     
-    for file_path in coeff_dir.glob("vsop87d_earth_*.py"):
-        # Try to extract error information from the file
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                
-            # Look for error bound comment
-            for line in content.split('\n'):
-                if 'Conservative error bound' in line and 'arcseconds' in line:
-                    # Extract error value
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if 'arcseconds' in part and i > 0:
-                            try:
-                                error = float(parts[i-1])
-                                if error <= max_error_arcsec and error < best_error:
-                                    best_error = error
-                                    best_file = file_path
-                                break
-                            except ValueError:
-                                continue
-                    break
-        except Exception:
-            continue
+    _, _, errors, paths = index
+    # Sorted ascending: the most accurate file qualifies iff any file does
+    if errors and errors[0] <= max_error_arcsec:
+        return paths[0]
+    return None
+
+def _load_binary_coefficient_file(file_path: Path) -> PackedCoefficients:
+    """
+    Memory-map a binary coefficient file.
     
-    return best_file
+    The terms array is a read-only view of the mapped file, so loading is O(1) and the
+    pages are shared between all processes (e.g. uvicorn workers) using the same file.
+    """
+    raw = np.memmap(file_path, dtype=np.uint8, mode='r')
+    header = _read_binary_header(raw)
+    offsets = header["offsets"].astype(np.int64)
+    n_terms = int(offsets[-1])
+    if len(raw) < BINARY_HEADER.itemsize + n_terms * 24:
+        raise ValueError("Binary coefficient file is truncated")
+    terms = np.frombuffer(raw, dtype="<f8", count=n_terms * 3, offset=BINARY_HEADER.itemsize)
+    return PackedCoefficients(terms=terms.reshape(n_terms, 3), offsets=offsets)
 
-def _load_coefficient_file(file_path: Path) -> Dict[str, Any]:
+def _load_coefficient_file(file_path: Path) -> PackedCoefficients:
     """
-    Load coefficients from a generated Python file.
+    Load coefficients from a generated binary (.bin) or Python (.py) file.
     
     Args:
         file_path: Path to the coefficient file
         
     Returns:
-        Dictionary containing the loaded coefficients
+        Packed coefficient set
     """
     cache_key = str(file_path)
     if cache_key in _coefficient_cache:
         return _coefficient_cache[cache_key]
     
+    if file_path.suffix == '.bin':
+        coeffs = _load_binary_coefficient_file(file_path)
+        _coefficient_cache[cache_key] = coeffs
+        return coeffs
+    
     # Import the module dynamically
     import importlib.util
     import sys
@@ -121,21 +280,14 @@ def _load_coefficient_file(file_path: Path) -> Dict[str, Any]:
     sys.modules["vsop87_coeffs"] = module
     spec.loader.exec_module(module)
     
-    # Extract coefficient arrays
-    coeffs = {}
-    for coord in ['L', 'B', 'R']:
-        for power in range(6):
-            series_name = f"{coord}{power}"
-            if hasattr(module, series_name):
-                coeffs[series_name] = getattr(module, series_name)
-            else:
-                coeffs[series_name] = []
+    # Extract and pack coefficient arrays
+    coeffs = _pack_coefficients({name: getattr(module, name, []) for name in SERIES_NAMES})
     
     # Cache the loaded coefficients
     _coefficient_cache[cache_key] = coeffs
     return coeffs
 
-def _get_coefficients(max_error_arcsec: Optional[float] = None) -> Dict[str, List[Tuple[float, float, float]]]:
+def _get_coefficients(max_error_arcsec: Optional[float] = None) -> PackedCoefficients:
     """
     Get appropriate coefficients based on error tolerance.
     
@@ -144,18 +296,18 @@ def _get_coefficients(max_error_arcsec: Optional[float] = None) -> Dict[str, Lis
                          If None, uses default built-in coefficients.
         
     Returns:
-        Dictionary of coefficient arrays
+        Packed coefficient set (series are accessible by name, e.g. coeffs['L0'])
     """
     global _default_coefficients
     
     if max_error_arcsec is None:
         # Use built-in default coefficients (cached)
         if _default_coefficients is None:
-            _default_coefficients = {
+            _default_coefficients = _pack_coefficients({
                 'L0': L0, 'L1': L1, 'L2': L2, 'L3': L3, 'L4': L4, 'L5': L5,
                 'B0': B0, 'B1': B1, 'B2': B2, 'B3': B3, 'B4': B4, 'B5': B5,
                 'R0': R0, 'R1': R1, 'R2': R2, 'R3': R3, 'R4': R4, 'R5': R5,
-            }
+            })
         return _default_coefficients
     
     # Try to find and load appropriate coefficient file
@@ -169,28 +321,86 @@ def _get_coefficients(max_error_arcsec: Optional[float] = None) -> Dict[str, Lis
     
     # Fall back to default coefficients
     if _default_coefficients is None:
-        _default_coefficients = {
+        _default_coefficients = _pack_coefficients({
             'L0': L0, 'L1': L1, 'L2': L2, 'L3': L3, 'L4': L4, 'L5': L5,
             'B0': B0, 'B1': B1, 'B2': B2, 'B3': B3, 'B4': B4, 'B5': B5,
             'R0': R0, 'R1': R1, 'R2': R2, 'R3': R3, 'R4': R4, 'R5': R5,
-        }
+        })
     return _default_coefficients
 
-def _sum(terms, t):
-    """Sum a series of periodic terms."""
-    return sum(A * math.cos(B + C * t) for A, B, C in terms)
+def _sum(terms: np.ndarray, t):
+    """Sum a packed series of periodic terms A * cos(B + C * t) for scalar or array t."""
+    if np.ndim(t) == 0:
+        if not len(terms):
+            return 0.0
+        return float(terms[:, 0] @ np.cos(terms[:, 1] + terms[:, 2] * t))
+    t = np.asarray(t, dtype=np.float64)
+    phase = terms[:, 1].reshape((-1,) + (1,) * t.ndim) + np.multiply.outer(terms[:, 2], t)
+    return np.tensordot(terms[:, 0], np.cos(phase), axes=1)
 
 def _eval(series, t):
-    """Evaluate a VSOP87 series at time t."""
+    """Evaluate a VSOP87 series at time t (scalar or array)."""
     return sum(_sum(group, t) * t**n for n, group in enumerate(series))
 
+def _segment_sums(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Per-series sums of per-term values (axis 0); empty series sum to zero."""
+    sums = np.zeros((len(offsets) - 1,) + values.shape[1:])
+    starts = offsets[:-1]
+    nonempty = starts < offsets[1:]
+    if nonempty.any():
+        sums[nonempty] = np.add.reduceat(values, starts[nonempty], axis=0)
+    return sums
+
+def _evaluate_lbr(coeffs: PackedCoefficients, t, derivatives: bool = False):
+    """
+    Evaluate the L, B and R series of one coefficient set in a single fused pass.
+
+    Args:
+        coeffs: Packed coefficient set
+        t: VSOP87 time parameter (scalar or array)
+        derivatives: Also return d/dt of each series (per millennium)
+
+    Returns:
+        (L, B, R) in VSOP87 units (10^-8 rad / 10^-8 AU), followed by
+        (dL, dB, dR) when derivatives is True. For a set holding only the L series
+        (see _longitude_series) just (L,) or (L, dL).
+    """
+    terms = coeffs.terms
+    A, B, C = terms[:, 0], terms[:, 1], terms[:, 2]
+    if np.ndim(t) == 0:
+        t = float(t)
+        phase = B + C * t
+    else:
+        t = np.asarray(t, dtype=np.float64)
+        shape = (-1,) + (1,) * t.ndim
+        A, B, C = A.reshape(shape), B.reshape(shape), C.reshape(shape)
+        phase = B + C * t
+    sums = _segment_sums(A * np.cos(phase), coeffs.offsets)
+    powers = [1.0, t, t * t, t**3, t**4, t**5]
+    coords = (len(coeffs.offsets) - 1) // 6
+    values = tuple(sum(sums[6 * k + n] * powers[n] for n in range(6)) for k in range(coords))
+    if not derivatives:
+        return values
+    # d/dt [S_n(t) t^n] = S_n'(t) t^n + n S_n(t) t^(n-1), with S_n' = -sum(A C sin(B + C t))
+    dsums = _segment_sums(-A * C * np.sin(phase), coeffs.offsets)
+    rates = tuple(
+        sum(dsums[6 * k + n] * powers[n] for n in range(6))
+        + sum(n * sums[6 * k + n] * powers[n - 1] for n in range(1, 6))
+        for k in range(coords)
+    )
+    return values + rates
+
+def _longitude_series(coeffs: PackedCoefficients) -> PackedCoefficients:
+    """View of a coefficient set restricted to the six L series."""
+    return PackedCoefficients(terms=coeffs.terms[:coeffs.offsets[6]], offsets=coeffs.offsets[:7])
+
 def _t(jd):
     """Convert Julian Day to VSOP87 time parameter (millennia since J2000.0)."""
     return (jd - 2451545.0) / 365250.0
 
 def earth_heliocentric_longitude(t, max_error_arcsec: Optional[float] = None):
     """
-    Earth heliocentric longitude (radians) at VSOP87 time t.
+    Earth heliocentric longitude (radians) at VSOP87 time t (scalar or array).
     
     Args:
         t: VSOP87 time parameter (millennia since J2000.0)
@@ -203,7 +413,7 @@ def earth_heliocentric_longitude(t, max_error_arcsec: Optional[float] = None):
 
 def earth_heliocentric_latitude(t, max_error_arcsec: Optional[float] = None):
     """
-    Earth heliocentric latitude (radians) at VSOP87 time t.
+    Earth heliocentric latitude (radians) at VSOP87 time t (scalar or array).
     
     Args:
         t: VSOP87 time parameter (millennia since J2000.0)
@@ -216,7 +426,7 @@ def earth_heliocentric_latitude(t, max_error_arcsec: Optional[float] = None):
 
 def earth_radius_vector(t, max_error_arcsec: Optional[float] = None):
     """
-    Earth radius vector (AU) at VSOP87 time t.
+    Earth radius vector (AU) at VSOP87 time t (scalar or array).
     
     Args:
         t: VSOP87 time parameter (millennia since J2000.0)
@@ -229,17 +439,49 @@ def earth_radius_vector(t, max_error_arcsec: Optional[float] = None):
 
 def earth_heliocentric_position(jd, max_error_arcsec: Optional[float] = None):
     """
-    Earth heliocentric position (L, B, R) at Julian Day jd.
+    Earth heliocentric position (L, B, R) at Julian Day jd (scalar or array).
+    
+    The coefficient set is resolved once and all three coordinates are evaluated in one
+    fused pass.
     
     Args:
         jd: Julian Day
         max_error_arcsec: Maximum acceptable error in arcseconds.
                          If specified, will attempt to load appropriate coefficients.
     """
-    t = _t(jd)
-    return (
-        earth_heliocentric_longitude(t, max_error_arcsec),
-        earth_heliocentric_latitude(t, max_error_arcsec),
-        earth_radius_vector(t, max_error_arcsec),
-    )
+    L, B, R = _evaluate_lbr(_get_coefficients(max_error_arcsec), _t(jd))
+    return (L / 1e8) % (2 * math.pi), B / 1e8, R / 1e8
+
+def earth_heliocentric_position_and_rates(jd, max_error_arcsec: Optional[float] = None):
+    """
+    Earth heliocentric position and its time derivatives at Julian Day jd (scalar or array).
     
+    Args:
+        jd: Julian Day
+        max_error_arcsec: Maximum acceptable error in arcseconds.
+                         If specified, will attempt to load appropriate coefficients.
+    
+    Returns:
+        ((L, B, R), (dL/dt, dB/dt, dR/dt)) with rates in radians/day and AU/day.
+    """
+    L, B, R, dL, dB, dR = _evaluate_lbr(_get_coefficients(max_error_arcsec), _t(jd), derivatives=True)
+    per_day = 1e8 * 365250.0
+    return ((L / 1e8) % (2 * math.pi), B / 1e8, R / 1e8), (dL / per_day, dB / per_day, dR / per_day)
+
+def earth_heliocentric_longitude_and_rate(jd, max_error_arcsec: Optional[float] = None):
+    """
+    Earth heliocentric longitude and its time derivative at Julian Day jd (scalar or array).
+
+    Only the L series are evaluated; the derivative is the term-wise analytic one
+    (-A C sin(B + C t) plus the power-rule terms), exact for the truncated series.
+
+    Args:
+        jd: Julian Day
+        max_error_arcsec: Maximum acceptable error in arcseconds.
+                         If specified, will attempt to load appropriate coefficients.
+
+    Returns:
+        (L, dL/dt) in radians and radians/day.
+    """
+    L, dL = _evaluate_lbr(_longitude_series(_get_coefficients(max_error_arcsec)), _t(jd), derivatives=True)
+    return (L / 1e8) % (2 * math.pi), dL / (1e8 * 365250.0)
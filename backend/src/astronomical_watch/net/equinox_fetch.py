@@ -3,20 +3,140 @@ Remote fetch for equinox data from external JSON API.
 Provides optional retrieval from ASTRON_EQUINOX_URL environment variable.
 """
 from __future__ import annotations
+import gzip
 import json
 import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional, Dict, Any
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 from urllib.parse import urlparse
 from urllib.error import URLError, HTTPError
 import socket
+from collections import OrderedDict
+
+from offline.cache import get_cache_file_path
 
 # Default timeout for network requests
 DEFAULT_TIMEOUT_SECONDS = 10.0
 MARCH_DAY_MIN = 18
 MARCH_DAY_MAX = 22
 
+# The whole remote document is kept in memory and on disk; after this many seconds it is
+# revalidated with a conditional GET (If-None-Match / If-Modified-Since).
+DOCUMENT_MAX_AGE_SECONDS = float(os.environ.get("ASTRON_EQUINOX_MAX_AGE", "3600"))
+REMOTE_DOCUMENT_FILE = "equinox_remote.json"
+
+# Circuit breaker: after BREAKER_FAILURE_THRESHOLD consecutive failed fetches the remote
+# source is skipped for BREAKER_COOLDOWN_SECONDS, then a single probe request is allowed.
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("ASTRON_EQUINOX_BREAKER_FAILURES", "3"))
+BREAKER_COOLDOWN_SECONDS = float(os.environ.get("ASTRON_EQUINOX_BREAKER_COOLDOWN", "60"))
+
+# Years the remote source could not answer are not asked for again within this TTL
+NEGATIVE_TTL_SECONDS = float(os.environ.get("ASTRON_EQUINOX_NEGATIVE_TTL", "300"))
+NEGATIVE_CACHE_MAXSIZE = 1024
+
+
+@dataclass
+class RemoteDocument:
+    """Validated years of the remote equinox document plus its HTTP validators."""
+    url: str
+    years: Dict[int, str] = field(default_factory=dict)  # year -> ISO timestamp
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0  # time.time() of the last successful fetch or revalidation
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after ``failure_threshold`` consecutive failures; open -> half-open after
+    ``cooldown`` seconds, letting one probe through; the probe's outcome closes or re-opens it.
+    """
+    
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Whether a request may be made now (False means fail fast)."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = "half_open"
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+    
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self.state, "consecutive_failures": self.failures}
+
+
+_document: Optional[RemoteDocument] = None
+_document_lock = threading.Lock()  # guards the state below only, never held across I/O
+# URLs whose on-disk copy was missing (or for another URL); not reopened until we write one
+_document_file_misses: set = set()
+
+# Single-flight download: url -> future of the one GET in progress for it. Other callers
+# return the stale copy meanwhile, or wait for that future if there is no copy at all.
+_document_flights: Dict[str, "Future[Optional[Dict[int, str]]]"] = {}
+
+_breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_SECONDS)
+
+# (url, year) -> time.monotonic() until which the year is known to be unavailable. All
+# entries share one TTL, so insertion order is expiry order: expired entries are purged
+# from the front on insert, and at most NEGATIVE_CACHE_MAXSIZE entries are kept.
+_negative_cache: "OrderedDict[tuple, float]" = OrderedDict()
+_negative_lock = threading.Lock()
+
+
+def _is_negative(url: str, year: int) -> bool:
+    with _negative_lock:
+        expires = _negative_cache.get((url, year))
+        if expires is None:
+            return False
+        if time.monotonic() < expires:
+            return True
+        del _negative_cache[(url, year)]
+        return False
+
+
+def _remember_negative(url: str, year: int) -> None:
+    now = time.monotonic()
+    with _negative_lock:
+        _negative_cache[(url, year)] = now + NEGATIVE_TTL_SECONDS
+        _negative_cache.move_to_end((url, year))
+        while _negative_cache and (
+            next(iter(_negative_cache.values())) <= now or len(_negative_cache) > NEGATIVE_CACHE_MAXSIZE
+        ):
+            _negative_cache.popitem(last=False)
+
+
+def _forget_negative_results(url: str) -> None:
+    with _negative_lock:
+        for key in [key for key in _negative_cache if key[0] == url]:
+            del _negative_cache[key]
+
 
 def get_equinox_fetch_url() -> Optional[str]:
     """
@@ -119,6 +239,229 @@ def parse_equinox_json(json_text: str, year: int) -> Optional[str]:
         return None
 
 
+def parse_equinox_document(json_text: str) -> Dict[int, str]:
+    """
+    Parse the whole remote JSON map, keeping only years with a valid timestamp.
+    
+    Args:
+        json_text: JSON response text (same format as parse_equinox_json)
+    
+    Returns:
+        Dictionary year -> ISO timestamp string
+    """
+    try:
+        data = json.loads(json_text)
+    except json.JSONDecodeError:
+        return {}
+    
+    if not isinstance(data, dict):
+        return {}
+    
+    years = {}
+    for key, timestamp in data.items():
+        try:
+            year = int(key)
+        except (TypeError, ValueError):
+            continue
+        if isinstance(timestamp, str) and validate_equinox_timestamp(timestamp, year):
+            years[year] = timestamp
+    return years
+
+
+def _document_file() -> Path:
+    return get_cache_file_path().with_name(REMOTE_DOCUMENT_FILE)
+
+
+def _load_document_file(url: str) -> Optional[RemoteDocument]:
+    """On-disk copy of the document for ``url`` (e.g. from a previous process)."""
+    try:
+        with open(_document_file(), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("url") != url:
+            return None
+        data["years"] = {int(year): ts for year, ts in data.get("years", {}).items()}
+        return RemoteDocument(**data)
+    except (OSError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _save_document_file(document: RemoteDocument) -> None:
+    """Persist the document atomically (temp file + rename); failures are ignored."""
+    path = _document_file()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(document), f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _download_document(
+    url: str,
+    previous: Optional[RemoteDocument],
+    timeout: float
+) -> Optional[RemoteDocument]:
+    """
+    GET the document, conditionally if ``previous`` has validators.
+    
+    Returns:
+        A fresh RemoteDocument (``previous`` refreshed on 304 Not Modified), or None on failure
+    """
+    headers = {"Accept-Encoding": "gzip"}
+    if previous is not None and previous.etag:
+        headers["If-None-Match"] = previous.etag
+    if previous is not None and previous.last_modified:
+        headers["If-Modified-Since"] = previous.last_modified
+    
+    try:
+        with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+            if response.status != 200:
+                return None
+            
+            body = response.read()
+            if response.headers.get('content-encoding', '').lower() == 'gzip':
+                body = gzip.decompress(body)
+            
+            # Content-type is not checked - some servers don't set a proper one
+            return RemoteDocument(
+                url=url,
+                years=parse_equinox_document(body.decode('utf-8')),
+                etag=response.headers.get('etag'),
+                last_modified=response.headers.get('last-modified'),
+                fetched_at=time.time()
+            )
+    
+    except HTTPError as e:
+        if e.code == 304 and previous is not None:
+            previous.fetched_at = time.time()
+            return previous
+        return None
+    except (URLError, socket.timeout, UnicodeDecodeError, OSError, EOFError):
+        return None
+    except Exception:
+        # Catch any other unexpected errors
+        return None
+
+
+def fetch_equinox_document(
+    url: str,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    max_age: Optional[float] = None
+) -> Optional[Dict[int, str]]:
+    """
+    Get all valid years of the remote document, fetching it at most once per max_age.
+    
+    Within max_age the in-memory (or on-disk) copy is returned without a network round
+    trip; after that it is revalidated with a conditional GET. If revalidation fails the
+    stale copy is still returned. While the circuit breaker is open no request is made.
+    At most one request per url is in flight; concurrent callers get the stale copy
+    meanwhile, or wait for that one request if there is no copy yet.
+    
+    Args:
+        url: URL to fetch from
+        timeout: Request timeout in seconds
+        max_age: Seconds a fetched document is used without revalidation
+                 (default: DOCUMENT_MAX_AGE_SECONDS)
+    
+    Returns:
+        Dictionary year -> ISO timestamp, or None if the document was never retrieved
+    """
+    # Basic URL validation
+    parsed = urlparse(url)
+    if not parsed.scheme or not parsed.netloc:
+        return None
+    
+    if max_age is None:
+        max_age = DOCUMENT_MAX_AGE_SECONDS
+    
+    document = _current_document(url)
+    if document is not None and time.time() - document.fetched_at < max_age:
+        return document.years
+    
+    with _document_lock:
+        # Another caller may have refreshed it since
+        if _document is not None and _document.url == url:
+            document = _document
+            if time.time() - document.fetched_at < max_age:
+                return document.years
+        
+        future = _document_flights.get(url)
+        leader = future is None
+        if leader:
+            # A failing source is skipped entirely while the breaker is open
+            if not _breaker.allow():
+                return document.years if document is not None else None
+            future = Future()
+            _document_flights[url] = future
+    
+    if not leader:
+        # Another caller is (re)validating: serve the stale copy rather than queue behind it
+        if document is not None:
+            return document.years
+        return future.result()
+    
+    try:
+        years = _refresh_document(url, document, timeout)
+        future.set_result(years)
+        return years
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _document_lock:
+            _document_flights.pop(url, None)
+
+
+def _current_document(url: str) -> Optional[RemoteDocument]:
+    """In-memory document for ``url``, loading the on-disk copy (outside the lock) on first use."""
+    global _document
+    
+    with _document_lock:
+        if _document is not None and _document.url == url:
+            return _document
+        if url in _document_file_misses:
+            return None
+    
+    loaded = _load_document_file(url)
+    with _document_lock:
+        if _document is not None and _document.url == url:
+            return _document  # published by another caller meanwhile
+        if loaded is None:
+            _document_file_misses.add(url)
+        else:
+            _document = loaded
+        return loaded
+
+
+def _refresh_document(
+    url: str,
+    document: Optional[RemoteDocument],
+    timeout: float
+) -> Optional[Dict[int, str]]:
+    """Download (or revalidate) the document outside the lock and publish the result."""
+    global _document
+    
+    fresh = _download_document(url, document, timeout)
+    if fresh is None:
+        _breaker.record_failure()
+        return document.years if document is not None else None
+    
+    _breaker.record_success()
+    if fresh is not document:
+        # New content: years missing from the old document may be available now
+        _forget_negative_results(url)
+    _save_document_file(fresh)
+    with _document_lock:
+        _document = fresh
+        _document_file_misses.discard(url)
+    return fresh.years
+
+
 def fetch_equinox_from_url(
     url: str, 
     year: int, 
@@ -127,6 +470,9 @@ def fetch_equinox_from_url(
     """
     Fetch equinox timestamp from remote URL.
     
+    The whole document is fetched once and shared by all years (see fetch_equinox_document).
+    Years it cannot answer are remembered as misses for NEGATIVE_TTL_SECONDS.
+    
     Args:
         url: URL to fetch from
         year: Target year
@@ -135,30 +481,14 @@ def fetch_equinox_from_url(
     Returns:
         ISO timestamp string if successful, None on any failure
     """
-    try:
-        # Basic URL validation
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return None
-        
-        # Make the request
-        with urlopen(url, timeout=timeout) as response:
-            if response.status != 200:
-                return None
-            
-            content_type = response.headers.get('content-type', '').lower()
-            if 'application/json' not in content_type and 'text/json' not in content_type:
-                # Still try to parse as JSON - some servers don't set proper content-type
-                pass
-            
-            json_text = response.read().decode('utf-8')
-            return parse_equinox_json(json_text, year)
-            
-    except (URLError, HTTPError, socket.timeout, UnicodeDecodeError):
-        return None
-    except Exception:
-        # Catch any other unexpected errors
+    if _is_negative(url, year):
         return None
+    
+    years = fetch_equinox_document(url, timeout)
+    timestamp = years.get(year) if years is not None else None
+    if timestamp is None:
+        _remember_negative(url, year)
+    return timestamp
 
 
 def fetch_equinox_remote(year: int, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> Optional[str]:
@@ -241,8 +571,17 @@ def get_fetch_status() -> Dict[str, Any]:
         Dictionary with configuration and status info
     """
     url = get_equinox_fetch_url()
+    document = _document
     return {
         "configured": url is not None,
         "url": url,
-        "env_var": "ASTRON_EQUINOX_URL"
+        "env_var": "ASTRON_EQUINOX_URL",
+        "circuit_breaker": _breaker.status(),
+        "negative_cache_entries": len(_negative_cache),
+        "document": {
+            "years": len(document.years),
+            "etag": document.etag,
+            "last_modified": document.last_modified,
+            "fetched_at": datetime.fromtimestamp(document.fetched_at, timezone.utc).isoformat().replace('+00:00', 'Z')
+        } if document is not None and document.url == url else None
   }
@@ -7,10 +7,19 @@ import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
+from contextlib import contextmanager
 import threading
 
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+from offline.sqlite_store import DEFAULT_DB_FILE, SQLiteEquinoxStore
+
 # Cache schema versions
 CURRENT_SCHEMA_VERSION = 2
 LEGACY_SCHEMA_VERSION = 1
@@ -18,10 +27,38 @@ LEGACY_SCHEMA_VERSION = 1
 # Default cache location
 DEFAULT_CACHE_DIR = Path.home() / ".astronomical_watch"
 DEFAULT_CACHE_FILE = "equinox_cache.json"
+COMPUTE_LOCK_FILE = "equinox_compute.lock"
+COMPUTE_LOCK_SLOTS = 1 << 20  # one lock byte per year (modulo) in COMPUTE_LOCK_FILE
+
+# Storage engine: "json" (single JSON file) or "sqlite" (offline/sqlite_store.py)
+CACHE_BACKEND_ENV = "ASTRON_CACHE_BACKEND"
+CACHE_BACKENDS = ("json", "sqlite")
 
 # Thread lock for cache operations
 _cache_lock = threading.Lock()
 
+# In-memory copy of the cache file, revalidated against the file's (mtime, size, inode).
+# Reads are served from memory; the file is only re-parsed after it changes on disk.
+_memory_data: Optional[Dict[str, Any]] = None
+_memory_signature: Optional[tuple] = None
+
+# Lock files shared by all worker processes, as path -> [fd, users]. A descriptor is never
+# closed while in use (closing any descriptor of a file drops all of this process's POSIX
+# locks on it); idle ones beyond LOCK_FDS_MAXSIZE are closed, least recently used first.
+# A forked child reopens its own descriptors: an inherited one shares flock state with
+# the parent, so it would give no mutual exclusion between them.
+LOCK_FDS_MAXSIZE = 8
+_lock_fds: "OrderedDict[str, List[int]]" = OrderedDict()
+_lock_fds_lock = threading.Lock()
+# Per-year thread locks as year -> [lock, users]; dropped when no thread holds or waits on one
+_compute_locks: Dict[int, list] = {}
+
+_sqlite_stores: Dict[str, SQLiteEquinoxStore] = {}
+# Stores inherited from the parent across fork. A child must not use their connections,
+# nor close them (closing could checkpoint or remove the parent's WAL), so they are kept
+# referenced here and never touched again.
+_forked_sqlite_stores: List[SQLiteEquinoxStore] = []
+
 
 @dataclass
 class EquinoxEntry:
@@ -46,6 +83,112 @@ def ensure_cache_dir() -> None:
     cache_file.parent.mkdir(parents=True, exist_ok=True)
 
 
+@contextmanager
+def _lock_fd(lock_file: Path):
+    """Process-wide descriptor for a lock file, kept open during the block (None if unavailable)."""
+    if fcntl is None:
+        yield None
+        return
+    key = str(lock_file)
+    with _lock_fds_lock:
+        slot = _lock_fds.get(key)
+        if slot is None:
+            try:
+                lock_file.parent.mkdir(parents=True, exist_ok=True)
+                slot = _lock_fds[key] = [os.open(key, os.O_RDWR | os.O_CREAT, 0o644), 0]
+            except OSError:
+                slot = None
+        if slot is not None:
+            slot[1] += 1
+            _lock_fds.move_to_end(key)
+    if slot is None:
+        yield None
+        return
+    try:
+        yield slot[0]
+    finally:
+        with _lock_fds_lock:
+            slot[1] -= 1
+            idle = [k for k, (_, users) in _lock_fds.items() if users == 0]
+            for k in idle[:max(0, len(_lock_fds) - LOCK_FDS_MAXSIZE)]:
+                os.close(_lock_fds.pop(k)[0])
+
+
+def _reset_locks_after_fork() -> None:
+    """In a forked child: forget the parent's lock descriptors, thread locks and SQLite stores."""
+    global _lock_fds_lock
+    for fd, _ in _lock_fds.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _lock_fds.clear()
+    _compute_locks.clear()
+    _lock_fds_lock = threading.Lock()
+    _forked_sqlite_stores.extend(_sqlite_stores.values())
+    _sqlite_stores.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
+@contextmanager
+def _cache_file_lock():
+    """
+    Exclusive cross-process lock around a read-modify-write of the cache file.
+    
+    Held together with _cache_lock, so concurrent writers in other workers cannot drop
+    each other's entries.
+    """
+    cache_file = get_cache_file_path()
+    with _lock_fd(cache_file.with_name(cache_file.name + ".lock")) as fd:
+        if fd is None:
+            yield
+            return
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def equinox_compute_lock(year: int):
+    """
+    Serialize computing the equinox for ``year`` across threads and worker processes.
+    
+    Callers should re-check the cache after acquiring the lock: if another worker computed
+    the year meanwhile, its result is already there. Each year has its own byte-range lock
+    in COMPUTE_LOCK_FILE, so different years are computed in parallel.
+    
+    Args:
+        year: Year being computed
+    """
+    with _lock_fds_lock:
+        slot = _compute_locks.get(year)
+        if slot is None:
+            slot = _compute_locks[year] = [threading.Lock(), 0]
+        slot[1] += 1
+    
+    try:
+        with slot[0], _lock_fd(get_cache_file_path().with_name(COMPUTE_LOCK_FILE)) as fd:
+            if fd is None:
+                yield
+                return
+            offset = year % COMPUTE_LOCK_SLOTS
+            fcntl.lockf(fd, fcntl.LOCK_EX, 1, offset)
+            try:
+                yield
+            finally:
+                fcntl.lockf(fd, fcntl.LOCK_UN, 1, offset)
+    finally:
+        with _lock_fds_lock:
+            slot[1] -= 1
+            if slot[1] == 0 and _compute_locks.get(year) is slot:
+                del _compute_locks[year]
+
+
 def load_cache() -> Dict[str, Any]:
     """
     Load cache from disk.
@@ -76,18 +219,66 @@ def save_cache(cache_data: Dict[str, Any]) -> None:
     """
     Save cache to disk.
     
+    The file is written to a temporary file in the same directory and renamed over the
+    cache file, so readers never observe a partially written cache.
+    
     Args:
         cache_data: Cache dictionary to save
     """
     ensure_cache_dir()
     cache_file = get_cache_file_path()
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
     
     try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, cache_file)
     except IOError:
         # Silently fail on write errors
-        pass
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+def _file_signature(cache_file: Path) -> Optional[tuple]:
+    """Identity of the cache file's current contents (None if it does not exist)."""
+    try:
+        st = cache_file.stat()
+    except OSError:
+        return None
+    return (str(cache_file), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _current_cache() -> Dict[str, Any]:
+    """
+    Return the (migrated) cache contents, re-reading the file only if it changed.
+    
+    Must be called with _cache_lock held. The returned dict is shared; callers that
+    modify it must persist it through _store_cache.
+    """
+    global _memory_data, _memory_signature
+    
+    cache_file = get_cache_file_path()
+    signature = _file_signature(cache_file)
+    if _memory_data is not None and signature == _memory_signature:
+        return _memory_data
+    
+    # Migration happens in memory only; it is persisted with the next write
+    _memory_data = migrate_cache_if_needed(load_cache())
+    _memory_signature = signature
+    return _memory_data
+
+
+def _store_cache(cache_data: Dict[str, Any]) -> None:
+    """Persist cache_data and make it the in-memory copy. Must hold _cache_lock."""
+    global _memory_data, _memory_signature
+    
+    save_cache(cache_data)
+    _memory_data = cache_data
+    _memory_signature = _file_signature(get_cache_file_path())
 
 
 def migrate_legacy_entry(year: int, legacy_timestamp: str) -> EquinoxEntry:
@@ -150,6 +341,43 @@ def migrate_cache_if_needed(cache_data: Dict[str, Any]) -> Dict[str, Any]:
     return {"schema": CURRENT_SCHEMA_VERSION, "entries": {}}
 
 
+def get_cache_backend() -> str:
+    """Storage engine selected by CACHE_BACKEND_ENV: "json" (default) or "sqlite"."""
+    backend = os.environ.get(CACHE_BACKEND_ENV, "json").strip().lower()
+    return backend if backend in CACHE_BACKENDS else "json"
+
+
+def _json_seed() -> Dict[int, Dict[str, Any]]:
+    """Entries of the (migrated) JSON cache, imported when a SQLite store is first created."""
+    entries = migrate_cache_if_needed(load_cache()).get("entries", {})
+    return {
+        int(year_str): entry_dict
+        for year_str, entry_dict in entries.items()
+        if year_str.lstrip("-").isdigit() and _entry_from_dict(entry_dict) is not None
+    }
+
+
+def _sqlite_store() -> SQLiteEquinoxStore:
+    """SQLite store next to the JSON cache file (one instance per database path)."""
+    db_path = get_cache_file_path().with_name(DEFAULT_DB_FILE)
+    key = str(db_path)
+    with _cache_lock:
+        store = _sqlite_stores.get(key)
+        if store is None:
+            store = SQLiteEquinoxStore(db_path, seed=_json_seed)
+            _sqlite_stores[key] = store
+    return store
+
+
+def _entry_from_dict(entry_dict: Any) -> Optional[EquinoxEntry]:
+    if not isinstance(entry_dict, dict):
+        return None
+    try:
+        return EquinoxEntry(**entry_dict)
+    except (TypeError, ValueError):
+        return None
+
+
 def get_cached_equinox(year: int) -> Optional[EquinoxEntry]:
     """
     Get cached equinox entry for given year.
@@ -160,28 +388,42 @@ def get_cached_equinox(year: int) -> Optional[EquinoxEntry]:
     Returns:
         EquinoxEntry if found, None otherwise
     """
+    if get_cache_backend() == "sqlite":
+        return _entry_from_dict(_sqlite_store().get(year))
+    
     with _cache_lock:
-        cache_data = load_cache()
-        cache_data = migrate_cache_if_needed(cache_data)
-        
-        # Save migrated cache if it was changed
-        if cache_data.get("schema") == CURRENT_SCHEMA_VERSION:
-            save_cache(cache_data)
-        
-        entries = cache_data.get("entries", {})
-        year_str = str(year)
-        
-        if year_str not in entries:
-            return None
-        
-        entry_dict = entries[year_str]
-        if not isinstance(entry_dict, dict):
-            return None
-        
-        try:
-            return EquinoxEntry(**entry_dict)
-        except (TypeError, ValueError):
-            return None
+        entries = _current_cache().get("entries", {})
+        return _entry_from_dict(entries.get(str(year)))
+
+
+def get_cached_equinoxes(first_year: int, last_year: int) -> Dict[int, EquinoxEntry]:
+    """
+    Get all cached entries for years first_year..last_year (inclusive).
+    
+    Args:
+        first_year: First year of the range
+        last_year: Last year of the range
+    
+    Returns:
+        Dictionary year -> EquinoxEntry for the cached years in the range, in year order
+    """
+    if get_cache_backend() == "sqlite":
+        rows = _sqlite_store().get_range(first_year, last_year)
+    else:
+        with _cache_lock:
+            entries = _current_cache().get("entries", {})
+            rows = {
+                int(year_str): entry_dict
+                for year_str, entry_dict in entries.items()
+                if year_str.lstrip("-").isdigit() and first_year <= int(year_str) <= last_year
+            }
+    
+    result = {}
+    for year in sorted(rows):
+        entry = _entry_from_dict(rows[year])
+        if entry is not None:
+            result[year] = entry
+    return result
 
 
 def set_cached_equinox(year: int, entry: EquinoxEntry) -> None:
@@ -192,27 +434,44 @@ def set_cached_equinox(year: int, entry: EquinoxEntry) -> None:
         year: Target year
         entry: EquinoxEntry to store
     """
-    with _cache_lock:
-        cache_data = load_cache()
-        cache_data = migrate_cache_if_needed(cache_data)
+    set_cached_equinoxes({year: entry})
+
+
+def set_cached_equinoxes(entries: Dict[int, EquinoxEntry]) -> None:
+    """
+    Store several equinox entries in one write (one transaction for SQLite).
+    
+    Args:
+        entries: Dictionary year -> EquinoxEntry
+    """
+    if get_cache_backend() == "sqlite":
+        _sqlite_store().upsert_many({year: asdict(entry) for year, entry in entries.items()})
+        return
+    
+    with _cache_lock, _cache_file_lock():
+        # Re-validated under the file lock, so entries written by other workers are kept
+        cache_data = dict(_current_cache())
         
-        # Ensure entries dict exists
-        if "entries" not in cache_data:
-            cache_data["entries"] = {}
+        # Copy entries so the shared in-memory dict is only replaced once the write is done
+        cache_data["entries"] = dict(cache_data.get("entries", {}))
         
-        # Store the entry
-        year_str = str(year)
-        cache_data["entries"][year_str] = asdict(entry)
+        # Store the entries
+        for year, entry in entries.items():
+            cache_data["entries"][str(year)] = asdict(entry)
         
         # Save to disk
-        save_cache(cache_data)
+        _store_cache(cache_data)
 
 
 def clear_cache() -> None:
     """Clear all cached entries."""
-    with _cache_lock:
+    if get_cache_backend() == "sqlite":
+        _sqlite_store().clear()
+        return
+    
+    with _cache_lock, _cache_file_lock():
         cache_data = {"schema": CURRENT_SCHEMA_VERSION, "entries": {}}
-        save_cache(cache_data)
+        _store_cache(cache_data)
 
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -222,9 +481,17 @@ def get_cache_stats() -> Dict[str, Any]:
     Returns:
         Dictionary with cache statistics
     """
+    if get_cache_backend() == "sqlite":
+        store = _sqlite_store()
+        return {
+            "schema_version": CURRENT_SCHEMA_VERSION,
+            **store.stats(),
+            "cache_file": str(store.path),
+            "backend": "sqlite"
+        }
+    
     with _cache_lock:
-        cache_data = load_cache()
-        cache_data = migrate_cache_if_needed(cache_data)
+        cache_data = _current_cache()
         
         entries = cache_data.get("entries", {})
         
@@ -245,14 +512,19 @@ def get_cache_stats() -> Dict[str, Any]:
             "total_entries": len(entries),
             "precision_counts": precision_counts,
             "migrated_entries": migrated_count,
-            "cache_file": str(get_cache_file_path())
+            "cache_file": str(get_cache_file_path()),
+            "backend": "json"
         }
 
 
 def is_cache_available() -> bool:
     """Check if cache is available and readable."""
     try:
-        cache_data = load_cache()
+        if get_cache_backend() == "sqlite":
+            _sqlite_store().ping()
+            return True
+        with _cache_lock:
+            cache_data = _current_cache()
         return isinstance(cache_data, dict)
     except Exception:
         return False
@@ -0,0 +1,194 @@
+"""
+Precomputed vernal equinox ephemeris shipped with the package.
+
+The table is a compact binary file of equinox instants for consecutive years, so a lookup
+is a single array index: no solver, no JSON cache, no network. It is generated by
+scripts/build_equinox_ephemeris.py.
+
+Binary layout (little-endian): EPHEMERIS_HEADER followed by ``count`` int64 values,
+microseconds since 1970-01-01T00:00:00Z, for years first_year .. first_year + count - 1.
+"""
+from __future__ import annotations
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from offline.cache import EquinoxEntry
+
+EPHEMERIS_MAGIC = b"AWEQUINX"
+EPHEMERIS_VERSION = 1
+EPHEMERIS_HEADER = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("first_year", "<i4"),
+    ("count", "<u4"),
+    ("reserved", "<u4"),
+    ("uncertainty_s", "<f8"),
+    ("built_at_us", "<i8"),
+    ("precision", "S16"),
+    ("source", "S32"),
+])
+
+DEFAULT_EPHEMERIS_FILE = Path(__file__).parent / "equinox_ephemeris.bin"
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_iso(dt: datetime) -> str:
+    return dt.isoformat().replace('+00:00', 'Z')
+
+
+@dataclass(frozen=True, eq=False)
+class EquinoxEphemeris:
+    """Equinox instants for consecutive years with the metadata they were computed with."""
+    first_year: int
+    instants_us: np.ndarray     # int64 microseconds since Unix epoch, one per year
+    precision: str              # "analytic" (same meaning as cache entries)
+    uncertainty_s: float        # Uncertainty in seconds
+    source: str                 # Solver the table was built with
+    built_at: datetime          # When the table was generated
+
+    @property
+    def last_year(self) -> int:
+        return self.first_year + len(self.instants_us) - 1
+
+    def covers(self, year: int) -> bool:
+        return self.first_year <= year <= self.last_year
+
+    def equinox(self, year: int) -> Optional[datetime]:
+        """Equinox instant for ``year`` (UTC), or None if outside the table."""
+        if not self.covers(year):
+            return None
+        return _UNIX_EPOCH + timedelta(microseconds=int(self.instants_us[year - self.first_year]))
+
+    def entry(self, year: int) -> Optional[EquinoxEntry]:
+        """Equinox for ``year`` as a cache-style EquinoxEntry, or None if outside the table."""
+        dt = self.equinox(year)
+        if dt is None:
+            return None
+        return EquinoxEntry(
+            utc=_to_iso(dt),
+            precision=self.precision,
+            uncertainty_s=self.uncertainty_s,
+            source=self.source,
+            retrieved_at=_to_iso(self.built_at),
+        )
+
+    def save(self, path: Path = DEFAULT_EPHEMERIS_FILE) -> None:
+        """Write the table atomically (temp file + rename)."""
+        header = np.zeros((), dtype=EPHEMERIS_HEADER)
+        header["magic"] = EPHEMERIS_MAGIC
+        header["version"] = EPHEMERIS_VERSION
+        header["first_year"] = self.first_year
+        header["count"] = len(self.instants_us)
+        header["uncertainty_s"] = self.uncertainty_s
+        header["built_at_us"] = (self.built_at - _UNIX_EPOCH) // timedelta(microseconds=1)
+        header["precision"] = self.precision.encode("ascii")
+        header["source"] = self.source.encode("ascii")
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header.tobytes())
+            f.write(np.ascontiguousarray(self.instants_us, dtype="<i8").tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_EPHEMERIS_FILE) -> "EquinoxEphemeris":
+        """Read a table written by save(). Raises ValueError if the file is not a valid table."""
+        raw = Path(path).read_bytes()
+        if len(raw) < EPHEMERIS_HEADER.itemsize:
+            raise ValueError("truncated equinox ephemeris header")
+        header = np.frombuffer(raw, dtype=EPHEMERIS_HEADER, count=1)[0]
+        if header["magic"] != EPHEMERIS_MAGIC:
+            raise ValueError("not an equinox ephemeris file")
+        if header["version"] != EPHEMERIS_VERSION:
+            raise ValueError(f"unsupported equinox ephemeris version {header['version']}")
+
+        count = int(header["count"])
+        if len(raw) != EPHEMERIS_HEADER.itemsize + 8 * count:
+            raise ValueError("equinox ephemeris size does not match its header")
+        instants = np.frombuffer(raw, dtype="<i8", count=count, offset=EPHEMERIS_HEADER.itemsize)
+
+        return cls(
+            first_year=int(header["first_year"]),
+            instants_us=instants,
+            precision=header["precision"].decode("ascii"),
+            uncertainty_s=float(header["uncertainty_s"]),
+            source=header["source"].decode("ascii"),
+            built_at=_UNIX_EPOCH + timedelta(microseconds=int(header["built_at_us"])),
+        )
+
+
+_ephemeris: Optional[EquinoxEphemeris] = None
+_ephemeris_loaded = False
+_ephemeris_lock = threading.Lock()
+
+
+def get_ephemeris() -> Optional[EquinoxEphemeris]:
+    """The shipped ephemeris (loaded once per process), or None if missing or invalid."""
+    global _ephemeris, _ephemeris_loaded
+    if not _ephemeris_loaded:
+        with _ephemeris_lock:
+            if not _ephemeris_loaded:
+                try:
+                    _ephemeris = EquinoxEphemeris.load(DEFAULT_EPHEMERIS_FILE)
+                except (OSError, ValueError):
+                    _ephemeris = None
+                _ephemeris_loaded = True
+    return _ephemeris
+
+
+def equinox(year: int) -> Optional[datetime]:
+    """O(1) lookup of the vernal equinox for ``year`` in the shipped ephemeris."""
+    ephemeris = get_ephemeris()
+    return ephemeris.equinox(year) if ephemeris is not None else None
+
+
+def ephemeris_entry(year: int) -> Optional[EquinoxEntry]:
+    """O(1) lookup returning an EquinoxEntry, or None if the year is not tabulated."""
+    ephemeris = get_ephemeris()
+    return ephemeris.entry(year) if ephemeris is not None else None
+
+
+def build_ephemeris(
+    years: Iterable[int],
+    solver: str = "precise",
+) -> EquinoxEphemeris:
+    """
+    Solve the equinox for each of ``years`` (must be consecutive) and return the table.
+
+    Args:
+        years: Consecutive years to tabulate
+        solver: "precise" (compute_vernal_equinox_precise, Meeus light model, as used by the
+                service's analytic method) or "core" (core VSOP87D compute_vernal_equinox)
+    """
+    years = list(years)
+    if not years or years != list(range(years[0], years[0] + len(years))):
+        raise ValueError("years must be a non-empty consecutive range")
+
+    if solver == "precise":
+        from solar.equinox_precise import compute_vernal_equinox_precise
+        solve = lambda year: compute_vernal_equinox_precise(year, method="brent", tolerance_sec=1.0)
+        source, uncertainty_s = "meeus_root_finding", 10.0
+    elif solver == "core":
+        from core.equinox import compute_vernal_equinox
+        solve = lambda year: compute_vernal_equinox(year, tol_seconds=1.0)
+        source, uncertainty_s = "vsop87d_root_finding", 10.0
+    else:
+        raise ValueError(f"Invalid solver: {solver}. Must be 'precise' or 'core'")
+
+    one_us = timedelta(microseconds=1)
+    instants = np.array([(solve(year) - _UNIX_EPOCH) // one_us for year in years], dtype=np.int64)
+    return EquinoxEphemeris(
+        first_year=years[0],
+        instants_us=instants,
+        precision="analytic",
+        uncertainty_s=uncertainty_s,
+        source=source,
+        built_at=datetime.now(timezone.utc).replace(microsecond=0),
+    )
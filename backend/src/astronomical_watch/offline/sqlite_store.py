@@ -0,0 +1,182 @@
+"""
+SQLite storage engine for the equinox cache (selected with ASTRON_CACHE_BACKEND=sqlite).
+
+One row per year (``year`` is the primary key) in a WAL-mode database, so point and range
+reads are index lookups. Statistics come from per-precision counters that triggers keep
+current in the same transaction as each write, so reading them never scans the table.
+Rows are plain dicts with the EquinoxEntry fields; offline/cache.py converts them.
+"""
+from __future__ import annotations
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_DB_FILE = "equinox_cache.sqlite3"
+
+# Stored in PRAGMA user_version once the tables exist and have been seeded
+# (2: equinox table, 3: equinox_stats counters)
+STORE_SCHEMA_VERSION = 3
+
+FIELDS = ("utc", "precision", "uncertainty_s", "source", "retrieved_at", "legacy_approx")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS equinox (
+    year          INTEGER PRIMARY KEY,
+    utc           TEXT NOT NULL,
+    precision     TEXT NOT NULL,
+    uncertainty_s REAL NOT NULL,
+    source        TEXT NOT NULL,
+    retrieved_at  TEXT NOT NULL,
+    legacy_approx TEXT
+) WITHOUT ROWID
+"""
+
+# Entry and migrated-entry counts per precision, maintained by the triggers below
+_CREATE_STATS = (
+    """
+    CREATE TABLE IF NOT EXISTS equinox_stats (
+        precision TEXT PRIMARY KEY,
+        entries   INTEGER NOT NULL,
+        migrated  INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS equinox_stats_insert AFTER INSERT ON equinox BEGIN
+        INSERT INTO equinox_stats (precision, entries, migrated)
+        VALUES (NEW.precision, 1, NEW.legacy_approx IS NOT NULL)
+        ON CONFLICT(precision) DO UPDATE SET
+            entries = entries + 1, migrated = migrated + excluded.migrated;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS equinox_stats_delete AFTER DELETE ON equinox BEGIN
+        UPDATE equinox_stats
+        SET entries = entries - 1, migrated = migrated - (OLD.legacy_approx IS NOT NULL)
+        WHERE precision = OLD.precision;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS equinox_stats_update AFTER UPDATE ON equinox BEGIN
+        UPDATE equinox_stats
+        SET entries = entries - 1, migrated = migrated - (OLD.legacy_approx IS NOT NULL)
+        WHERE precision = OLD.precision;
+        INSERT INTO equinox_stats (precision, entries, migrated)
+        VALUES (NEW.precision, 1, NEW.legacy_approx IS NOT NULL)
+        ON CONFLICT(precision) DO UPDATE SET
+            entries = entries + 1, migrated = migrated + excluded.migrated;
+    END
+    """,
+)
+_REBUILD_STATS = (
+    "INSERT INTO equinox_stats (precision, entries, migrated) "
+    "SELECT precision, COUNT(*), COUNT(legacy_approx) FROM equinox GROUP BY precision"
+)
+
+_COLUMNS = ", ".join(FIELDS)
+_UPSERT = (
+    f"INSERT INTO equinox (year, {_COLUMNS}) VALUES (?, {', '.join('?' for _ in FIELDS)}) "
+    f"ON CONFLICT(year) DO UPDATE SET " + ", ".join(f"{f} = excluded.{f}" for f in FIELDS)
+)
+
+
+def _row_dict(row: tuple) -> Dict[str, Any]:
+    return dict(zip(FIELDS, row))
+
+
+class SQLiteEquinoxStore:
+    """
+    Equinox rows in a SQLite database, one connection per thread.
+
+    Args:
+        path: Database file
+        seed: Called once, when the database is first created, to import existing entries
+              (e.g. a migrated JSON cache) as {year: row}
+    """
+
+    def __init__(self, path: Path, seed: Optional[Callable[[], Dict[int, Dict[str, Any]]]] = None):
+        self.path = Path(path)
+        self._seed = seed
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._initialize(conn)
+            self._local.conn = conn
+        return conn
+
+    def _initialize(self, conn: sqlite3.Connection) -> None:
+        """Create and seed the tables once; IMMEDIATE makes concurrent workers take turns."""
+        if conn.execute("PRAGMA user_version").fetchone()[0] == STORE_SCHEMA_VERSION:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != STORE_SCHEMA_VERSION:
+                conn.execute(_CREATE_TABLE)
+                for statement in _CREATE_STATS:
+                    conn.execute(statement)
+                # Count existing rows once (a version 2 database); the triggers take over from here
+                conn.execute("DELETE FROM equinox_stats")
+                conn.execute(_REBUILD_STATS)
+                if version == 0 and self._seed is not None:
+                    self._upsert(conn, self._seed())
+                conn.execute(f"PRAGMA user_version = {STORE_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, rows: Dict[int, Dict[str, Any]]) -> None:
+        conn.executemany(
+            _UPSERT,
+            ((int(year), *(row.get(f) for f in FIELDS)) for year, row in rows.items()),
+        )
+
+    def get(self, year: int) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            f"SELECT {_COLUMNS} FROM equinox WHERE year = ?", (year,)
+        ).fetchone()
+        return _row_dict(row) if row is not None else None
+
+    def get_range(self, first_year: int, last_year: int) -> Dict[int, Dict[str, Any]]:
+        rows = self._conn().execute(
+            f"SELECT year, {_COLUMNS} FROM equinox WHERE year BETWEEN ? AND ? ORDER BY year",
+            (first_year, last_year),
+        )
+        return {row[0]: _row_dict(row[1:]) for row in rows}
+
+    def upsert_many(self, rows: Dict[int, Dict[str, Any]]) -> None:
+        """Insert or replace rows in a single transaction."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._upsert(conn, rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM equinox")
+
+    def ping(self) -> None:
+        """Cheap availability check: opens (and if needed creates) the database."""
+        self._conn().execute("SELECT 1 FROM equinox LIMIT 1").fetchall()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts, read from the trigger-maintained counters (one row per precision)."""
+        rows = self._conn().execute(
+            "SELECT precision, entries, migrated FROM equinox_stats WHERE entries > 0"
+        ).fetchall()
+        return {
+            "total_entries": sum(entries for _, entries, _ in rows),
+            "precision_counts": {precision: entries for precision, entries, _ in rows},
+            "migrated_entries": sum(migrated for _, _, migrated in rows),
+        }
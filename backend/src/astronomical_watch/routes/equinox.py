@@ -1,20 +1,23 @@
 from datetime import datetime, timezone
 from fastapi import APIRouter
-from services.equinox_service import get_vernal_equinox_datetime
+from services.equinox_service import get_vernal_equinox_async
 
 router = APIRouter()
 
-def _next_vernal_equinox(now_utc: datetime) -> datetime:
+async def _vernal_equinox_datetime(year: int) -> datetime:
+    return (await get_vernal_equinox_async(year))["datetime"]
+
+async def _next_vernal_equinox(now_utc: datetime) -> datetime:
     year = now_utc.year
-    candidate = get_vernal_equinox_datetime(year)
+    candidate = await _vernal_equinox_datetime(year)
     if candidate <= now_utc:
-        candidate = get_vernal_equinox_datetime(year + 1)
+        candidate = await _vernal_equinox_datetime(year + 1)
     return candidate
 
 @router.get("/equinox/next")
-def next_equinox():
+async def next_equinox():
     now = datetime.now(timezone.utc)
-    target = _next_vernal_equinox(now)
+    target = await _next_vernal_equinox(now)
     diff = target - now
     return {
         "utc": target.isoformat().replace("+00:00","Z"),
@@ -23,8 +26,8 @@ def next_equinox():
     }
 
 @router.get("/equinox/{year}")
-def equinox_year(year: int):
-    dt = get_vernal_equinox_datetime(year)
+async def equinox_year(year: int):
+    dt = await _vernal_equinox_datetime(year)
     return {
         "year": year,
         "utc": dt.isoformat().replace("+00:00","Z")
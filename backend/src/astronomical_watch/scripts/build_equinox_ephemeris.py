@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Equinox Ephemeris Builder
+
+Solves the vernal equinox for a range of years and writes the binary table that
+offline/ephemeris.py serves in O(1) (offline/equinox_ephemeris.bin by default).
+
+Usage:
+    python scripts/build_equinox_ephemeris.py [--start-year 1000] [--end-year 3000]
+                                              [--solver {precise,core}] [--output PATH]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR.parent))  # src/astronomical_watch/ for offline, solar, core
+
+from offline.ephemeris import DEFAULT_EPHEMERIS_FILE, build_ephemeris
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed equinox ephemeris")
+    parser.add_argument("--start-year", type=int, default=1000, help="First year (default: 1000)")
+    parser.add_argument("--end-year", type=int, default=3000, help="Last year (default: 3000)")
+    parser.add_argument("--solver", choices=["precise", "core"], default="precise",
+                        help="Equinox solver to tabulate (default: precise, as the service uses)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_EPHEMERIS_FILE,
+                        help=f"Output file (default: {DEFAULT_EPHEMERIS_FILE})")
+    args = parser.parse_args()
+
+    if args.end_year < args.start_year:
+        print("Error: --end-year must not be before --start-year")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    ephemeris = build_ephemeris(range(args.start_year, args.end_year + 1), solver=args.solver)
+    ephemeris.save(args.output)
+    elapsed = time.perf_counter() - start
+
+    print(f"Years {ephemeris.first_year}-{ephemeris.last_year} ({len(ephemeris.instants_us)} entries), "
+          f"source {ephemeris.source}, uncertainty {ephemeris.uncertainty_s} s")
+    print(f"Written to {args.output} ({args.output.stat().st_size} bytes, {elapsed:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
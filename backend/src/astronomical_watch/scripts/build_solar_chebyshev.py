@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Solar Longitude Chebyshev Table Builder
+
+Fits per-year Chebyshev surrogates of the Meeus light apparent solar longitude over the
+March equinox window and writes them to scripts/solar_chebyshev/, where
+compute_vernal_equinox_precise picks them up.
+
+Usage:
+    python scripts/build_solar_chebyshev.py [--start-year 1800] [--end-year 2200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR.parent))  # src/astronomical_watch/ for solar, astro, core
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build Chebyshev solar longitude tables")
+    parser.add_argument("--start-year", type=int, default=1800, help="First year (default: 1800)")
+    parser.add_argument("--end-year", type=int, default=2200, help="Last year (default: 2200)")
+    args = parser.parse_args()
+
+    if args.end_year < args.start_year:
+        print("Error: --end-year must not be before --start-year")
+        sys.exit(1)
+
+    from solar.equinox_precise import SURROGATE_MODEL, build_equinox_surrogate
+    from solar.solar_chebyshev import table_path
+
+    start = time.perf_counter()
+    table = build_equinox_surrogate(args.start_year, args.end_year)
+    elapsed = time.perf_counter() - start
+    print(f"{SURROGATE_MODEL}: years {table.first_year}-{table.last_year}, "
+          f"degree {table.coefficients.shape[1] - 1}")
+    print(f"  verified max error: {table.max_error_arcsec:.2e} arcsec")
+    print(f"  written to {table_path(SURROGATE_MODEL)} ({elapsed:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@
 VSOP87D Earth Coefficient Generator
 
 Downloads VSOP87D Earth data and generates Python coefficient files with configurable
-precision based on amplitude thresholds.
+precision based on amplitude thresholds. Each set is also written in a compact binary
+format (.bin) that core/vsop87_earth.py memory-maps instead of importing Python source.
 
 Usage:
     python scripts/generate_vsop87.py [--threshold AMPLITUDE] [--auto-upgrade --target-arcsec ARCSEC]
@@ -20,11 +21,17 @@ Examples:
 """
 
 import argparse
+import json
+import math
+import os
+import tempfile
 import urllib.request
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 import sys
 
+import numpy as np
+
 # Constants
 RAD_TO_ARCSEC = 206264.806247096  # radians to arcseconds conversion
 VSOP87D_URL = "https://ftp.imcce.fr/pub/ephem/planets/vsop87/vsop87d.ear"
@@ -32,6 +39,23 @@ SCRIPT_DIR = Path(__file__).parent
 DATA_FILE = SCRIPT_DIR / "vsop87d.ear"
 OUTPUT_DIR = SCRIPT_DIR / "vsop87_coefficients"
 
+# Manifest read by core/vsop87_earth.py (COEFFICIENT_MANIFEST there, keep both in sync)
+MANIFEST_NAME = "index.json"
+COEFFICIENT_PATTERNS = ("vsop87d_earth_*.bin", "vsop87d_earth_*.py")
+
+# Binary format, must match BINARY_HEADER in core/vsop87_earth.py
+SERIES_NAMES = [f"{coord}{power}" for coord in "LBR" for power in range(6)]
+BINARY_MAGIC = b"VSOP87DB"
+BINARY_VERSION = 1
+BINARY_HEADER = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("n_series", "<u4"),
+    ("error_arcsec", "<f8"),
+    ("threshold", "<f8"),
+    ("offsets", "<u8", (len(SERIES_NAMES) + 1,)),
+])
+
 def download_vsop87d_file():
     """Download VSOP87D.EAR file if not present locally."""
     if DATA_FILE.exists():
@@ -324,6 +348,83 @@ AMPLITUDE_THRESHOLD = {threshold}
 CONSERVATIVE_ERROR_ARCSEC = {error_bound:.6f}
 '''.format(threshold=repr(threshold), error_bound=error_bound))
 
+def generate_binary_module(series_data: Dict[str, List[Tuple[float, float, float]]],
+                           threshold: Optional[float], error_bound: float,
+                           output_file: Path):
+    """
+    Write coefficients in the binary format loaded by core/vsop87_earth.py.
+    
+    Layout: a 184-byte little-endian header (magic, version, series count, error bound,
+    threshold, per-series row offsets) followed by packed float64 (A, B, C) triplets.
+    """
+    print(f"Generating binary coefficients: {output_file}")
+    
+    blocks = [np.asarray(series_data.get(name, []), dtype="<f8").reshape(-1, 3) for name in SERIES_NAMES]
+    header = np.zeros(1, dtype=BINARY_HEADER)
+    header["magic"] = BINARY_MAGIC
+    header["version"] = BINARY_VERSION
+    header["n_series"] = len(SERIES_NAMES)
+    header["error_arcsec"] = error_bound
+    header["threshold"] = math.nan if threshold is None else threshold
+    header["offsets"][0, 1:] = np.cumsum([len(block) for block in blocks])
+    
+    with open(output_file, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(np.concatenate(blocks).tobytes())
+
+def _coefficient_file_error_bound(path: Path) -> Optional[float]:
+    """Error bound from a generated file's binary header or "Conservative error bound" line."""
+    if path.suffix == '.bin':
+        with open(path, 'rb') as f:
+            raw = f.read(BINARY_HEADER.itemsize)
+        if len(raw) < BINARY_HEADER.itemsize:
+            return None
+        header = np.frombuffer(raw, dtype=BINARY_HEADER, count=1)[0]
+        if header["magic"] != BINARY_MAGIC or header["version"] != BINARY_VERSION:
+            return None
+        return float(header["error_arcsec"])
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('Conservative error bound') and 'arcseconds' in line:
+                try:
+                    return float(line.split(':', 1)[1].split()[0])
+                except (IndexError, ValueError):
+                    return None
+            if line.startswith('L0 = ['):
+                break
+    return None
+
+def write_manifest(coeff_dir: Path = OUTPUT_DIR) -> Path:
+    """
+    Write the manifest (file name -> mtime_ns, size, error bound) of a coefficient directory.
+    
+    core/vsop87_earth.py only reads it, so selecting a file at runtime needs no coefficient
+    file reads. It is written to a per-process temporary file and renamed into place, so
+    readers never see a partial manifest.
+    """
+    files = {}
+    for path in sorted(p for pattern in COEFFICIENT_PATTERNS for p in coeff_dir.glob(pattern)):
+        st = path.stat()
+        files[path.name] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "error_arcsec": _coefficient_file_error_bound(path),
+        }
+    
+    manifest_path = coeff_dir / MANIFEST_NAME
+    fd, tmp_name = tempfile.mkstemp(prefix=f"{MANIFEST_NAME}.{os.getpid()}.", suffix=".tmp", dir=coeff_dir)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "files": files}, f, indent=2)
+        os.replace(tmp_name, manifest_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return manifest_path
+
 def main():
     parser = argparse.ArgumentParser(description='Generate VSOP87D Earth coefficients')
     parser.add_argument('--threshold', type=float, 
@@ -370,9 +471,14 @@ def main():
         output_file = OUTPUT_DIR / f"vsop87d_earth_{suffix}.py"
     
     generate_python_module(truncated_data, threshold, error_bound, output_file)
+    binary_file = output_file.with_suffix('.bin')
+    generate_binary_module(truncated_data, threshold, error_bound, binary_file)
+    manifest_file = write_manifest(output_file.parent)
     
     print("\nGeneration complete!")
     print(f"Output file: {output_file}")
+    print(f"Binary file: {binary_file}")
+    print(f"Manifest: {manifest_file}")
     print(f"Error bound: {error_bound:.3f} arcseconds")
 
 if __name__ == "__main__":
@@ -3,16 +3,23 @@ Facade service for vernal equinox calculation with hybrid precision.
 Coordinates internet fetch, analytic calculation, and approximation methods.
 """
 from __future__ import annotations
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import os
+import queue
+import threading
+import time
 import traceback
 
 from solar.equinox_precise import compute_vernal_equinox_precise, validate_equinox_solution
 from net.equinox_fetch import fetch_equinox_datetime, is_fetch_configured
 from offline.cache import (
     get_cached_equinox, set_cached_equinox, create_entry, 
-    parse_cached_datetime, EquinoxEntry
+    parse_cached_datetime, EquinoxEntry, equinox_compute_lock
 )
+from offline.ephemeris import ephemeris_entry
 from astronomical_watch import compute_vernal_equinox  # Legacy approximation
 
 # Default precision ordering
@@ -26,6 +33,23 @@ UNCERTAINTY_APPROX = 10800.0    # 3 hours for legacy approximation
 # Network timeout for internet fetch
 INTERNET_FETCH_TIMEOUT = 10.0
 
+# Stale-while-revalidate: cached answers are returned immediately, and a background thread
+# upgrades lower-precision entries and re-verifies entries older than REFRESH_MAX_AGE_SECONDS.
+PRECISION_RANK = {"approx": 0, "analytic": 1, "internet": 2}
+REFRESH_MAX_AGE_SECONDS = float(os.environ.get("ASTRON_EQUINOX_REFRESH_AGE", str(30 * 86400)))
+REFRESH_RETRY_SECONDS = 600.0  # minimum time between refresh attempts for one year
+
+_refresh_queue: "queue.Queue[Tuple[int, Tuple[str, ...]]]" = queue.Queue()
+_refresh_pending: set = set()
+_refresh_attempted: Dict[int, float] = {}  # year -> time.monotonic() of last scheduling
+_refresh_lock = threading.Lock()
+_refresh_thread: Optional[threading.Thread] = None
+
+# Single-flight: one computation per (year, prefer_order) at a time; concurrent callers
+# (threads or coroutines) wait for the same future and get its result or exception.
+_inflight: Dict[Tuple[int, Tuple[str, ...]], "Future[Dict[str, Any]]"] = {}
+_inflight_lock = threading.Lock()
+
 
 def get_vernal_equinox(
     year: int, 
@@ -34,6 +58,9 @@ def get_vernal_equinox(
     """
     Get vernal equinox using hybrid method with specified preference order.
     
+    Concurrent callers asking for the same uncached year share one computation; if it
+    fails, all of them get its exception.
+    
     Args:
         year: Target year
         prefer_order: Tuple of method preferences ("internet", "analytic", "approx")
@@ -44,52 +71,123 @@ def get_vernal_equinox(
         - precision: Method used ("internet", "analytic", or "approx")
         - uncertainty_s: Estimated uncertainty in seconds
         - source: Description of method/source used
-        - cached: Whether result came from cache
+        - cached: Whether result came from cache (or the precomputed ephemeris)
         - retrieved_at: ISO timestamp when computed/fetched
     """
-    # Check cache first
+    result = _lookup_precomputed(year, prefer_order)
+    if result:
+        return result
+    
+    future, leader = _join_flight(year, prefer_order)
+    if leader:
+        _run_flight(future, year, prefer_order)
+    return dict(future.result())
+
+
+async def get_vernal_equinox_async(
+    year: int,
+    prefer_order: Tuple[str, ...] = DEFAULT_PREFER_ORDER
+) -> Dict[str, Any]:
+    """
+    Asyncio variant of get_vernal_equinox.
+    
+    The cache lookup runs in the default executor too: it may re-read the cache file, wait
+    on its lock or on a busy SQLite database, none of which may stall the event loop. A
+    computation runs there as well, and coroutines (and threads) asking for the same year
+    meanwhile all await that one computation instead of occupying a worker thread each.
+    """
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, _lookup_precomputed, year, prefer_order)
+    if result:
+        return result
+    
+    future, leader = _join_flight(year, prefer_order)
+    if leader:
+        loop.run_in_executor(None, _run_flight, future, year, prefer_order)
+    return dict(await asyncio.wrap_future(future))
+
+
+def _lookup_precomputed(year: int, prefer_order: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """
+    Answer from the cache or the ephemeris, without computing anything.
+    
+    Precedence: a cached entry, then the precomputed ephemeris (1000-3000 CE), then None
+    (the caller runs the method chain). Either answer is returned at once; methods ranked
+    more precise than it run afterwards in the background.
+    """
+    # Check cache first; improve it in the background if it is low-precision or old
     cached_entry = get_cached_equinox(year)
-    if cached_entry:
-        try:
-            dt = parse_cached_datetime(cached_entry)
-            return {
-                "utc": cached_entry.utc,
-                "precision": cached_entry.precision,
-                "uncertainty_s": cached_entry.uncertainty_s,
-                "source": cached_entry.source,
-                "cached": True,
-                "retrieved_at": cached_entry.retrieved_at,
-                "datetime": dt
-            }
-        except ValueError:
-            # Cache entry is corrupted, continue with calculation
-            pass
+    result = _entry_result(cached_entry)
+    if result:
+        if _needs_refresh(cached_entry, prefer_order):
+            _schedule_refresh(year, prefer_order)
+        return result
     
-    # Try methods in preference order
+    # The precomputed ephemeris is the O(1) form of the analytic method and answers before
+    # any on-demand work, even when "internet" is ranked first: the remote fetch then only
+    # upgrades the answer in the background.
+    if _ephemeris_answers_first(prefer_order):
+        entry = ephemeris_entry(year)
+        result = _entry_result(entry)
+        if result:
+            if _upgrade_methods(entry, prefer_order):
+                _schedule_refresh(year, prefer_order)
+            return result
+    return None
+
+
+def _ephemeris_answers_first(prefer_order: Tuple[str, ...]) -> bool:
+    """
+    True if "analytic" is in prefer_order and no less precise method that is available
+    (an explicitly preferred "approx") is ranked before it.
+    """
+    for method in prefer_order:
+        if method == "analytic":
+            return True
+        if _method_available(method) and PRECISION_RANK[method] < PRECISION_RANK["analytic"]:
+            return False
+    return False
+
+
+def _join_flight(year: int, prefer_order: Tuple[str, ...]) -> Tuple["Future[Dict[str, Any]]", bool]:
+    """Return the in-flight future for this request and whether the caller must run it."""
+    key = (year, tuple(prefer_order))
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = Future()
+        _inflight[key] = future
+        return future, True
+
+
+def _run_flight(future: "Future[Dict[str, Any]]", year: int, prefer_order: Tuple[str, ...]) -> None:
+    """Compute the equinox and publish the result (or exception) to every waiter."""
+    try:
+        # Only one worker process computes a given year; the others wait and then read its result
+        with equinox_compute_lock(year):
+            result = _entry_result(get_cached_equinox(year))
+            if not result:
+                result = _compute_vernal_equinox(year, prefer_order)
+        future.set_result(result)
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        with _inflight_lock:
+            _inflight.pop((year, tuple(prefer_order)), None)
+
+
+def _compute_vernal_equinox(year: int, prefer_order: Tuple[str, ...]) -> Dict[str, Any]:
+    """Try methods in preference order and cache the first result."""
     errors = []
     
     for method in prefer_order:
         try:
-            if method == "internet":
-                result = _try_internet_method(year)
-                if result:
-                    _cache_result(year, result)
-                    result["cached"] = False
-                    return result
-                    
-            elif method == "analytic":
-                result = _try_analytic_method(year)
-                if result:
-                    _cache_result(year, result)
-                    result["cached"] = False
-                    return result
-                    
-            elif method == "approx":
-                result = _try_approx_method(year)
-                if result:
-                    _cache_result(year, result)
-                    result["cached"] = False
-                    return result
+            result = _try_method(method, year)
+            if result:
+                _cache_result(year, result)
+                result.setdefault("cached", False)
+                return result
             
         except Exception as e:
             errors.append(f"{method}: {str(e)}")
@@ -100,6 +198,26 @@ def get_vernal_equinox(
     raise RuntimeError(error_msg)
 
 
+def _entry_result(entry: Optional[EquinoxEntry]) -> Optional[Dict[str, Any]]:
+    """Convert a cached/precomputed entry to a result dictionary."""
+    if not entry:
+        return None
+    try:
+        dt = parse_cached_datetime(entry)
+    except ValueError:
+        # Entry is corrupted, continue with calculation
+        return None
+    return {
+        "utc": entry.utc,
+        "precision": entry.precision,
+        "uncertainty_s": entry.uncertainty_s,
+        "source": entry.source,
+        "cached": True,
+        "retrieved_at": entry.retrieved_at,
+        "datetime": dt
+    }
+
+
 def _try_internet_method(year: int) -> Optional[Dict[str, Any]]:
     """Try to get equinox from internet source."""
     if not is_fetch_configured():
@@ -176,6 +294,125 @@ def _try_approx_method(year: int) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _try_method(method: str, year: int) -> Optional[Dict[str, Any]]:
+    if method == "internet":
+        return _try_internet_method(year)
+    if method == "analytic":
+        # The shipped ephemeris holds analytic results; the solver runs only for other years
+        return _entry_result(ephemeris_entry(year)) or _try_analytic_method(year)
+    if method == "approx":
+        return _try_approx_method(year)
+    return None
+
+
+def _method_available(method: str) -> bool:
+    """Whether ``method`` can be tried at all (internet needs a configured source)."""
+    if method == "internet":
+        return is_fetch_configured()
+    return method in PRECISION_RANK
+
+
+def _entry_age_seconds(entry: EquinoxEntry) -> float:
+    """Seconds since the entry was computed/fetched (infinite if unknown)."""
+    try:
+        retrieved = datetime.fromisoformat(entry.retrieved_at.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return float("inf")
+    if retrieved.tzinfo is None:
+        retrieved = retrieved.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - retrieved).total_seconds()
+
+
+def _upgrade_methods(entry: EquinoxEntry, prefer_order: Tuple[str, ...]) -> List[str]:
+    """Methods in prefer_order that would give a more precise answer than ``entry``."""
+    rank = PRECISION_RANK.get(entry.precision, -1)
+    return [
+        method for method in prefer_order
+        if PRECISION_RANK.get(method, -1) > rank and _method_available(method)
+    ]
+
+
+def _needs_refresh(entry: EquinoxEntry, prefer_order: Tuple[str, ...]) -> bool:
+    return bool(_upgrade_methods(entry, prefer_order)) or _entry_age_seconds(entry) > REFRESH_MAX_AGE_SECONDS
+
+
+def refresh_equinox(year: int, prefer_order: Tuple[str, ...] = DEFAULT_PREFER_ORDER) -> Optional[Dict[str, Any]]:
+    """
+    Upgrade or re-verify the cached (or ephemeris) entry for ``year`` (runs on the
+    refresher thread).
+    
+    Tries the methods that would improve precision first; an entry that is only old is
+    recomputed with the methods at its own precision or better. The first success is
+    stored with a new retrieved_at and precision.
+    
+    Returns:
+        The new result, or None if the entry was already fine or nothing succeeded
+    """
+    with equinox_compute_lock(year):
+        # Another worker may have refreshed it meanwhile
+        entry = get_cached_equinox(year)
+        if entry is None:
+            # An uncached year was answered from the ephemeris: only an upgrade is worth it
+            entry = ephemeris_entry(year)
+            if entry is None or not _upgrade_methods(entry, prefer_order):
+                return None
+        elif not _needs_refresh(entry, prefer_order):
+            return None
+        
+        methods = _upgrade_methods(entry, prefer_order)
+        if not methods:
+            rank = PRECISION_RANK.get(entry.precision, -1)
+            methods = [m for m in prefer_order if PRECISION_RANK.get(m, -1) >= rank]
+        
+        for method in methods:
+            try:
+                result = _try_method(method, year)
+            except Exception:
+                continue
+            if result:
+                _cache_result(year, result)
+                result.setdefault("cached", False)
+                return result
+        return None
+
+
+def _refresh_worker() -> None:
+    while True:
+        year, prefer_order = _refresh_queue.get()
+        try:
+            refresh_equinox(year, prefer_order)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            with _refresh_lock:
+                _refresh_pending.discard(year)
+            _refresh_queue.task_done()
+
+
+def _schedule_refresh(year: int, prefer_order: Tuple[str, ...]) -> None:
+    """Queue a background refresh of ``year`` unless one is pending or was tried recently."""
+    global _refresh_thread
+    now = time.monotonic()
+    with _refresh_lock:
+        if year in _refresh_pending:
+            return
+        last = _refresh_attempted.get(year)
+        if last is not None and now - last < REFRESH_RETRY_SECONDS:
+            return
+        _refresh_pending.add(year)
+        _refresh_attempted[year] = now
+        
+        if _refresh_thread is None or not _refresh_thread.is_alive():
+            _refresh_thread = threading.Thread(target=_refresh_worker, name="equinox-refresh", daemon=True)
+            _refresh_thread.start()
+    _refresh_queue.put((year, tuple(prefer_order)))
+
+
+def wait_for_background_refresh() -> None:
+    """Block until all queued refreshes have finished (for tests and shutdown)."""
+    _refresh_queue.join()
+
+
 def _cache_result(year: int, result: Dict[str, Any]) -> None:
     """Cache the equinox result."""
     try:
@@ -233,6 +470,11 @@ def get_service_status() -> Dict[str, Any]:
         "default_prefer_order": list(DEFAULT_PREFER_ORDER),
         "cache_status": get_cache_stats(),
         "internet_status": get_fetch_status(),
+        "background_refresh": {
+            "running": _refresh_thread is not None and _refresh_thread.is_alive(),
+            "pending_years": sorted(_refresh_pending),
+            "max_age_s": REFRESH_MAX_AGE_SECONDS
+        },
         "uncertainty_estimates": {
             "internet": UNCERTAINTY_INTERNET,
             "analytic": UNCERTAINTY_ANALYTIC,
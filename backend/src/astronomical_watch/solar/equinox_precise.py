@@ -6,8 +6,12 @@ from __future__ import annotations
 import math
 from datetime import datetime, timezone, timedelta
 from typing import Tuple, Optional, Callable
-from solar.solar_longitude_light import solar_longitude_from_datetime, vernal_equinox_solar_longitude_target
-from astro.timescales import ensure_utc
+from solar.solar_longitude_light import (
+    apparent_solar_longitude_rad, solar_longitude_from_datetime, vernal_equinox_solar_longitude_target
+)
+from astro.timescales import jd_utc_to_datetime, timescales_from_datetime
+from core.equinox import vernal_equinox_seed_jde
+from solar.solar_chebyshev import build_solar_longitude_table, load_solar_longitude_table, table_path
 
 # Constants
 SECONDS_PER_DAY = 86400.0
@@ -15,6 +19,13 @@ MAX_ITERATIONS = 30
 CONVERGENCE_TOLERANCE_SECONDS = 1.0  # Target accuracy in seconds
 PI = math.pi
 TAU = 2.0 * PI
+SURROGATE_MODEL = "meeus_light"  # Chebyshev table of apparent_solar_longitude_rad (TT argument)
+MEAN_SOLAR_RATE_RAD_PER_SEC = TAU / (365.2422 * SECONDS_PER_DAY)
+# Bracket end placed this far past the mean-rate prediction from the Meeus estimate. Over
+# 1000-3000 the estimate is up to about 12 minutes off this model's root but the prediction
+# is within 0.2 minutes, so the first bracket virtually always holds.
+SEED_HALF_WIDTH_DAYS = 15.0 / 1440.0
+MAX_BRACKET_OVERSHOOT_DAYS = 4.0
 
 
 def angle_difference(a: float, b: float) -> float:
@@ -51,6 +62,69 @@ def solar_longitude_objective(dt: datetime) -> float:
     return angle_difference(lambda_app, target)
 
 
+def solar_longitude_objective_jd(jd_tt: float) -> float:
+    """
+    Objective function on a TT Julian Day (no datetime or ΔT work per evaluation).
+    
+    Args:
+        jd_tt: Julian Day (TT) to evaluate
+    
+    Returns:
+        Signed angular difference from vernal equinox (radians)
+    """
+    return angle_difference(apparent_solar_longitude_rad(jd_tt), vernal_equinox_solar_longitude_target())
+
+
+def _march_bracket(year: int) -> Tuple[float, float, float, float]:
+    """
+    Bracket of the equinox as (jd_a, f(jd_a), jd_b, f(jd_b)) in TT, objective negative at jd_a.
+    
+    The Meeus estimate of the equinox is evaluated once; a step at the mean solar rate from
+    there predicts the root of this model (up to about 12 minutes away from the estimate),
+    and the other end is placed SEED_HALF_WIDTH_DAYS past the prediction, widened if that
+    is not enough. Years outside the Meeus range use the fixed March windows.
+    """
+    seed = vernal_equinox_seed_jde(year)
+    if seed is not None:
+        f_seed = solar_longitude_objective_jd(seed)
+        if f_seed == 0:
+            return seed, f_seed, seed, f_seed
+        predicted = -f_seed / (MEAN_SOLAR_RATE_RAD_PER_SEC * SECONDS_PER_DAY)
+        direction = math.copysign(1.0, predicted)
+        overshoot = SEED_HALF_WIDTH_DAYS
+        while overshoot <= MAX_BRACKET_OVERSHOOT_DAYS:
+            jd = seed + predicted + direction * overshoot
+            f_jd = solar_longitude_objective_jd(jd)
+            if f_seed * f_jd <= 0:
+                return (seed, f_seed, jd, f_jd) if f_seed < 0 else (jd, f_jd, seed, f_seed)
+            overshoot *= 2.0
+    
+    # Start with March 18-22 window, expand to March 16-24 if there is no sign change
+    for first_day, last_day in ((18, 22), (16, 24)):
+        jd_a = timescales_from_datetime(datetime(year, 3, first_day, tzinfo=timezone.utc)).jd_tt
+        jd_b = timescales_from_datetime(datetime(year, 3, last_day, tzinfo=timezone.utc)).jd_tt
+        obj_a = solar_longitude_objective_jd(jd_a)
+        obj_b = solar_longitude_objective_jd(jd_b)
+        if obj_a * obj_b <= 0:
+            # Make sure we have the correct order (negative to positive)
+            return (jd_b, obj_b, jd_a, obj_a) if obj_a > obj_b else (jd_a, obj_a, jd_b, obj_b)
+    raise ValueError(f"Cannot find sign change for equinox in year {year}")
+
+
+def find_march_bracket_jd(year: int) -> Tuple[float, float]:
+    """
+    Find a bracketing interval of the equinox as TT Julian Days, seeded by the Meeus estimate.
+    
+    Args:
+        year: Target year
+    
+    Returns:
+        Tuple of (start_jd_tt, end_jd_tt), objective negative at start and positive at end
+    """
+    jd_a, _, jd_b, _ = _march_bracket(year)
+    return jd_a, jd_b
+
+
 def find_march_bracket(year: int) -> Tuple[datetime, datetime]:
     """
     Find a bracketing interval around March 20 where the equinox occurs.
@@ -61,108 +135,81 @@ def find_march_bracket(year: int) -> Tuple[datetime, datetime]:
     Returns:
         Tuple of (start_dt, end_dt) that bracket the equinox
     """
-    # Start with March 18-22 window
-    start_dt = datetime(year, 3, 18, tzinfo=timezone.utc)
-    end_dt = datetime(year, 3, 22, tzinfo=timezone.utc)
-    
-    # Check if we have a sign change in this window
-    obj_start = solar_longitude_objective(start_dt)
-    obj_end = solar_longitude_objective(end_dt)
-    
-    # If no sign change, expand the window
-    if obj_start * obj_end > 0:
-        # Try expanding to March 16-24
-        start_dt = datetime(year, 3, 16, tzinfo=timezone.utc)
-        end_dt = datetime(year, 3, 24, tzinfo=timezone.utc)
-        
-        obj_start = solar_longitude_objective(start_dt)
-        obj_end = solar_longitude_objective(end_dt)
-        
-        if obj_start * obj_end > 0:
-            raise ValueError(f"Cannot find sign change for equinox in year {year}")
-    
-    # Make sure we have the correct order (negative to positive)
-    if obj_start > obj_end:
-        start_dt, end_dt = end_dt, start_dt
-    
-    return start_dt, end_dt
+    jd_a, jd_b = find_march_bracket_jd(year)
+    return tt_jd_to_datetime(jd_a), tt_jd_to_datetime(jd_b)
 
 
-def bisection_solve(
-    func: Callable[[datetime], float],
-    dt_a: datetime,
-    dt_b: datetime,
-    tolerance_sec: float = CONVERGENCE_TOLERANCE_SECONDS,
-    max_iter: int = MAX_ITERATIONS
-) -> datetime:
+def bisection_solve_float(
+    func: Callable[[float], float],
+    a: float,
+    b: float,
+    tolerance: float,
+    max_iter: int = MAX_ITERATIONS,
+    fa: Optional[float] = None,
+    fb: Optional[float] = None
+) -> float:
     """
-    Solve for root using bisection method.
+    Solve for root using bisection method on a float argument (e.g. TT Julian Day).
     
     Args:
         func: Objective function
-        dt_a, dt_b: Bracketing datetimes
-        tolerance_sec: Convergence tolerance in seconds
+        a, b: Bracketing arguments
+        tolerance: Convergence tolerance, in units of the argument
         max_iter: Maximum iterations
+        fa, fb: func(a) and func(b) if already known (e.g. from bracketing)
     
     Returns:
-        Root datetime
+        Root argument
     """
-    fa = func(dt_a)
-    fb = func(dt_b)
+    fa = func(a) if fa is None else fa
+    fb = func(b) if fb is None else fb
     
     if fa * fb > 0:
         raise ValueError("Function values must have opposite signs at endpoints")
     
     for iteration in range(max_iter):
-        # Calculate midpoint
-        mid_seconds = (dt_a.timestamp() + dt_b.timestamp()) / 2.0
-        dt_mid = datetime.fromtimestamp(mid_seconds, tz=timezone.utc)
-        
-        fm = func(dt_mid)
+        mid = (a + b) / 2.0
+        fm = func(mid)
         
         # Check convergence
-        interval_sec = abs(dt_b.timestamp() - dt_a.timestamp())
-        if interval_sec <= tolerance_sec:
-            return dt_mid
+        if abs(b - a) <= tolerance:
+            return mid
         
         # Choose new bracket
         if fa * fm < 0:
-            dt_b = dt_mid
-            fb = fm
+            b = mid
         else:
-            dt_a = dt_mid
+            a = mid
             fa = fm
     
     # Return best estimate even if not converged
-    mid_seconds = (dt_a.timestamp() + dt_b.timestamp()) / 2.0
-    return datetime.fromtimestamp(mid_seconds, tz=timezone.utc)
+    return (a + b) / 2.0
 
 
-def brent_solve(
-    func: Callable[[datetime], float],
-    dt_a: datetime,
-    dt_b: datetime,
-    tolerance_sec: float = CONVERGENCE_TOLERANCE_SECONDS,
-    max_iter: int = MAX_ITERATIONS
-) -> datetime:
+def brent_solve_float(
+    func: Callable[[float], float],
+    a: float,
+    b: float,
+    tolerance: float,
+    max_iter: int = MAX_ITERATIONS,
+    fa: Optional[float] = None,
+    fb: Optional[float] = None
+) -> float:
     """
-    Solve for root using Brent's method (more sophisticated than bisection).
+    Solve for root using Brent's method on a float argument (e.g. TT Julian Day).
     
     Args:
         func: Objective function
-        dt_a, dt_b: Bracketing datetimes  
-        tolerance_sec: Convergence tolerance in seconds
+        a, b: Bracketing arguments
+        tolerance: Convergence tolerance, in units of the argument
         max_iter: Maximum iterations
+        fa, fb: func(a) and func(b) if already known (e.g. from bracketing)
     
     Returns:
-        Root datetime
+        Root argument
     """
-    # Convert to timestamps for numerical work
-    a = dt_a.timestamp()
-    b = dt_b.timestamp()
-    
-    fa = func(dt_a)
-    fb = func(dt_b)
+    fa = func(a) if fa is None else fa
+    fb = func(b) if fb is None else fb
     
     if fa * fb > 0:
         raise ValueError("Function values must have opposite signs at endpoints")
@@ -173,10 +220,11 @@ def brent_solve(
     
     c = a
     fc = fa
+    d = c  # c from the step before; only read after an interpolation step
     mflag = True
     
     for iteration in range(max_iter):
-        if abs(b - a) <= tolerance_sec:
+        if fb == 0 or abs(b - a) <= tolerance:
             break
             
         if fa != fc and fb != fc:
@@ -189,12 +237,13 @@ def brent_solve(
             s = b - fb * (b - a) / (fb - fa)
         
         # Check if we should use bisection instead
+        q = (3*a + b) / 4
         use_bisection = (
-            not ((3*a + b)/4 <= s <= b) or
+            not (min(q, b) <= s <= max(q, b)) or
             (mflag and abs(s - b) >= abs(b - c)/2) or
-            (not mflag and abs(s - b) >= abs(c - c)/2) or
-            (mflag and abs(b - c) < tolerance_sec) or
-            (not mflag and abs(c - c) < tolerance_sec)
+            (not mflag and abs(s - b) >= abs(c - d)/2) or
+            (mflag and abs(b - c) < tolerance) or
+            (not mflag and abs(c - d) < tolerance)
         )
         
         if use_bisection:
@@ -202,11 +251,14 @@ def brent_solve(
             mflag = True
         else:
             mflag = False
+            # Step at least tolerance/2 towards a, so the bracket collapses instead of
+            # creeping up on the root from one side
+            if abs(s - b) < tolerance / 2:
+                s = b + math.copysign(tolerance / 2, a - b)
         
-        # Evaluate at s
-        dt_s = datetime.fromtimestamp(s, tz=timezone.utc)
-        fs = func(dt_s)
+        fs = func(s)
         
+        d = c
         c = b
         fc = fb
         
@@ -221,14 +273,128 @@ def brent_solve(
             a, b = b, a
             fa, fb = fb, fa
     
-    return datetime.fromtimestamp(b, tz=timezone.utc)
+    return b
+
+
+def bisection_solve(
+    func: Callable[[datetime], float],
+    dt_a: datetime,
+    dt_b: datetime,
+    tolerance_sec: float = CONVERGENCE_TOLERANCE_SECONDS,
+    max_iter: int = MAX_ITERATIONS
+) -> datetime:
+    """
+    Solve for root using bisection method.
+    
+    Args:
+        func: Objective function
+        dt_a, dt_b: Bracketing datetimes
+        tolerance_sec: Convergence tolerance in seconds
+        max_iter: Maximum iterations
+    
+    Returns:
+        Root datetime
+    """
+    # Iterate on Unix seconds; datetimes are built only for func
+    root = bisection_solve_float(
+        lambda s: func(datetime.fromtimestamp(s, tz=timezone.utc)),
+        dt_a.timestamp(), dt_b.timestamp(), tolerance_sec, max_iter
+    )
+    return datetime.fromtimestamp(root, tz=timezone.utc)
+
+
+def brent_solve(
+    func: Callable[[datetime], float],
+    dt_a: datetime,
+    dt_b: datetime,
+    tolerance_sec: float = CONVERGENCE_TOLERANCE_SECONDS,
+    max_iter: int = MAX_ITERATIONS
+) -> datetime:
+    """
+    Solve for root using Brent's method (more sophisticated than bisection).
+    
+    Args:
+        func: Objective function
+        dt_a, dt_b: Bracketing datetimes  
+        tolerance_sec: Convergence tolerance in seconds
+        max_iter: Maximum iterations
+    
+    Returns:
+        Root datetime
+    """
+    # Iterate on Unix seconds; datetimes are built only for func
+    root = brent_solve_float(
+        lambda s: func(datetime.fromtimestamp(s, tz=timezone.utc)),
+        dt_a.timestamp(), dt_b.timestamp(), tolerance_sec, max_iter
+    )
+    return datetime.fromtimestamp(root, tz=timezone.utc)
+
+
+def solve_equinox_jd(
+    func: Callable[[float], float],
+    jd_a: float,
+    jd_b: float,
+    method: str = "brent",
+    tolerance_sec: float = CONVERGENCE_TOLERANCE_SECONDS,
+    max_iter: int = MAX_ITERATIONS,
+    fa: Optional[float] = None,
+    fb: Optional[float] = None
+) -> float:
+    """Root of func (of a TT Julian Day) between jd_a and jd_b with the selected method."""
+    solve = brent_solve_float if method == "brent" else bisection_solve_float
+    return solve(func, jd_a, jd_b, tolerance_sec / SECONDS_PER_DAY, max_iter, fa, fb)
+
+
+def tt_jd_to_datetime(jd_tt: float) -> datetime:
+    """
+    Convert a TT Julian Day back to a UTC datetime (inverse of timescales_from_datetime).
+    
+    ΔT is evaluated at the UTC instant, so one refinement step is enough: ΔT changes by
+    far less than a microsecond over the ~1 minute correction.
+    """
+    dt = jd_utc_to_datetime(jd_tt)
+    for _ in range(2):
+        dt = jd_utc_to_datetime(jd_tt - timescales_from_datetime(dt).delta_t / SECONDS_PER_DAY)
+    return dt
+
+
+def surrogate_equinox(year: int, tolerance_sec: float = CONVERGENCE_TOLERANCE_SECONDS) -> Optional[datetime]:
+    """
+    Solve the equinox on the precomputed Chebyshev surrogate of the light model.
+    
+    Args:
+        year: Target year
+        tolerance_sec: Accuracy the caller needs; the table is used only if its verified
+                       error (converted to time) is within it
+    
+    Returns:
+        Vernal equinox datetime (UTC), or None if no applicable table covers the year
+    """
+    table = load_solar_longitude_table(SURROGATE_MODEL)
+    if table is None or not table.covers(year):
+        return None
+    if table.max_error_rad / MEAN_SOLAR_RATE_RAD_PER_SEC > tolerance_sec:
+        return None
+    try:
+        jd_tt = table.solve_crossing(year, vernal_equinox_solar_longitude_target())
+    except ValueError:
+        return None
+    return tt_jd_to_datetime(jd_tt)
+
+
+def build_equinox_surrogate(first_year: int = 1800, last_year: int = 2200):
+    """Build and save the Chebyshev surrogate table used by surrogate_equinox."""
+    table = build_solar_longitude_table(apparent_solar_longitude_rad, SURROGATE_MODEL, first_year, last_year)
+    table.save(table_path(SURROGATE_MODEL))
+    return table
 
 
 def compute_vernal_equinox_precise(
     year: int,
     method: str = "brent",
     tolerance_sec: float = CONVERGENCE_TOLERANCE_SECONDS,
-    max_iter: int = MAX_ITERATIONS
+    max_iter: int = MAX_ITERATIONS,
+    use_surrogate: bool = True
 ) -> datetime:
     """
     Compute precise vernal equinox for given year using root finding.
@@ -238,6 +404,7 @@ def compute_vernal_equinox_precise(
         method: "brent" or "bisection"
         tolerance_sec: Convergence tolerance in seconds
         max_iter: Maximum iterations
+        use_surrogate: Root-find on the Chebyshev surrogate table when it covers the year
     
     Returns:
         Precise vernal equinox datetime (UTC)
@@ -248,16 +415,15 @@ def compute_vernal_equinox_precise(
     if method not in ["brent", "bisection"]:
         raise ValueError(f"Invalid method: {method}. Must be 'brent' or 'bisection'")
     
-    # Find bracketing interval
-    dt_a, dt_b = find_march_bracket(year)
-    
-    # Solve using selected method
-    if method == "brent":
-        result = brent_solve(solar_longitude_objective, dt_a, dt_b, tolerance_sec, max_iter)
-    else:
-        result = bisection_solve(solar_longitude_objective, dt_a, dt_b, tolerance_sec, max_iter)
+    if use_surrogate:
+        result = surrogate_equinox(year, tolerance_sec)
+        if result is not None:
+            return result
     
-    return ensure_utc(result)
+    # Find bracketing interval and solve on TT Julian Days; UTC only for the result
+    jd_a, fa, jd_b, fb = _march_bracket(year)
+    jd_tt = solve_equinox_jd(solar_longitude_objective_jd, jd_a, jd_b, method, tolerance_sec, max_iter, fa, fb)
+    return tt_jd_to_datetime(jd_tt)
 
 
 def validate_equinox_solution(dt: datetime, tolerance_deg: float = 0.01) -> bool:
@@ -287,28 +453,26 @@ def equinox_iteration_stats(year: int, method: str = "brent") -> dict:
     Returns:
         Dictionary with solution statistics
     """
-    dt_a, dt_b = find_march_bracket(year)
+    jd_a, jd_b = find_march_bracket_jd(year)
     
     # Track iterations manually
     iteration_count = 0
     final_residual = 0.0
     
-    def counting_objective(dt: datetime) -> float:
+    def counting_objective(jd_tt: float) -> float:
         nonlocal iteration_count, final_residual
         iteration_count += 1
-        result = solar_longitude_objective(dt)
+        result = solar_longitude_objective_jd(jd_tt)
         final_residual = result
         return result
     
-    if method == "brent":
-        solution = brent_solve(counting_objective, dt_a, dt_b)
-    else:
-        solution = bisection_solve(counting_objective, dt_a, dt_b)
+    solution = solve_equinox_jd(counting_objective, jd_a, jd_b, method)
+    dt_a, dt_b = tt_jd_to_datetime(jd_a), tt_jd_to_datetime(jd_b)
     
     return {
         "year": year,
         "method": method,
-        "solution": solution,
+        "solution": tt_jd_to_datetime(solution),
         "iterations": iteration_count,
         "final_residual_rad": final_residual,
         "final_residual_deg": final_residual * 180.0 / PI,
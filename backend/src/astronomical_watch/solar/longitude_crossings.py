@@ -0,0 +1,72 @@
+"""
+Batch solver for instants when the apparent solar longitude crosses given targets
+(equinoxes and solstices, the 24 solar terms, ...) over many years at once.
+All roots are refined together by vectorized Newton iteration on the light model.
+"""
+from __future__ import annotations
+from datetime import datetime
+from typing import Iterable, List
+import numpy as np
+from solar.solar_longitude_light import apparent_solar_longitude_deg_and_rate
+from solar.equinox_precise import CONVERGENCE_TOLERANCE_SECONDS, MAX_ITERATIONS, SECONDS_PER_DAY, tt_jd_to_datetime
+
+# March equinox, June solstice, September equinox, December solstice
+CARDINAL_POINTS_DEG = (0.0, 90.0, 180.0, 270.0)
+# 24 solar terms (jieqi), every 15 degrees starting from the March equinox
+SOLAR_TERMS_DEG = tuple(float(d) for d in range(0, 360, 15))
+
+# Mean longitude L0 = 280.46646 + 36000.76983 T (Meeus 25.2) at J2000 and its daily rate
+_MEAN_LONGITUDE_J2000_DEG = 280.46646
+_MEAN_LONGITUDE_RATE_DEG_PER_DAY = 36000.76983 / 36525.0
+
+
+def solve_solar_longitude_crossings(
+    targets_deg: Iterable[float],
+    year_range: Iterable[int],
+    tolerance_sec: float = CONVERGENCE_TOLERANCE_SECONDS,
+    max_iter: int = MAX_ITERATIONS
+) -> np.ndarray:
+    """
+    Solve all crossings of the target longitudes for every year simultaneously.
+
+    For year Y the crossings are those of the tropical year starting at Y's March equinox:
+    target 0° is the March equinox of Y, 270° the December solstice of Y, and targets past
+    about 280° fall in January-March of Y+1.
+
+    Args:
+        targets_deg: Apparent solar longitudes in degrees (normalized to [0, 360))
+        year_range: Years to solve (e.g. range(1900, 2101))
+        tolerance_sec: Convergence tolerance in seconds (largest Newton step of the last pass)
+        max_iter: Maximum Newton iterations
+
+    Returns:
+        Array of TT Julian Days with shape (len(years), len(targets))
+    
+    Raises:
+        RuntimeError: If some root still moved by more than tolerance_sec in the last of
+                      max_iter iterations
+    """
+    targets = np.mod(np.asarray(list(targets_deg), dtype=float), 360.0)
+    years = np.asarray(list(year_range), dtype=float)
+    # Seed: invert the mean longitude, which is within about 2° of the apparent one
+    unwrapped = 360.0 * (years[:, None] - 1999.0) + targets[None, :]
+    jd = 2451545.0 + (unwrapped - _MEAN_LONGITUDE_J2000_DEG) / _MEAN_LONGITUDE_RATE_DEG_PER_DAY
+    if jd.size == 0:
+        return jd
+    for _ in range(max_iter):
+        lam, rate = apparent_solar_longitude_deg_and_rate(jd)
+        step = (np.mod(lam - targets + 180.0, 360.0) - 180.0) / rate
+        jd -= step
+        # Newton is quadratic: once every step is below the tolerance the error is far smaller
+        if np.max(np.abs(step)) * SECONDS_PER_DAY < tolerance_sec:
+            return jd
+    unconverged = int(np.count_nonzero(np.abs(step) * SECONDS_PER_DAY >= tolerance_sec))
+    raise RuntimeError(
+        f"{unconverged} of {jd.size} crossings did not converge to {tolerance_sec} s "
+        f"within {max_iter} iterations"
+    )
+
+
+def crossing_datetimes(jd_tt: np.ndarray) -> List[List[datetime]]:
+    """Convert a (years, targets) array from solve_solar_longitude_crossings to UTC datetimes."""
+    return [[tt_jd_to_datetime(float(jd)) for jd in row] for row in np.atleast_2d(jd_tt)]
@@ -0,0 +1,219 @@
+"""
+solar_chebyshev.py
+Precomputed Chebyshev surrogate of apparent solar longitude around the March equinox.
+
+For each year the longitude over a fixed March window is replaced by one Chebyshev
+polynomial, fitted to the full model at Chebyshev nodes. The build step measures the
+surrogate against the full model on a dense grid and stores that max error with the table,
+so callers can decide whether the surrogate is good enough for them.
+
+Root finding then needs only polynomial evaluations (value and analytic derivative),
+instead of a full model evaluation per iteration.
+"""
+from __future__ import annotations
+import math
+import threading
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from core.timebase import datetime_to_jd
+
+RAD_TO_ARCSEC = 180.0 * 3600.0 / math.pi
+
+# Default March window: 16 days from March 12 00:00 covers the equinox for 1000-3000 CE.
+WINDOW_START = (3, 12)
+WINDOW_DAYS = 16.0
+DEFAULT_DEGREE = 16
+CHECK_POINTS = 257  # dense grid per window used to verify the fit
+
+TABLE_DIR = Path(__file__).parent.parent / "scripts" / "solar_chebyshev"
+
+
+def table_path(model: str) -> Path:
+    """Location of the shipped/generated table for a longitude model."""
+    return TABLE_DIR / f"solar_longitude_{model}.npz"
+
+
+def window_start_jd(year: int) -> float:
+    """JD (in the model's time argument) where the March window of ``year`` starts."""
+    month, day = WINDOW_START
+    return datetime_to_jd(datetime(year, month, day, tzinfo=timezone.utc))
+
+
+def _wrap(lam):
+    """Map longitude to (-π, π] so the March window has no 2π jump."""
+    return np.remainder(np.asarray(lam, dtype=np.float64) + math.pi, 2 * math.pi) - math.pi
+
+
+@dataclass(frozen=True, eq=False)
+class SolarLongitudeTable:
+    """
+    Per-year Chebyshev coefficients of apparent solar longitude (radians, wrapped to (-π, π]).
+
+    coefficients[i] approximates the longitude over
+    [window_start[i], window_start[i] + window_days] for year first_year + i.
+    """
+    model: str
+    source: str
+    first_year: int
+    window_days: float
+    window_start: np.ndarray
+    coefficients: np.ndarray
+    max_error_rad: float
+
+    @property
+    def last_year(self) -> int:
+        return self.first_year + len(self.window_start) - 1
+
+    @property
+    def max_error_arcsec(self) -> float:
+        return self.max_error_rad * RAD_TO_ARCSEC
+
+    def covers(self, year: int) -> bool:
+        return self.first_year <= year <= self.last_year
+
+    def _segment(self, year: int) -> Tuple[float, np.ndarray, np.ndarray]:
+        if not self.covers(year):
+            raise ValueError(f"Year {year} outside table range {self.first_year}-{self.last_year}")
+        i = year - self.first_year
+        c = self.coefficients[i]
+        return float(self.window_start[i]), c, chebyshev.chebder(c)
+
+    def longitude_and_rate(self, year: int, jd: float) -> Tuple[float, float]:
+        """Surrogate longitude (rad) and its rate (rad/day) at ``jd`` inside the year's window."""
+        start, c, dc = self._segment(year)
+        x = 2.0 * (jd - start) / self.window_days - 1.0
+        return float(chebyshev.chebval(x, c)), float(chebyshev.chebval(x, dc)) * 2.0 / self.window_days
+
+    def solve_crossing(self, year: int, target_rad: float = 0.0, tol_days: float = 1e-8,
+                       max_iter: int = 20) -> float:
+        """
+        Return the JD at which the surrogate longitude equals ``target_rad``.
+
+        Newton iteration with the analytic Chebyshev derivative, kept inside the window.
+        Raises ValueError if the window does not bracket the target.
+        """
+        start, c, dc = self._segment(year)
+        f_lo = chebyshev.chebval(-1.0, c) - target_rad
+        f_hi = chebyshev.chebval(1.0, c) - target_rad
+        if f_lo * f_hi > 0:
+            raise ValueError(f"Target longitude not bracketed by the {year} window")
+
+        # Linear interpolation between the window ends is within minutes of the root
+        x = -1.0 - 2.0 * f_lo / (f_hi - f_lo)
+        tol_x = 2.0 * tol_days / self.window_days
+        for _ in range(max_iter):
+            step = (chebyshev.chebval(x, c) - target_rad) / chebyshev.chebval(x, dc)
+            x = min(1.0, max(-1.0, x - step))
+            if abs(step) < tol_x:
+                break
+        return start + (x + 1.0) * self.window_days / 2.0
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as fh:
+            np.savez(
+                fh,
+                model=np.array(self.model),
+                source=np.array(self.source),
+                first_year=np.array(self.first_year, dtype=np.int64),
+                window_days=np.array(self.window_days),
+                window_start=self.window_start,
+                coefficients=self.coefficients,
+                max_error_rad=np.array(self.max_error_rad),
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> "SolarLongitudeTable":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                model=str(data["model"]),
+                source=str(data["source"]),
+                first_year=int(data["first_year"]),
+                window_days=float(data["window_days"]),
+                window_start=data["window_start"].astype(np.float64),
+                coefficients=data["coefficients"].astype(np.float64),
+                max_error_rad=float(data["max_error_rad"]),
+            )
+
+
+def build_solar_longitude_table(
+    longitude: Callable[[float], float],
+    model: str,
+    first_year: int,
+    last_year: int,
+    degree: int = DEFAULT_DEGREE,
+    source: str = "",
+) -> SolarLongitudeTable:
+    """
+    Fit one Chebyshev polynomial per year to ``longitude(jd) -> radians``.
+
+    The returned table's max_error_rad is the largest |surrogate - model| found on a dense
+    grid of CHECK_POINTS per window, i.e. it is measured, not estimated.
+    """
+    nodes = chebyshev.chebpts1(degree + 1)
+    grid = np.linspace(-1.0, 1.0, CHECK_POINTS)
+    half = WINDOW_DAYS / 2.0
+
+    years = range(first_year, last_year + 1)
+    starts = np.empty(len(years))
+    coefficients = np.empty((len(years), degree + 1))
+    max_error = 0.0
+    for i, year in enumerate(years):
+        start = window_start_jd(year)
+        samples = _wrap([longitude(start + (x + 1.0) * half) for x in nodes])
+        c = chebyshev.chebfit(nodes, samples, degree)
+        exact = _wrap([longitude(start + (x + 1.0) * half) for x in grid])
+        max_error = max(max_error, float(np.max(np.abs(chebyshev.chebval(grid, c) - exact))))
+        starts[i] = start
+        coefficients[i] = c
+
+    return SolarLongitudeTable(
+        model=model,
+        source=source,
+        first_year=first_year,
+        window_days=WINDOW_DAYS,
+        window_start=starts,
+        coefficients=coefficients,
+        max_error_rad=max_error,
+    )
+
+
+# Loaded tables keyed by path, revalidated against the file's mtime.
+_tables: Dict[str, Tuple[int, Optional[SolarLongitudeTable]]] = {}
+_tables_lock = threading.Lock()
+
+
+def load_solar_longitude_table(model: str) -> Optional[SolarLongitudeTable]:
+    """Return the table for ``model``, or None if it has not been built."""
+    path = table_path(model)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _tables.get(str(path))
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with _tables_lock:
+        try:
+            table = SolarLongitudeTable.load(path)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Warning: Could not load solar longitude table {path}: {e}")
+            table = None
+        _tables[str(path)] = (mtime_ns, table)
+    return table
+
+
+__all__ = [
+    "SolarLongitudeTable",
+    "build_solar_longitude_table",
+    "load_solar_longitude_table",
+    "table_path",
+]
@@ -5,6 +5,8 @@ Includes equation of center, aberration, and simplified nutation corrections.
 from __future__ import annotations
 import math
 from datetime import datetime
+from typing import Tuple
+import numpy as np
 from astro.timescales import timescales_from_datetime
 
 # Constants
@@ -217,6 +219,39 @@ def apparent_solar_longitude_rad(jd_tt: float) -> float:
     return lambda_deg * DEG_TO_RAD
 
 
+def apparent_solar_longitude_deg_and_rate(jd_tt) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Apparent solar longitude and its time derivative for an array of TT Julian Days.
+    
+    Same model as apparent_solar_longitude_deg (true longitude, main nutation term,
+    constant aberration), evaluated with NumPy; the derivative is analytic.
+    
+    Args:
+        jd_tt: Julian Day(s) in Terrestrial Time (scalar or array)
+    
+    Returns:
+        Tuple of (longitude in degrees [0, 360), rate in degrees per day)
+    """
+    t = (np.asarray(jd_tt, dtype=float) - 2451545.0) / 36525.0
+    L0 = 280.46646 + t * (36000.76983 + t * 0.0003032)
+    dL0 = 36000.76983 + 2.0 * 0.0003032 * t
+    M = (357.52911 + t * (35999.05029 - t * 0.0001537)) * DEG_TO_RAD
+    dM = (35999.05029 - 2.0 * 0.0001537 * t) * DEG_TO_RAD
+    c1 = 1.914602 - t * (0.004817 + t * 0.000014)
+    c2 = 0.019993 - t * 0.000101
+    C = c1 * np.sin(M) + c2 * np.sin(2.0 * M) + 0.000289 * np.sin(3.0 * M)
+    dC = ((-0.004817 - 2.0 * 0.000014 * t) * np.sin(M) + c1 * np.cos(M) * dM
+          - 0.000101 * np.sin(2.0 * M) + 2.0 * c2 * np.cos(2.0 * M) * dM
+          + 3.0 * 0.000289 * np.cos(3.0 * M) * dM)
+    omega = (125.04452 - 1934.136261 * t + 0.0020708 * t * t + t * t * t / 450000.0) * DEG_TO_RAD
+    domega = (-1934.136261 + 2.0 * 0.0020708 * t + t * t / 150000.0) * DEG_TO_RAD
+    dpsi_deg = -17.20 * np.sin(omega) / 3600.0
+    ddpsi_deg = -17.20 * np.cos(omega) * domega / 3600.0
+    lambda_app = L0 + C + dpsi_deg + aberration_correction(t) / 3600.0
+    # Derivatives above are per Julian century
+    return np.mod(lambda_app, 360.0), (dL0 + dC + ddpsi_deg) / 36525.0
+
+
 def solar_longitude_from_datetime(dt: datetime) -> float:
     """
     Calculate apparent solar longitude from datetime.
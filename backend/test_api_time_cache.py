@@ -0,0 +1,87 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fastapi.testclient import TestClient
+
+import main
+from astronomical_watch.core.equinox import cached_vernal_equinox
+from astronomical_watch.core.timeframe import DAY, MILIDIES, astronomical_time, first_day_start_after_equinox
+
+client = TestClient(main.app)
+
+
+def test_time_response_is_cacheable_until_milidies_end():
+    resp = client.get("/api/time")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert set(data) == {"dies", "milidies", "milidies_end", "progress"}
+    assert 0 <= data["progress"] <= 99
+    assert resp.headers["etag"].endswith(f'-{data["dies"]}-{data["milidies"]}"')
+    assert 0 <= int(resp.headers["cache-control"].rsplit("=", 1)[1]) <= 86
+    assert resp.headers["expires"].endswith("GMT")
+
+
+def test_if_none_match_returns_304():
+    etag = client.get("/api/time").headers["etag"]
+    for header in (etag, etag[2:], f'"other", {etag}', "*"):
+        resp = client.get("/api/time", headers={"If-None-Match": header})
+        # A miliDies may roll over between the two requests
+        assert resp.status_code == 304 or resp.headers["etag"] != etag
+        if resp.status_code == 304:
+            assert resp.content == b""
+    assert client.get("/api/time", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_frame_lets_client_compute_reading():
+    frame = client.get("/api/frame").json()
+    assert frame["equinox"] <= frame["server_time"] < frame["valid_until"] == frame["next_equinox"]
+    assert frame["equinox"] < frame["day0"] < frame["equinox"] + frame["day_ms"]
+
+    data = client.get("/api/time").json()
+    since = data["milidies_end"] - 1 - frame["day0"]  # Python // and % floor like the client
+    assert (max(since // frame["day_ms"] + 1, 0), since % frame["day_ms"] // frame["milidies_ms"]) == \
+        (data["dies"], data["milidies"])
+
+
+def test_batch_matches_single_conversion(monkeypatch):
+    instants = [datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc),
+                datetime(1999, 7, 4, 12, 0, tzinfo=timezone.utc),
+                datetime(2031, 1, 1, tzinfo=timezone.utc) + MILIDIES * 0.5]
+    timestamps = [instants[0].isoformat(), instants[1].timestamp(),
+                  instants[2].astimezone(timezone(timedelta(hours=-5))).isoformat()]
+    resp = client.post("/api/time/batch", json={"timestamps": timestamps})
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [(r["dies"], r["milidies"]) for r in results] == [astronomical_time(dt) for dt in instants]
+    assert all(0 <= r["fraction"] < 1 for r in results)
+
+    assert client.post("/api/time/batch", json={"timestamps": ["2025-03-20T09:00:00"]}).status_code == 422
+    assert client.post("/api/time/batch", json={"timestamps": [True]}).status_code == 422
+    assert client.post("/api/time/batch", json={"timestamps": [1e300]}).status_code == 422
+    assert client.post("/api/time/batch", content=b"[").status_code == 422
+
+    monkeypatch.setattr(main, "BATCH_MAX_ITEMS", 2)
+    assert client.post("/api/time/batch", json={"timestamps": [0, 1, 2]}).status_code == 413
+    monkeypatch.setattr(main, "BATCH_MAX_BYTES", 10)
+    assert client.post("/api/time/batch", json={"timestamps": [0]}).status_code == 413
+
+
+def test_batch_edge_years_convert_or_422():
+    ok = ["0001-06-01T00:00:00+00:00", "9999-06-01T00:00:00+00:00", "9999-12-31T23:59:59+00:00"]
+    resp = client.post("/api/time/batch", json={"timestamps": ok})
+    assert resp.status_code == 200
+    # astronomical_time also needs the next equinox, which for 9999 is out of range
+    day0 = first_day_start_after_equinox(cached_vernal_equinox(9999))
+    late = [datetime.fromisoformat(v) - day0 for v in ok[1:]]
+    expected = [astronomical_time(datetime.fromisoformat(ok[0]))] + \
+        [(since // DAY + 1, since % DAY // MILIDIES) for since in late]
+    assert [(r["dies"], r["milidies"]) for r in resp.json()["results"]] == expected
+
+    # Before the year-1 equinox (its tropical year starts in year 0) or past 9999 UTC
+    for value in (-62135596800, "0001-01-01T00:00:00+00:00", "9999-12-31T23:00:00-05:00"):
+        resp = client.post("/api/time/batch", json={"timestamps": [value]})
+        assert resp.status_code == 422, value
@@ -0,0 +1,67 @@
+import io
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from astronomical_watch import cli
+from astronomical_watch.core.timeframe import astronomical_time
+
+INSTANTS = [datetime(2025, 3, 20, 9, 1, 25, tzinfo=timezone.utc),
+            datetime(1999, 7, 4, 12, 0, tzinfo=timezone.utc),
+            datetime(2031, 1, 1, tzinfo=timezone.utc)]
+
+
+def test_csv_columns_and_invalid_rows():
+    source = io.StringIO("msg,ts\n" + "".join(f"x{i},{dt.isoformat()}\n" for i, dt in enumerate(INSTANTS))
+                         + "bad,nope\n")
+    sink = io.StringIO()
+    assert cli.convert_stream(source, sink, "csv", column="ts", chunk_size=2) == (4, 1)
+    lines = sink.getvalue().splitlines()
+    assert lines[0] == "msg,ts,dies,milidies"
+    assert [tuple(map(int, line.split(",")[2:])) for line in lines[1:4]] == \
+        [astronomical_time(dt) for dt in INSTANTS]
+    assert lines[4] == "bad,nope,,"
+
+
+def test_ndjson_and_text():
+    source = io.StringIO("".join(json.dumps({"t": dt.timestamp()}) + "\n" for dt in INSTANTS))
+    sink = io.StringIO()
+    cli.convert_stream(source, sink, "ndjson", column="t")
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [(r["dies"], r["milidies"]) for r in records] == [astronomical_time(dt) for dt in INSTANTS]
+
+    # Naive ISO strings are UTC; epoch seconds take the vectorized path
+    for lines in ([dt.replace(tzinfo=None).isoformat() for dt in INSTANTS],
+                  [str(dt.timestamp()) for dt in INSTANTS]):
+        sink = io.StringIO()
+        cli.convert_stream(io.StringIO("\n".join(lines) + "\n\n"), sink, "text")
+        rows = [line.split("\t") for line in sink.getvalue().splitlines()]
+        assert [(int(d), int(m)) for _, d, m in rows] == [astronomical_time(dt) for dt in INSTANTS]
+
+
+def test_workers_match_serial(tmp_path):
+    path = tmp_path / "times.txt"
+    path.write_text("".join(f"{1_000_000_000 + i * 7919.5}\n" for i in range(5000)))
+    serial, parallel = tmp_path / "serial.txt", tmp_path / "parallel.txt"
+    assert cli.main([str(path), "--chunk-size", "300", "--output", str(serial)]) == 0
+    assert cli.main([str(path), "--chunk-size", "300", "--workers", "2", "--output", str(parallel)]) == 0
+    assert serial.read_text() == parallel.read_text()
+    assert len(serial.read_text().splitlines()) == 5000
+
+
+def test_edge_year_rows_are_left_empty(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("0001-01-01T00:00:00\n0001-06-01T00:00:00\n9999-06-01T00:00:00\n"
+                    "9999-12-31T23:00:00-05:00\n-62135596800\n")
+    out = tmp_path / "out.txt"
+    assert cli.main([str(path), "--output", str(out)]) == 0
+    rows = [line.split("\t") for line in out.read_text().splitlines()]
+    assert [d == "" for _, d, _ in rows] == [True, False, False, True, True]
+
+    # An out-of-range row in an all-numeric chunk leaves only that row empty
+    lines = ["-62135596800", str(INSTANTS[0].timestamp())]
+    dies, milidies = cli.convert_timestamps(lines)
+    assert dies[0] is None and (dies[1], milidies[1]) == astronomical_time(INSTANTS[0])
@@ -0,0 +1,62 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src", "astronomical_watch"))
+
+from offline import ephemeris
+from offline.ephemeris import EquinoxEphemeris, build_ephemeris, equinox
+from services import equinox_service
+from solar.equinox_precise import compute_vernal_equinox_precise
+
+
+def test_ephemeris_roundtrip(tmp_path):
+    table = build_ephemeris(range(2024, 2027))
+    table.save(tmp_path / "eph.bin")
+    loaded = EquinoxEphemeris.load(tmp_path / "eph.bin")
+    assert (loaded.first_year, loaded.last_year, loaded.source) == (2024, 2026, "meeus_root_finding")
+    assert loaded.equinox(2025) == table.equinox(2025)
+    assert loaded.equinox(2027) is None and loaded.entry(2023) is None
+    assert loaded.built_at == table.built_at
+
+
+def test_shipped_ephemeris_covers_1000_to_3000():
+    table = ephemeris.get_ephemeris()
+    assert table is not None and (table.first_year, table.last_year) == (1000, 3000)
+    exact = compute_vernal_equinox_precise(2025, tolerance_sec=1.0)
+    assert abs((equinox(2025) - exact).total_seconds()) < 1.0
+
+
+def test_service_answers_from_ephemeris_without_solving(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("ephemeris years must not run a solver")
+    monkeypatch.delenv("ASTRON_EQUINOX_URL", raising=False)
+    monkeypatch.setattr(equinox_service, "get_cached_equinox", lambda year: None)
+    monkeypatch.setattr(equinox_service, "_try_analytic_method", fail)
+
+    result = equinox_service.get_vernal_equinox(1500)
+    assert result["cached"] and result["precision"] == "analytic"
+    assert result["datetime"] == equinox(1500)
+
+
+def test_ephemeris_answers_before_the_internet(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("ASTRON_EQUINOX_URL", "https://example.invalid/equinox.json")
+    monkeypatch.setattr(equinox_service, "_refresh_attempted", {})
+    fetched = []
+    remote = {"utc": "1500-03-11T07:00:00Z", "precision": "internet", "uncertainty_s": 5.0,
+              "source": "remote_fetch", "retrieved_at": "", "datetime": equinox(1500)}
+    monkeypatch.setattr(equinox_service, "_try_internet_method", lambda year: fetched.append(year) or dict(remote))
+
+    # The ephemeris answers first; the internet method only runs in the background
+    result = equinox_service.get_vernal_equinox(1500)
+    assert (result["precision"], result["datetime"]) == ("analytic", equinox(1500))
+    equinox_service.wait_for_background_refresh()
+    assert fetched == [1500]
+    # The cached internet answer now wins over the ephemeris
+    result = equinox_service.get_vernal_equinox(1500)
+    assert result["cached"] and result["precision"] == "internet" and fetched == [1500]
+
+    # An explicitly preferred lower-precision method is still honoured
+    result = equinox_service.get_vernal_equinox(1600, prefer_order=("approx", "analytic"))
+    assert result["precision"] == "approx"
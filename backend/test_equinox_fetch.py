@@ -0,0 +1,183 @@
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src", "astronomical_watch"))
+
+from net import equinox_fetch
+from net.equinox_fetch import fetch_equinox_document, fetch_equinox_from_url
+
+DOCUMENT = {"2024": "2024-03-20T03:06:14Z", "2025": "2025-03-20T09:01:28Z", "2026": "2026-07-01T00:00:00Z"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests = []
+    hang = None  # threading.Event the handler waits on before answering, if set
+
+    def do_GET(self):
+        _Handler.requests.append(dict(self.headers))
+        if _Handler.hang is not None:
+            _Handler.hang.wait(10)
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = gzip.compress(json.dumps(DOCUMENT).encode())
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(equinox_fetch, "_document", None)
+    monkeypatch.setattr(equinox_fetch, "_negative_cache", OrderedDict())
+    monkeypatch.setattr(equinox_fetch, "_breaker", equinox_fetch.CircuitBreaker(3, 60.0))
+    monkeypatch.setattr(equinox_fetch, "_document_flights", {})
+    monkeypatch.setattr(equinox_fetch, "_document_file_misses", set())
+    _Handler.requests = []
+    _Handler.hang = None
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/equinox.json"
+    if _Handler.hang is not None:
+        _Handler.hang.set()
+    httpd.shutdown()
+
+
+def test_document_fetched_once_for_all_years(server):
+    assert fetch_equinox_from_url(server, 2024) == DOCUMENT["2024"]
+    assert fetch_equinox_from_url(server, 2025) == DOCUMENT["2025"]
+    assert fetch_equinox_from_url(server, 2026) is None  # invalid date is dropped
+    assert len(_Handler.requests) == 1
+    assert _Handler.requests[0]["Accept-Encoding"] == "gzip"
+
+
+def test_revalidation_uses_etag_and_disk_copy(server, monkeypatch):
+    fetch_equinox_document(server)
+    # New process: nothing in memory, the on-disk copy carries the ETag
+    monkeypatch.setattr(equinox_fetch, "_document", None)
+    assert fetch_equinox_document(server, max_age=0) == {2024: DOCUMENT["2024"], 2025: DOCUMENT["2025"]}
+    assert len(_Handler.requests) == 2
+    assert _Handler.requests[1]["If-None-Match"] == '"v1"'
+
+
+def test_circuit_breaker_fails_fast_and_probes(server, monkeypatch):
+    breaker = equinox_fetch.CircuitBreaker(failure_threshold=2, cooldown=3600.0)
+    monkeypatch.setattr(equinox_fetch, "_breaker", breaker)
+    down = "http://127.0.0.1:9/equinox.json"  # discard port: connection refused
+    calls = []
+    real_download = equinox_fetch._download_document
+    monkeypatch.setattr(equinox_fetch, "_download_document",
+                        lambda url, previous, timeout: calls.append(url) or real_download(url, previous, timeout))
+
+    for _ in range(4):
+        assert fetch_equinox_document(down, timeout=1.0) is None
+    assert len(calls) == 2 and breaker.state == "open"
+
+    breaker.cooldown = 0.0  # cooldown elapsed: one probe goes through and closes the breaker
+    assert fetch_equinox_document(server)[2025] == DOCUMENT["2025"]
+    assert breaker.status() == {"state": "closed", "consecutive_failures": 0}
+
+
+def test_disk_copy_is_read_outside_the_lock_and_misses_remembered(server, monkeypatch):
+    loads = []
+    real_load = equinox_fetch._load_document_file
+
+    def load(url):
+        loads.append(equinox_fetch._document_lock.locked())
+        return real_load(url)
+    monkeypatch.setattr(equinox_fetch, "_load_document_file", load)
+
+    down = "http://127.0.0.1:9/equinox.json"
+    for _ in range(2):  # below the breaker threshold
+        assert fetch_equinox_document(down, timeout=1.0) is None
+    assert loads == [False]  # the absent file is opened once, without holding the lock
+
+    # Once this process has written the file, a fresh in-memory state reads it again
+    fetch_equinox_document(server)
+    monkeypatch.setattr(equinox_fetch, "_document", None)
+    assert fetch_equinox_document(server) == {2024: DOCUMENT["2024"], 2025: DOCUMENT["2025"]}
+    assert loads == [False, False, False] and len(_Handler.requests) == 1
+
+
+def _run_concurrently(target, count):
+    results = [None] * count
+    threads = [threading.Thread(target=lambda i=i: results.__setitem__(i, target())) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_hanging_source_is_requested_once_by_concurrent_callers(server):
+    _Handler.hang = threading.Event()
+    start = time.monotonic()
+    results = _run_concurrently(lambda: fetch_equinox_document(server, timeout=1.0), 8)
+    # One timeout in total instead of one per caller, and one failure for the breaker
+    assert time.monotonic() - start < 3.0
+    assert results == [None] * 8
+    assert len(_Handler.requests) == 1
+    assert equinox_fetch._breaker.failures == 1
+
+
+def test_waiters_get_stale_copy_during_revalidation(server):
+    fetch_equinox_document(server)
+    _Handler.hang = threading.Event()
+    leader = threading.Thread(target=fetch_equinox_document, args=(server,), kwargs={"max_age": 0})
+    leader.start()
+    while len(_Handler.requests) < 2:
+        time.sleep(0.01)
+
+    start = time.monotonic()
+    results = _run_concurrently(lambda: fetch_equinox_document(server, max_age=0), 8)
+    assert time.monotonic() - start < 1.0
+    assert results == [{2024: DOCUMENT["2024"], 2025: DOCUMENT["2025"]}] * 8
+    assert len(_Handler.requests) == 2
+
+    _Handler.hang.set()
+    leader.join()
+
+
+def test_missing_years_are_negatively_cached(server, monkeypatch):
+    monkeypatch.setattr(equinox_fetch, "DOCUMENT_MAX_AGE_SECONDS", 0.0)
+    assert fetch_equinox_from_url(server, 2030) is None
+    assert fetch_equinox_from_url(server, 2030) is None
+    assert len(_Handler.requests) == 1
+
+    monkeypatch.setattr(equinox_fetch, "NEGATIVE_TTL_SECONDS", 0.0)
+    assert fetch_equinox_from_url(server, 2031) is None
+    assert fetch_equinox_from_url(server, 2031) is None
+    assert len(_Handler.requests) == 3
+
+
+def test_negative_cache_is_purged_and_bounded(monkeypatch):
+    monkeypatch.setattr(equinox_fetch, "_negative_cache", OrderedDict())
+    monkeypatch.setattr(equinox_fetch, "NEGATIVE_TTL_SECONDS", 0.0)
+    for year in range(2000, 2010):
+        equinox_fetch._remember_negative("http://a", year)
+    assert len(equinox_fetch._negative_cache) <= 1  # expired entries go on the next insert
+
+    monkeypatch.setattr(equinox_fetch, "NEGATIVE_TTL_SECONDS", 300.0)
+    monkeypatch.setattr(equinox_fetch, "NEGATIVE_CACHE_MAXSIZE", 4)
+    for year in range(2000, 2010):
+        equinox_fetch._remember_negative("http://a", year)
+    assert [key[1] for key in equinox_fetch._negative_cache] == [2006, 2007, 2008, 2009]
+    assert equinox_fetch._is_negative("http://a", 2009) and not equinox_fetch._is_negative("http://a", 2000)
+
@@ -0,0 +1,73 @@
+import os
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from astronomical_watch.core import equinox
+from astronomical_watch.core.equinox import (
+    cached_vernal_equinox, clear_equinox_cache, compute_vernal_equinox, vernal_equinox_seed_jde,
+    warm_equinox_cache
+)
+from astronomical_watch.core.timeframe import astronomical_time
+
+
+def test_memo_matches_solver_and_skips_recompute(monkeypatch):
+    clear_equinox_cache()
+    assert cached_vernal_equinox(2025) == compute_vernal_equinox(2025)
+
+    calls = []
+    real = equinox.compute_vernal_equinox
+    monkeypatch.setattr(equinox, "compute_vernal_equinox", lambda *a, **kw: calls.append(a) or real(*a, **kw))
+    warm_equinox_cache(range(2024, 2027))
+    astronomical_time(datetime(2025, 6, 1, tzinfo=timezone.utc))
+    assert len(calls) == 2, f"Expected only 2024 and 2026 to be solved, got {calls}"
+
+    clear_equinox_cache()
+    cached_vernal_equinox(2025)
+    assert len(calls) == 3, "clear_equinox_cache must force a new solve"
+
+
+def test_memo_is_bounded(monkeypatch):
+    clear_equinox_cache()
+    monkeypatch.setattr(equinox, "EQUINOX_MEMO_MAXSIZE", 3)
+    warm_equinox_cache(range(2020, 2026))
+    assert len(equinox._equinox_memo) == 3
+    assert [key[0] for key in equinox._equinox_memo] == [2023, 2024, 2025]
+    clear_equinox_cache()
+
+
+def test_seeded_solver_matches_tight_solution():
+    from astronomical_watch.core.timebase import datetime_to_jd
+
+    for year in (1200, 2025, 2800):
+        exact = compute_vernal_equinox(year, tol_seconds=1e-3, max_iter=30)
+        default = compute_vernal_equinox(year)
+        assert abs((default - exact).total_seconds()) < 10.0
+        # The seed is an estimate for the true equinox, not for this model, but within an hour
+        assert abs(vernal_equinox_seed_jde(year) - datetime_to_jd(exact)) * 24 < 1.0
+
+    # No seed outside the Meeus range: the step-halving search still converges
+    assert vernal_equinox_seed_jde(3100) is None
+    assert compute_vernal_equinox(3100).month == 3
+
+
+def test_newton_uses_analytic_rate(monkeypatch):
+    from astronomical_watch.core.solar import apparent_solar_longitude, apparent_solar_longitude_and_rate
+
+    jd = 2460755.0
+    lam, rate = apparent_solar_longitude_and_rate(jd)
+    assert lam == apparent_solar_longitude(jd)
+    h = 1e-3
+    fd = (apparent_solar_longitude(jd + h) - apparent_solar_longitude(jd - h)) / (2 * h)
+    assert abs(rate - fd) < 1e-6 * fd
+
+    calls = []
+    monkeypatch.setattr(equinox, "apparent_solar_longitude_and_rate",
+                        lambda *a, **kw: calls.append(a) or apparent_solar_longitude_and_rate(*a, **kw))
+    for year in (1200, 2025, 2800):
+        exact = compute_vernal_equinox(year, tol_seconds=1e-3, max_iter=30)
+        calls.clear()
+        default = compute_vernal_equinox(year)
+        assert len(calls) <= 2
+        assert abs((default - exact).total_seconds()) < 10.0
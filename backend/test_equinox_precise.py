@@ -0,0 +1,42 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src", "astronomical_watch"))
+
+from solar.equinox_precise import (
+    brent_solve, compute_vernal_equinox_precise, equinox_iteration_stats, find_march_bracket,
+    find_march_bracket_jd, solar_longitude_objective, solar_longitude_objective_jd,
+    validate_equinox_solution
+)
+
+
+def test_jd_solvers_agree_with_datetime_solvers():
+    for year in (1900, 2025, 2400):
+        reference = compute_vernal_equinox_precise(year, "bisection", tolerance_sec=1e-3, max_iter=60,
+                                                   use_surrogate=False)
+        for method in ("brent", "bisection"):
+            result = compute_vernal_equinox_precise(year, method, use_surrogate=False)
+            assert abs((result - reference).total_seconds()) < 1.0
+        assert validate_equinox_solution(reference, tolerance_deg=1e-6)
+
+        # The datetime API still works on the same objective
+        dt_a, dt_b = find_march_bracket(year)
+        assert abs((brent_solve(solar_longitude_objective, dt_a, dt_b) - reference).total_seconds()) < 1.0
+
+
+def test_brent_needs_fewer_evaluations_than_bisection():
+    brent = equinox_iteration_stats(2025, "brent")
+    bisection = equinox_iteration_stats(2025, "bisection")
+    assert brent["iterations"] < bisection["iterations"] // 2
+    assert abs((brent["solution"] - bisection["solution"]).total_seconds()) < 1.0
+    assert brent["bracket_start"] < brent["solution"] < brent["bracket_end"]
+
+
+def test_seeded_bracket_is_narrow():
+    for year in (1000, 1776, 2025, 2999):
+        jd_a, jd_b = find_march_bracket_jd(year)
+        assert solar_longitude_objective_jd(jd_a) < 0 < solar_longitude_objective_jd(jd_b)
+        assert (jd_b - jd_a) * 24 < 2.0
+    # Outside the Meeus range the fixed March windows are still used
+    jd_a, jd_b = find_march_bracket_jd(3100)
+    assert (jd_b - jd_a) >= 4.0
@@ -0,0 +1,145 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src", "astronomical_watch"))
+
+from offline.cache import EquinoxEntry, create_entry, get_cached_equinox, set_cached_equinox
+from services import equinox_service
+from services.equinox_service import get_vernal_equinox, wait_for_background_refresh
+
+YEAR = 3500  # outside the shipped ephemeris
+EPHEMERIS_YEAR = 2025
+
+
+def _analytic(year):
+    dt = datetime(year, 3, 20, 12, tzinfo=timezone.utc)
+    return {"utc": dt.isoformat().replace("+00:00", "Z"), "precision": "analytic",
+            "uncertainty_s": 10.0, "source": "test_analytic", "retrieved_at": "", "datetime": dt}
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("ASTRON_EQUINOX_URL", raising=False)
+    monkeypatch.setattr(equinox_service, "_refresh_attempted", {})
+    calls = []
+    monkeypatch.setattr(equinox_service, "_try_analytic_method", lambda year: calls.append(year) or _analytic(year))
+    return calls
+
+
+def test_low_precision_entry_served_then_upgraded(service):
+    approx = create_entry(datetime(YEAR, 3, 20, 9, tzinfo=timezone.utc), "approx", 10800.0, "legacy_approximation")
+    set_cached_equinox(YEAR, approx)
+
+    result = get_vernal_equinox(YEAR)
+    assert result["cached"] and result["precision"] == "approx"
+
+    wait_for_background_refresh()
+    upgraded = get_cached_equinox(YEAR)
+    assert (upgraded.precision, upgraded.source) == ("analytic", "test_analytic")
+    assert upgraded.retrieved_at != approx.retrieved_at
+    assert service == [YEAR]
+
+    get_vernal_equinox(YEAR)  # analytic is the best available method: nothing to do
+    wait_for_background_refresh()
+    assert service == [YEAR]
+
+
+def test_ephemeris_answers_without_waiting_on_the_fetch(service, monkeypatch):
+    monkeypatch.setenv("ASTRON_EQUINOX_URL", "https://example.invalid/equinox.json")
+    release = threading.Event()
+    fetched = []
+
+    def slow_fetch(year):
+        fetched.append(year)
+        release.wait(10)
+        dt = datetime(year, 3, 20, 9, 1, 25, tzinfo=timezone.utc)
+        return {"utc": dt.isoformat().replace("+00:00", "Z"), "precision": "internet", "uncertainty_s": 5.0,
+                "source": "remote_fetch", "retrieved_at": "", "datetime": dt}
+    monkeypatch.setattr(equinox_service, "_try_internet_method", slow_fetch)
+
+    # "internet" is ranked first, yet the ephemeris answers while the fetch is still blocked
+    start = time.monotonic()
+    result = get_vernal_equinox(EPHEMERIS_YEAR)
+    assert time.monotonic() - start < 1.0
+    assert result["precision"] == "analytic" and service == []
+    assert get_cached_equinox(EPHEMERIS_YEAR) is None
+
+    # The remote answer then upgrades the year in the background
+    release.set()
+    wait_for_background_refresh()
+    assert fetched == [EPHEMERIS_YEAR]
+    assert get_cached_equinox(EPHEMERIS_YEAR).precision == "internet"
+    assert get_vernal_equinox(EPHEMERIS_YEAR)["precision"] == "internet"
+
+
+def test_aging_entry_is_reverified(service):
+    old = EquinoxEntry(utc="3500-03-20T11:00:00Z", precision="analytic", uncertainty_s=10.0,
+                       source="old", retrieved_at="2000-01-01T00:00:00Z")
+    set_cached_equinox(YEAR, old)
+    assert get_vernal_equinox(YEAR)["source"] == "old"
+    wait_for_background_refresh()
+    assert get_cached_equinox(YEAR).source == "test_analytic"
+
+
+def test_concurrent_callers_share_one_computation(service, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(equinox_service, "_try_analytic_method",
+                        lambda year: service.append(year) or release.wait(5) and _analytic(year))
+    monkeypatch.setattr(equinox_service, "_cache_result", lambda year, result: None)  # e.g. read-only cache
+
+    async def main():
+        with ThreadPoolExecutor(20) as pool:
+            threaded = [pool.submit(get_vernal_equinox, YEAR, ("analytic",)) for _ in range(20)]
+            coros = asyncio.gather(*(equinox_service.get_vernal_equinox_async(YEAR, ("analytic",)) for _ in range(50)))
+            await asyncio.sleep(0.2)
+            release.set()
+            results = await coros + [f.result() for f in threaded]
+        return results
+
+    results = asyncio.run(main())
+    assert service == [YEAR]
+    assert {r["source"] for r in results} == {"test_analytic"} and len(results) == 70
+    assert equinox_service._inflight == {}
+
+
+def test_async_lookup_does_not_block_the_event_loop(service, monkeypatch):
+    set_cached_equinox(YEAR, create_entry(datetime(YEAR, 3, 20, 12, tzinfo=timezone.utc), "analytic", 10.0, "test"))
+    real_get = equinox_service.get_cached_equinox
+
+    def slow_get(year):
+        time.sleep(0.5)  # e.g. waiting on a busy SQLite writer
+        return real_get(year)
+    monkeypatch.setattr(equinox_service, "get_cached_equinox", slow_get)
+
+    async def main():
+        lookup = asyncio.ensure_future(equinox_service.get_vernal_equinox_async(YEAR, ("analytic",)))
+        start = time.monotonic()
+        await asyncio.sleep(0.05)
+        responsive = time.monotonic() - start < 0.3
+        return responsive, await lookup
+
+    responsive, result = asyncio.run(main())
+    assert responsive and result["cached"] and result["source"] == "test"
+
+
+def test_failure_propagates_to_all_waiters(service, monkeypatch):
+    def failing(year):
+        service.append(year)
+        time.sleep(0.2)
+        raise ValueError("solver diverged")
+    monkeypatch.setattr(equinox_service, "_try_analytic_method", failing)
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(get_vernal_equinox, YEAR, ("analytic",)) for _ in range(8)]
+        errors = [f.exception(timeout=5) for f in futures]
+    assert all(isinstance(e, RuntimeError) and "solver diverged" in str(e) for e in errors)
+    assert service == [YEAR]
@@ -0,0 +1,55 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src", "astronomical_watch"))
+
+from solar.equinox_precise import _march_bracket, solar_longitude_objective_jd, solve_equinox_jd
+from solar.longitude_crossings import (
+    CARDINAL_POINTS_DEG, SOLAR_TERMS_DEG, crossing_datetimes, solve_solar_longitude_crossings
+)
+from solar.solar_longitude_light import apparent_solar_longitude_deg, apparent_solar_longitude_deg_and_rate
+
+
+def test_array_model_matches_scalar_model():
+    jd = np.linspace(2300000.0, 2600000.0, 101)
+    lam, rate = apparent_solar_longitude_deg_and_rate(jd)
+    scalar = np.array([apparent_solar_longitude_deg(x) for x in jd])
+    assert np.max(np.abs((lam - scalar + 180.0) % 360.0 - 180.0)) < 1e-8
+    h = 1e-3
+    fd = ((apparent_solar_longitude_deg_and_rate(jd + h)[0] - apparent_solar_longitude_deg_and_rate(jd - h)[0]
+           + 180.0) % 360.0 - 180.0) / (2 * h)
+    assert np.max(np.abs(rate - fd)) < 1e-6
+
+
+def test_crossings_hit_targets_in_order():
+    years = range(1600, 2401)
+    jd = solve_solar_longitude_crossings(SOLAR_TERMS_DEG, years)
+    assert jd.shape == (len(years), 24)
+    for row in jd[::50]:
+        for value, target in zip(row, SOLAR_TERMS_DEG):
+            assert abs((apparent_solar_longitude_deg(value) - target + 180.0) % 360.0 - 180.0) < 1e-5
+    gaps = np.diff(jd, axis=1)
+    assert gaps.min() > 14.0 and gaps.max() < 16.0
+    # Next year's March equinox follows this year's last term
+    assert np.all(jd[1:, 0] > jd[:-1, -1])
+
+
+def test_equinox_column_matches_scalar_solver():
+    jd = solve_solar_longitude_crossings(CARDINAL_POINTS_DEG, [1000, 2025, 3000])
+    for row, year in zip(jd, (1000, 2025, 3000)):
+        a, fa, b, fb = _march_bracket(year)
+        exact = solve_equinox_jd(solar_longitude_objective_jd, a, b, "brent", 1e-3, 60, fa, fb)
+        assert abs(row[0] - exact) * 86400.0 < 0.5
+
+    (march, june, september, december), = crossing_datetimes(jd[1:2])
+    assert (march.month, june.month, september.month, december.month) == (3, 6, 9, 12)
+    assert all(dt.year == 2025 for dt in (march, june, september, december))
+
+
+def test_non_convergence_is_reported():
+    # The seed is up to about 2 degrees (two days) off, so one Newton step cannot settle
+    with pytest.raises(RuntimeError, match="did not converge"):
+        solve_solar_longitude_crossings(SOLAR_TERMS_DEG, range(2000, 2010), max_iter=1)
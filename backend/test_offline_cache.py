@@ -0,0 +1,188 @@
+import json
+import multiprocessing
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src", "astronomical_watch"))
+
+from offline import cache
+from offline.cache import create_entry, get_cache_file_path, get_cached_equinox, set_cached_equinox
+from services import equinox_service
+
+
+def test_reads_never_write_and_follow_external_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    entry = create_entry(datetime(2025, 3, 20, 9, 1, tzinfo=timezone.utc), "analytic", 10.0, "test")
+    set_cached_equinox(2025, entry)
+    cache_file = get_cache_file_path()
+
+    writes = []
+    monkeypatch.setattr(cache, "save_cache", lambda data: writes.append(data))
+    loads = []
+    real_load = cache.load_cache
+    monkeypatch.setattr(cache, "load_cache", lambda: loads.append(1) or real_load())
+    for _ in range(5):
+        assert get_cached_equinox(2025) == entry
+    assert writes == [] and loads == []  # served from memory
+
+    # Another process replaces the file: the next read picks it up
+    data = json.loads(cache_file.read_text())
+    data["entries"]["2025"]["source"] = "other_worker"
+    tmp = cache_file.with_name("replacement.tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, cache_file)
+    assert get_cached_equinox(2025).source == "other_worker"
+    assert writes == [] and len(loads) == 1
+
+
+def test_legacy_cache_migrates_without_rewrite(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    cache_file = get_cache_file_path()
+    legacy = json.dumps({"schema": 1, "entries": {"2024": "2024-03-20T03:06:00Z"}})
+    cache_file.write_text(legacy)
+
+    entry = get_cached_equinox(2024)
+    assert entry.precision == "approx" and entry.legacy_approx == "2024-03-20T03:06:00Z"
+    assert cache_file.read_text() == legacy
+    assert list(tmp_path.iterdir()) == [cache_file]
+
+
+def _worker(barrier, results):
+    barrier.wait()
+    results.put(equinox_service.get_vernal_equinox(3500, ("analytic",))["utc"])
+
+
+@pytest.mark.skipif(cache.fcntl is None, reason="cross-process locking needs fcntl")
+def test_concurrent_workers_compute_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    marker = tmp_path / "computed"
+
+    def slow_analytic(year):
+        with open(marker, "a") as f:
+            f.write(f"{os.getpid()}\n")
+        time.sleep(0.2)
+        dt = datetime(year, 3, 20, 12, tzinfo=timezone.utc)
+        return {"utc": dt.isoformat().replace("+00:00", "Z"), "precision": "analytic",
+                "uncertainty_s": 10.0, "source": "test", "retrieved_at": "", "datetime": dt}
+    monkeypatch.setattr(equinox_service, "_try_analytic_method", slow_analytic)
+
+    ctx = multiprocessing.get_context("fork")
+    barrier, results = ctx.Barrier(4), ctx.Queue()
+    workers = [ctx.Process(target=_worker, args=(barrier, results)) for _ in range(4)]
+    for w in workers:
+        w.start()
+    utcs = [results.get(timeout=10) for _ in workers]
+    for w in workers:
+        w.join()
+
+    assert utcs == ["3500-03-20T12:00:00Z"] * 4
+    assert len(marker.read_text().split()) == 1
+    assert json.loads(get_cache_file_path().read_text())["entries"]["3500"]["source"] == "test"
+
+
+def test_lock_maps_stay_bounded(tmp_path, monkeypatch):
+    for i in range(3 * cache.LOCK_FDS_MAXSIZE):
+        monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path / str(i)))
+        with cache.equinox_compute_lock(2000 + i):
+            pass
+        with cache._cache_file_lock():
+            pass
+    assert cache._compute_locks == {}
+    assert len(cache._lock_fds) <= cache.LOCK_FDS_MAXSIZE
+
+
+def _try_cache_file_lock(results):
+    import fcntl
+    with cache._lock_fd(cache.get_cache_file_path().with_name(cache.DEFAULT_CACHE_FILE + ".lock")) as fd:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            results.put("blocked")
+        else:
+            results.put("acquired")
+
+
+@pytest.mark.skipif(cache.fcntl is None, reason="cross-process locking needs fcntl")
+def test_forked_child_does_not_share_parent_lock(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    with cache._cache_file_lock():
+        child = ctx.Process(target=_try_cache_file_lock, args=(results,))
+        child.start()
+        assert results.get(timeout=10) == "blocked"
+        child.join()
+
+
+def _use_sqlite_in_child(results):
+    results.put(len(cache._sqlite_stores))
+    set_cached_equinox(2031, create_entry(datetime(2031, 3, 20, 14, tzinfo=timezone.utc), "analytic", 10.0, "child"))
+    results.put(get_cached_equinox(2031).source)
+
+
+def test_forked_child_opens_its_own_sqlite_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("ASTRON_CACHE_BACKEND", "sqlite")
+    set_cached_equinox(2030, create_entry(datetime(2030, 3, 20, 13, tzinfo=timezone.utc), "analytic", 10.0, "parent"))
+    parent_store = cache._sqlite_store()
+
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    child = ctx.Process(target=_use_sqlite_in_child, args=(results,))
+    child.start()
+    assert results.get(timeout=10) == 0  # the parent's store (and connection) is not reused
+    assert results.get(timeout=10) == "child"
+    child.join()
+    assert child.exitcode == 0
+
+    assert cache._sqlite_store() is parent_store
+    assert get_cached_equinox(2031).source == "child"
+    assert get_cached_equinox(2030).source == "parent"
+
+
+def test_sqlite_backend_imports_json_and_supports_ranges(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    get_cache_file_path().write_text(json.dumps({"schema": 1, "entries": {"2024": "2024-03-20T03:06:00Z"}}))
+    monkeypatch.setenv("ASTRON_CACHE_BACKEND", "sqlite")
+
+    assert get_cached_equinox(2024).legacy_approx == "2024-03-20T03:06:00Z"  # v1 entry migrated
+    entries = {year: create_entry(datetime(year, 3, 20, tzinfo=timezone.utc), "analytic", 10.0, "test")
+               for year in range(1900, 2101)}
+    cache.set_cached_equinoxes(entries)
+    assert get_cached_equinox(2050) == entries[2050]
+
+    window = cache.get_cached_equinoxes(2020, 2030)
+    assert list(window) == list(range(2020, 2031)) and window[2024] == entries[2024]
+
+    stats = cache.get_cache_stats()
+    assert stats["backend"] == "sqlite" and stats["total_entries"] == 201
+    assert stats["precision_counts"] == {"analytic": 201} and stats["migrated_entries"] == 0
+    cache.clear_cache()
+    assert get_cached_equinox(2050) is None
+
+
+def test_sqlite_stats_follow_writes_without_scanning(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRON_CACHE_DIR", str(tmp_path))
+    get_cache_file_path().write_text(json.dumps({"schema": 1, "entries": {"2024": "2024-03-20T03:06:00Z"}}))
+    monkeypatch.setenv("ASTRON_CACHE_BACKEND", "sqlite")
+    store = cache._sqlite_store()
+
+    def counts():
+        stats = store.stats()
+        return stats["total_entries"], stats["precision_counts"], stats["migrated_entries"]
+
+    assert counts() == (1, {"approx": 1}, 1)  # seeded from the v1 JSON cache
+    set_cached_equinox(2024, create_entry(datetime(2024, 3, 20, 3, 6, tzinfo=timezone.utc), "analytic", 10.0, "test"))
+    cache.set_cached_equinoxes({year: create_entry(datetime(year, 3, 20, tzinfo=timezone.utc), "approx", 10800.0, "test")
+                                for year in range(2025, 2030)})
+    assert counts() == (6, {"analytic": 1, "approx": 5}, 0)
+
+    # The counters agree with a full count of the table
+    conn = store._conn()
+    assert dict(conn.execute("SELECT precision, COUNT(*) FROM equinox GROUP BY precision")) == counts()[1]
+    cache.clear_cache()
+    assert counts() == (0, {}, 0)
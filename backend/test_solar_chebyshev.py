@@ -0,0 +1,40 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src", "astronomical_watch"))
+
+from solar import equinox_precise, solar_chebyshev
+from solar.equinox_precise import (
+    _march_bracket, solar_longitude_objective_jd, solve_equinox_jd, surrogate_equinox, tt_jd_to_datetime
+)
+from solar.solar_chebyshev import SolarLongitudeTable, build_solar_longitude_table
+from solar.solar_longitude_light import apparent_solar_longitude_rad
+
+
+def test_surrogate_matches_model():
+    table = build_solar_longitude_table(apparent_solar_longitude_rad, "test", 2024, 2026)
+    assert table.covers(2025) and not table.covers(2027)
+    assert table.max_error_arcsec < 1e-3
+
+    jd = table.solve_crossing(2025)
+    jd_a, fa, jd_b, fb = _march_bracket(2025)
+    exact = solve_equinox_jd(solar_longitude_objective_jd, jd_a, jd_b, "brent", 1e-3, 60, fa, fb)
+    assert abs(jd - exact) * 86400.0 < 0.01
+
+    assert abs(table.longitude_and_rate(2025, jd)[0]) < 1e-10
+
+    lam, rate = table.longitude_and_rate(2025, jd + 2.0)
+    h = 0.01
+    finite = (apparent_solar_longitude_rad(jd + 2.0 + h) - apparent_solar_longitude_rad(jd + 2.0 - h)) / (2 * h)
+    assert abs(lam - apparent_solar_longitude_rad(jd + 2.0)) < 1e-10 and abs(rate - finite) < 1e-9
+
+
+def test_table_roundtrip_and_coverage(tmp_path, monkeypatch):
+    monkeypatch.setattr(solar_chebyshev, "TABLE_DIR", tmp_path)
+    table = equinox_precise.build_equinox_surrogate(2025, 2025)
+    loaded = SolarLongitudeTable.load(solar_chebyshev.table_path(equinox_precise.SURROGATE_MODEL))
+    assert loaded.first_year == 2025 and loaded.last_year == 2025
+    assert (loaded.coefficients == table.coefficients).all()
+
+    assert surrogate_equinox(2025) == tt_jd_to_datetime(table.solve_crossing(2025))
+    assert surrogate_equinox(2026) is None  # not covered
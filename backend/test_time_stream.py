@@ -0,0 +1,75 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+def test_tick_is_computed_once_and_fanned_out():
+    async def scenario():
+        hub = main.TickHub()
+        subscribers = [hub.subscribe() for _ in range(20)]
+        ticks = [await asyncio.wait_for(s.next_tick(), 2) for s in subscribers]
+        assert all(tick is ticks[0] for tick in ticks)
+        assert hub.ticks_computed == 1
+        assert set(json.loads(ticks[0][0])) == {"dies", "milidies", "milidies_end", "progress"}
+        assert ticks[0][1] == b"data: " + ticks[0][0].encode() + b"\n\n"
+        await hub.close()
+        assert [await s.next_tick() for s in subscribers] == [None] * len(subscribers)
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_is_bounded_and_idle_one_culled():
+    async def scenario():
+        hub = main.TickHub()
+        slow = main._Subscriber()
+        hub.subscribers.add(slow)  # publish by hand, without the scheduler
+        now = datetime.now(timezone.utc)
+        for _ in range(main.TICK_QUEUE_SIZE + 3):
+            hub.publish(now)
+        assert slow.queue.qsize() == main.TICK_QUEUE_SIZE and slow.dropped == 3
+
+        slow.last_taken = time.monotonic() - main.STREAM_IDLE_TIMEOUT - 1
+        hub.publish(now)
+        assert slow not in hub.subscribers
+        assert await slow.next_tick() is None
+
+    asyncio.run(scenario())
+
+
+def test_cold_snapshot_is_built_off_the_event_loop(monkeypatch):
+    real_frame = main.current_year_frame
+
+    def slow_frame(now):
+        time.sleep(0.5)  # stands in for an equinox solve at the year rollover
+        return real_frame(now)
+    monkeypatch.setattr(main, "current_year_frame", slow_frame)
+    monkeypatch.setattr(main, "_time_snapshot", None)
+
+    async def scenario():
+        hub = main.TickHub()
+        subscriber = hub.subscribe()
+        start = time.monotonic()
+        await asyncio.sleep(0.05)
+        assert time.monotonic() - start < 0.3  # the loop kept running meanwhile
+        assert await asyncio.wait_for(subscriber.next_tick(), 2) is not None
+        await hub.close()
+
+    asyncio.run(scenario())
+
+
+def test_websocket_streams_ticks():
+    with TestClient(main.app) as client:
+        with client.websocket_connect("/api/time/ws") as ws:
+            first = json.loads(ws.receive_text())
+            second = json.loads(ws.receive_text())
+        assert (second["milidies"], second["progress"]) != (first["milidies"], first["progress"])
@@ -0,0 +1,99 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from astronomical_watch.core import timeframe
+from astronomical_watch.core.timeframe import (
+    MILIDIES, YearFrame, astronomical_time, astronomical_time_many, current_year_frame
+)
+from astronomical_watch.core.equinox import cached_vernal_equinox
+
+
+def test_year_frame_boundaries():
+    eq = cached_vernal_equinox(2025)
+    frame = YearFrame.for_instant(eq)
+    assert frame.equinox == eq
+    assert frame.next_equinox == cached_vernal_equinox(2026)
+    # dies=0 lasts from the equinox up to day0; miliDies still count from the previous noon
+    assert astronomical_time(eq)[0] == 0
+    assert astronomical_time(frame.day0 - MILIDIES) == (0, 999)
+    assert astronomical_time(frame.day0) == (1, 0)
+    assert astronomical_time(frame.day0 + timedelta(days=1) - MILIDIES) == (1, 999)
+    assert astronomical_time(frame.day0 + timedelta(days=1)) == (2, 0)
+
+
+def test_current_frame_refreshes_only_across_equinox():
+    eq = cached_vernal_equinox(2025)
+    frame = current_year_frame(eq + timedelta(days=10))
+    assert current_year_frame(eq + timedelta(days=200)) is frame
+    assert timeframe._current_frame is frame
+
+    before = astronomical_time(frame.next_equinox - timedelta(microseconds=1))
+    after = astronomical_time(frame.next_equinox)
+    assert before[0] > 360
+    assert after[0] == 0
+    assert timeframe._current_frame.equinox == frame.next_equinox
+
+
+def test_astronomical_time_many_matches_scalar():
+    eq = cached_vernal_equinox(2025)
+    instants = [eq - timedelta(microseconds=1), eq, eq + timedelta(hours=7),
+                datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2030, 12, 31, 23, 59, tzinfo=timezone.utc)]
+    expected = [astronomical_time(dt) for dt in instants]
+
+    stamps = np.array([dt.replace(tzinfo=None) for dt in instants], dtype="datetime64[us]")
+    dies, milidies = astronomical_time_many(stamps)
+    assert list(zip(dies.tolist(), milidies.tolist())) == expected
+
+    whole_seconds = np.array([int(dt.timestamp()) for dt in instants[3:]])
+    dies, milidies = astronomical_time_many(whole_seconds)
+    assert list(zip(dies.tolist(), milidies.tolist())) == expected[3:]
+
+
+def test_milidies_span():
+    eq = cached_vernal_equinox(2025)
+    frame = YearFrame.for_instant(eq)
+    dt = frame.day0 + timedelta(days=3) + MILIDIES * 5 + timedelta(seconds=10)
+    start, end = frame.milidies_span(dt)
+    assert (start, end) == (frame.day0 + timedelta(days=3) + MILIDIES * 5, start + MILIDIES)
+    assert frame.reading(start) == frame.reading(dt) != frame.reading(end)
+    # Cut at the equinox edges
+    assert frame.milidies_span(eq)[0] == eq
+    assert frame.milidies_span(frame.next_equinox - timedelta(microseconds=1))[1] == frame.next_equinox
+
+
+def test_astronomical_time_many_fraction():
+    eq = cached_vernal_equinox(2025)
+    frame = YearFrame.for_instant(eq)
+    start = frame.day0 + timedelta(days=40) + MILIDIES * 17
+    stamps = np.array([(start + MILIDIES * f).replace(tzinfo=None) for f in (0, 0.25, 0.999)],
+                      dtype="datetime64[us]")
+    dies, milidies, fraction = astronomical_time_many(stamps, with_fraction=True)
+    assert set(milidies.tolist()) == {17}
+    assert np.allclose(fraction, [0, 0.25, 0.999])
+
+
+def test_astronomical_time_many_rejects_unrepresentable_instants():
+    # Scaled to microseconds these would wrap around int64 into plausible-looking years
+    wraps_to_1970 = 2**64 // 10**6 + 1_700_000_000
+    for instants in (np.array([1_700_000_000, wraps_to_1970]), np.array([1.7e9, float(-wraps_to_1970)]),
+                     np.array(["300000-01-01"], dtype="datetime64[s]")):
+        with pytest.raises(ValueError):
+            astronomical_time_many(instants)
+    with pytest.raises(ValueError):
+        astronomical_time_many(np.array([int(datetime(9999, 12, 31, 23, 59, 59, tzinfo=timezone.utc).timestamp()) + 1]))
+
+
+if __name__ == "__main__":
+    test_year_frame_boundaries()
+    test_current_frame_refreshes_only_across_equinox()
+    test_astronomical_time_many_matches_scalar()
+    test_milidies_span()
+    test_astronomical_time_many_fraction()
+    test_astronomical_time_many_rejects_unrepresentable_instants()
+    print("Year frame tests: OK")
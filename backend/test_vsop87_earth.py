@@ -0,0 +1,147 @@
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src", "astronomical_watch", "scripts"))
+
+from astronomical_watch.core import vsop87_earth
+from generate_vsop87 import generate_binary_module, generate_python_module, write_manifest
+from astronomical_watch.core.vsop87_earth import (
+    earth_heliocentric_latitude, earth_heliocentric_longitude, earth_heliocentric_position,
+    earth_heliocentric_position_and_rates, earth_radius_vector, _t
+)
+
+
+def test_fused_position_matches_single_series():
+    jd = 2460390.3
+    t = _t(jd)
+    L, B, R = earth_heliocentric_position(jd)
+    assert abs(L - earth_heliocentric_longitude(t)) < 1e-12
+    assert abs(B - earth_heliocentric_latitude(t)) < 1e-15
+    assert abs(R - earth_radius_vector(t)) < 1e-15
+
+
+def test_array_epochs_match_scalar():
+    jds = np.linspace(2440000.0, 2470000.0, 257)
+    L, B, R = earth_heliocentric_position(jds)
+    for i in (0, 128, 256):
+        expected = earth_heliocentric_position(jds[i])
+        assert np.allclose((L[i], B[i], R[i]), expected, rtol=0, atol=1e-12)
+
+
+def test_rates_match_finite_differences():
+    jd, h = 2460390.3, 0.1
+    (L, B, R), rates = earth_heliocentric_position_and_rates(jd)
+    ahead = earth_heliocentric_position(jd + h)
+    behind = earth_heliocentric_position(jd - h)
+    for i in range(3):
+        assert abs((ahead[i] - behind[i]) / (2 * h) - rates[i]) < 1e-9
+    assert 0.0165 < rates[0] < 0.0175  # ~0.9856 deg/day
+
+
+def test_packed_coefficients_are_contiguous_views():
+    coeffs = vsop87_earth._get_coefficients()
+    assert coeffs.terms.flags["C_CONTIGUOUS"] and coeffs.terms.dtype == np.float64
+    assert coeffs["L0"].shape == (5, 3) and coeffs["L2"].shape == (0, 3)
+    assert np.shares_memory(coeffs["R1"], coeffs.terms)
+
+
+def test_binary_coefficients_roundtrip(tmp_path):
+    series = {name: vsop87_earth._get_coefficients()[name].tolist() for name in vsop87_earth.SERIES_NAMES}
+    generate_python_module(series, 1e3, 8.4, tmp_path / "vsop87d_earth_test.py")
+    generate_binary_module(series, 1e3, 8.4, tmp_path / "vsop87d_earth_test.bin")
+
+    from_source = vsop87_earth._load_coefficient_file(tmp_path / "vsop87d_earth_test.py")
+    mapped = vsop87_earth._load_coefficient_file(tmp_path / "vsop87d_earth_test.bin")
+    assert not mapped.terms.flags["WRITEABLE"]  # read-only view of the mapped file
+    assert np.array_equal(mapped.terms, from_source.terms)
+    assert np.array_equal(mapped.offsets, from_source.offsets)
+    assert vsop87_earth._read_error_bound(tmp_path / "vsop87d_earth_test.bin") == 8.4
+    assert vsop87_earth._read_error_bound(tmp_path / "vsop87d_earth_test.py") == 8.4
+
+
+def _tuple_eval(series, t):
+    """The tuple-based evaluator the packed one replaced: sum(A * cos(B + C * t)) * t**n."""
+    return sum(sum(A * math.cos(B + C * t) for A, B, C in group) * t**n for n, group in enumerate(series))
+
+
+def _synthetic_series():
+    rng = np.random.default_rng(87)
+    sizes = {0: 300, 1: 120, 2: 40, 3: 12, 4: 4, 5: 2}
+    return {
+        f"{coord}{power}": [
+            (float(A), float(B), float(C)) for A, B, C in zip(
+                rng.uniform(1.0, 1e5, sizes[power]), rng.uniform(0, 2 * math.pi, sizes[power]),
+                rng.uniform(0, 1e5, sizes[power]))
+        ]
+        for coord in "LBR" for power in range(6)
+    }
+
+
+def test_packed_evaluator_matches_tuple_evaluator(tmp_path):
+    generate_python_module(_synthetic_series(), 1.0, 0.5, tmp_path / "vsop87d_earth_synthetic.py")
+    generate_binary_module(_synthetic_series(), 1.0, 0.5, tmp_path / "vsop87d_earth_synthetic.bin")
+    coeff_dir = vsop87_earth._get_script_dir() / "vsop87_coefficients"
+    shipped = [p for pattern in vsop87_earth.COEFFICIENT_PATTERNS for p in sorted(coeff_dir.glob(pattern))]
+    sets = [("builtin", vsop87_earth._get_coefficients())] + [
+        (path.name, vsop87_earth._load_coefficient_file(path))
+        for path in shipped + sorted(tmp_path.glob("vsop87d_earth_synthetic.*"))
+    ]
+    epochs = np.array([-1.0, -0.2, 0.0, 0.0123, 0.25, 1.0])
+    for name, coeffs in sets:
+        for coord in "LBR":
+            packed_series = [coeffs[f"{coord}{n}"] for n in range(6)]
+            tuple_series = [[tuple(row) for row in group.tolist()] for group in packed_series]
+            reference = np.array([_tuple_eval(tuple_series, t) for t in epochs])
+            scalar = np.array([vsop87_earth._eval(packed_series, t) for t in epochs])
+            array = vsop87_earth._eval(packed_series, epochs)
+            # np.cos and the vectorized sums round differently from math.cos and a Python
+            # sum, so agreement is to rounding error of the summed amplitudes, not bitwise
+            scale = sum(np.abs(group[:, 0]).sum() for group in packed_series)
+            assert np.max(np.abs(scalar - reference)) <= 1e-14 * scale, (name, coord)
+            assert np.max(np.abs(array - reference)) <= 1e-14 * scale, (name, coord)
+
+
+def test_coefficient_index_tracks_rewritten_and_removed_files(tmp_path, monkeypatch):
+    coeff_dir = tmp_path / "vsop87_coefficients"
+    coeff_dir.mkdir()
+    monkeypatch.setattr(vsop87_earth, "_get_script_dir", lambda: tmp_path)
+    monkeypatch.setattr(vsop87_earth, "_coefficient_index", None)
+    monkeypatch.setattr(vsop87_earth, "_coefficient_cache", {})
+    refreshes = []
+    real_refresh = vsop87_earth._refresh_coefficient_index
+    monkeypatch.setattr(vsop87_earth, "_refresh_coefficient_index",
+                        lambda d: refreshes.append(d) or real_refresh(d))
+
+    builtin = {name: vsop87_earth._get_coefficients()[name].tolist() for name in vsop87_earth.SERIES_NAMES}
+    path = coeff_dir / "vsop87d_earth_test.py"
+    generate_python_module(builtin, 1e3, 8.4, path)
+    assert vsop87_earth._find_coefficient_file(10.0) == path
+    assert vsop87_earth._find_coefficient_file(1.0) is None
+    # The manifest is only read at runtime, never written
+    assert not (coeff_dir / vsop87_earth.COEFFICIENT_MANIFEST).exists()
+    assert len(refreshes) == 1
+    before = vsop87_earth._get_coefficients(10.0)
+
+    # Rewrite in place with a more accurate set, keeping the directory mtime unchanged
+    dir_mtime_ns = coeff_dir.stat().st_mtime_ns
+    generate_python_module(_synthetic_series(), 1.0, 0.5, path)
+    os.utime(coeff_dir, ns=(dir_mtime_ns, dir_mtime_ns))
+    assert vsop87_earth._find_coefficient_file(1.0) == path
+    after = vsop87_earth._get_coefficients(1.0)
+    assert after is not before and len(after.terms) > len(before.terms)
+
+    # A fresh process trusts the manifest written by the generator for the unchanged file
+    write_manifest(coeff_dir)
+    assert sorted(p.name for p in coeff_dir.iterdir()) == sorted([path.name, vsop87_earth.COEFFICIENT_MANIFEST])
+    monkeypatch.setattr(vsop87_earth, "_coefficient_index", None)
+    monkeypatch.setattr(vsop87_earth, "_read_error_bound", lambda p: pytest.fail("re-parsed " + p.name))
+    assert vsop87_earth._find_coefficient_file(1.0) == path
+
+    path.unlink()
+    assert vsop87_earth._find_coefficient_file(10.0) is None
+
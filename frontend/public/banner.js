@@ -1,10 +1,20 @@
 const API_URL = "http://localhost:8000/api/time"; // Prilagodi po potrebi
+const STREAM_URL = API_URL + "/stream";
+const FRAME_URL = API_URL.replace(/\/time$/, "/frame");
 const EXPLANATION_URL = "explanation.html";
+const MILIDIES_MS = 86400; // 1 miliDies = 86.4 s
 
 function fetchTimeAndUpdateBanner() {
     fetch(API_URL)
         .then(resp => resp.json())
-        .then(data => updateBanner(data))
+        .then(data => {
+            // Progres računamo lokalno iz kraja milidiesa, pa i keširan odgovor (isti milidies) ostaje tačan
+            if (data.milidies_end !== undefined) {
+                const left = Math.max(0, data.milidies_end - Date.now());
+                data.progress = Math.min(99, Math.max(0, Math.floor(100 - left / MILIDIES_MS * 100)));
+            }
+            updateBanner(data);
+        })
         .catch(err => {
             updateBanner({
                 dies: "--",
@@ -40,7 +50,84 @@ function updateBanner(data) {
     }
 }
 
-// Prvo učitavanje
-fetchTimeAndUpdateBanner();
-// Periodično osvežavanje (npr. svakih 5 sekundi)
-setInterval(fetchTimeAndUpdateBanner, 5000);
+// --- Lokalno računanje iz /api/frame ---
+// Okvir godine preuzimamo jednom; ponovo samo na horizontu (sledeći ekvinocij) ili kad
+// sat klijenta skoči (promena sistemskog vremena, buđenje iz sleep-a).
+const SKEW_TOLERANCE_MS = 2000;
+let frame = null;          // odgovor /api/frame
+let clockOffset = 0;       // serversko vreme - Date.now()
+let tickTimer = null;
+let lastWall = 0, lastMono = 0;
+
+function localReading(t) {
+    const since = t - frame.day0;
+    const intra = ((since % frame.day_ms) + frame.day_ms) % frame.day_ms;
+    return {
+        dies: since < 0 ? 0 : Math.floor(since / frame.day_ms) + 1,
+        milidies: Math.floor(intra / frame.milidies_ms),
+        progress: Math.floor((intra % frame.milidies_ms) * 100 / frame.milidies_ms)
+    };
+}
+
+function syncFrame() {
+    const sent = performance.now();
+    return fetch(FRAME_URL, { cache: "no-store" })
+        .then(resp => resp.json())
+        .then(data => {
+            // Serversko vreme odgovara sredini povratnog puta zahteva
+            const rtt = performance.now() - sent;
+            clockOffset = data.server_time + rtt / 2 - Date.now();
+            frame = data;
+            lastWall = Date.now();
+            lastMono = performance.now();
+        });
+}
+
+function localTick() {
+    const wall = Date.now(), mono = performance.now();
+    const skewed = Math.abs((wall - lastWall) - (mono - lastMono)) > SKEW_TOLERANCE_MS;
+    lastWall = wall;
+    lastMono = mono;
+    const t = wall + clockOffset;
+    if (skewed || t >= frame.valid_until) {
+        clearTimeout(tickTimer);
+        syncFrame().then(localTick).catch(startServerUpdates);
+        return;
+    }
+    updateBanner(localReading(t));
+    // Sledeći tick kad se progress promeni (stotinka milidiesa)
+    const step = frame.milidies_ms / 100;
+    tickTimer = setTimeout(localTick, step - ((t - frame.day0) % step + step) % step + 1);
+}
+
+// --- Rezerva: server šalje tick (SSE), ili periodično osvežavanje (svakih 5 sekundi) ---
+let pollTimer = null;
+
+function startPolling() {
+    if (pollTimer !== null) return;
+    fetchTimeAndUpdateBanner();
+    pollTimer = setInterval(fetchTimeAndUpdateBanner, 5000);
+}
+
+function stopPolling() {
+    if (pollTimer === null) return;
+    clearInterval(pollTimer);
+    pollTimer = null;
+}
+
+function startServerUpdates() {
+    if (window.EventSource) {
+        const stream = new EventSource(STREAM_URL);
+        stream.onmessage = event => {
+            stopPolling();
+            updateBanner(JSON.parse(event.data));
+        };
+        // EventSource se sam ponovo povezuje (retry sa servera); u međuvremenu pollujemo
+        stream.onerror = startPolling;
+        fetchTimeAndUpdateBanner();
+    } else {
+        startPolling();
+    }
+}
+
+syncFrame().then(localTick).catch(startServerUpdates);